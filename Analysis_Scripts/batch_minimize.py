@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+
+# Batch minimization of many functions on a process pool
+# Functions come from JSON, JSON-lines or Berkeley PLA files (or a
+# directory of them).  Jobs are submitted one at a time, largest first,
+# so an idle worker always takes the biggest job still waiting and the
+# long jobs never end up last.  Each result is written as a JSON line as
+# soon as it finishes.  Workers stop a job at its timeout, and Ctrl-C
+# cancels everything still queued, leaving the finished lines in place
+# (a job already running is abandoned and its worker exits when it ends).
+
+import argparse
+import json
+import os
+import signal
+import sys
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from boolean_minimizer import NEXT_STATE_FUNCTIONS, minimize, cube_to_binary, cube_minterms, cube_literal_count
+from truth_table import TruthTable, cubes_to_bits
+
+Job = namedtuple('Job', ['name', 'num_vars', 'minterms', 'dont_cares', 'source'])
+
+SUFFIXES = ('.json', '.jsonl', '.pla')
+
+class _JobTimeout(Exception):
+    pass
+
+# Reading functions -----------------------------------------------------------------
+
+def _job(record, source, location):
+    """Job of one function record from source; location ("file:line") names it in errors"""
+    if not isinstance(record, dict):
+        raise ValueError(f"{location}: expected a function object, got {type(record).__name__}")
+    missing = [field for field in ('name', 'num_vars', 'minterms') if field not in record]
+    if missing:
+        raise ValueError(f"{location}: function record lacks {', '.join(missing)}")
+    try:
+        num_vars = int(record['num_vars'])
+        minterms = [int(m) for m in record['minterms']]
+        dont_cares = [int(m) for m in record.get('dont_cares', ())]
+    except (TypeError, ValueError):
+        raise ValueError(f"{location}: num_vars, minterms and dont_cares must be integers") from None
+    if any(not 0 <= m < (1 << num_vars) for m in minterms + dont_cares):
+        raise ValueError(f"{location}: minterm out of range for {num_vars} inputs")
+    return Job(str(record['name']), num_vars, minterms, dont_cares, source)
+
+def _load_json(text, location):
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError as error:
+        raise ValueError(f"{location}: {error}") from None
+
+def _read_json(path):
+    """A list of job objects, or {"num_vars": n, "functions": {name: minterms}, "dont_cares": [...]}"""
+    with open(path) as f:
+        data = _load_json(f.read(), path)
+    if isinstance(data, list):
+        return [_job(record, path, f"{path}:[{index}]") for index, record in enumerate(data)]
+    if not isinstance(data, dict) or 'functions' not in data or 'num_vars' not in data:
+        raise ValueError(f"{path}: expected a list of functions or an object with num_vars and functions")
+    return [_job({'name': name, 'num_vars': data['num_vars'], 'minterms': minterms,
+                  'dont_cares': data.get('dont_cares', [])}, path, f"{path}:{name}")
+            for name, minterms in data['functions'].items()]
+
+def _read_jsonl(path):
+    """One job object {"name", "num_vars", "minterms", "dont_cares"} per line"""
+    jobs = []
+    with open(path) as f:
+        for number, line in enumerate(f, 1):
+            if line.strip():
+                location = f"{path}:{number}"
+                jobs.append(_job(_load_json(line, location), path, location))
+    return jobs
+
+def _read_pla(path):
+    """Berkeley PLA (type fd): output 1 is ON, - is a don't care, 0 and ~ are OFF"""
+    num_inputs = num_outputs = None
+    names = None
+    on, dc = None, None
+    with open(path) as f:
+        for line in f:
+            line = line.split('#', 1)[0].strip()
+            if not line:
+                continue
+            words = line.split()
+            if words[0] == '.i':
+                num_inputs = int(words[1])
+            elif words[0] == '.o':
+                num_outputs = int(words[1])
+            elif words[0] == '.ob':
+                names = words[1:]
+            elif words[0] in ('.e', '.end'):
+                break
+            elif not line.startswith('.'):
+                if on is None:
+                    if num_inputs is None or num_outputs is None:
+                        raise ValueError(f"{path}: cube before .i/.o")
+                    on = [set() for _ in range(num_outputs)]
+                    dc = [set() for _ in range(num_outputs)]
+                inputs, outputs = (words[0], words[1]) if len(words) > 1 else (words[0][:num_inputs], words[0][num_inputs:])
+                if len(inputs) != num_inputs or len(outputs) != num_outputs:
+                    raise ValueError(f"{path}: bad cube {line!r}")
+                value = int(inputs.replace('-', '0'), 2)
+                mask = int(''.join('1' if c == '-' else '0' for c in inputs), 2)
+                minterms = cube_minterms((value, mask))
+                for index, char in enumerate(outputs):
+                    if char == '1':
+                        on[index].update(minterms)
+                    elif char in '-2':
+                        dc[index].update(minterms)
+    if on is None:
+        return []
+    base = os.path.splitext(os.path.basename(path))[0]
+    names = names or [f"{base}[{index}]" for index in range(num_outputs)]
+    return [Job(names[index], num_inputs, sorted(on[index]), sorted(dc[index]), path)
+            for index in range(num_outputs)]
+
+def read_functions(paths, skip=()):
+    """Jobs from files, or from every supported file in a directory
+
+    Files in skip (such as the results file) are left out of directory
+    listings.
+    """
+    skipped = {os.path.realpath(path) for path in skip}
+    jobs = []
+    for path in paths:
+        if os.path.isdir(path):
+            files = [os.path.join(path, name) for name in sorted(os.listdir(path))
+                     if name.endswith(SUFFIXES) and os.path.realpath(os.path.join(path, name)) not in skipped]
+        else:
+            files = [path]
+        for name in files:
+            if name.endswith('.pla'):
+                jobs += _read_pla(name)
+            elif name.endswith('.jsonl'):
+                jobs += _read_jsonl(name)
+            else:
+                jobs += _read_json(name)
+    return jobs
+
+def job_size(job):
+    """Scheduling weight: cubes to merge, times the inputs they span"""
+    return (len(job.minterms) + len(job.dont_cares)) * job.num_vars
+
+# Workers --------------------------------------------------------------------------
+
+def _raise_timeout(signum, frame):
+    raise _JobTimeout()
+
+def _init_worker(use_cache):
+    # Ctrl-C is handled by the parent, which cancels the queue
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    if use_cache:
+        import result_cache
+        result_cache.enable()
+
+def run_job(job, engine='auto', time_budget=2.0, timeout=None):
+    """JSON-ready result record of one minimization"""
+    record = {'name': job.name, 'source': job.source, 'num_vars': job.num_vars}
+    start = time.perf_counter()
+    alarm = timeout and hasattr(signal, 'setitimer')
+    if alarm:
+        previous = signal.signal(signal.SIGALRM, _raise_timeout)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        cover = minimize(job.minterms, num_vars=job.num_vars, time_budget=time_budget,
+                         engine=engine, dont_cares=job.dont_cares)
+    except _JobTimeout:
+        record['status'] = 'timeout'
+        cover = None
+    except Exception as error:
+        record['status'] = 'error'
+        record['error'] = f"{type(error).__name__}: {error}"
+        cover = None
+    finally:
+        if alarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, previous)
+    record['seconds'] = round(time.perf_counter() - start, 4)
+    if cover is not None:
+        # The cover must contain every ON minterm and stay inside ON + don't cares
+        table = TruthTable.from_minterms(job.num_vars, job.minterms, job.dont_cares)
+        bits = cubes_to_bits(job.num_vars, cover)
+        correct = (table.on_bits & ~bits) == 0 and (bits & ~(table.on_bits | table.dc_bits)) == 0
+        record['status'] = 'ok' if correct else 'wrong'
+        record['terms'] = len(cover)
+        record['literals'] = sum(cube_literal_count(cube, job.num_vars) for cube in cover)
+        record['cover'] = [cube_to_binary(cube, job.num_vars).replace('X', '-') for cube in cover]
+    return record
+
+def run_batch(jobs, output, workers=None, engine='auto', time_budget=2.0, timeout=None, use_cache=False):
+    """Minimize every job, writing each record to output as it finishes
+
+    Returns (records, cancelled) where cancelled counts jobs left
+    unfinished by Ctrl-C.
+    """
+    ordered = sorted(jobs, key=job_size, reverse=True)
+    records = []
+
+    def emit(record):
+        records.append(record)
+        output.write(json.dumps(record) + '\n')
+        output.flush()
+
+    if workers == 1:
+        _init_worker(use_cache)
+        signal.signal(signal.SIGINT, signal.default_int_handler)
+        try:
+            for job in ordered:
+                emit(run_job(job, engine, time_budget, timeout))
+        except KeyboardInterrupt:
+            pass
+        return records, len(ordered) - len(records)
+
+    executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(use_cache,))
+    try:
+        # One submission per job keeps the queue shared and in size order
+        futures = [executor.submit(run_job, job, engine, time_budget, timeout) for job in ordered]
+        for future in as_completed(futures):
+            emit(future.result())
+    except KeyboardInterrupt:
+        executor.shutdown(wait=False, cancel_futures=True)
+        return records, len(ordered) - len(records)
+    executor.shutdown()
+    return records, 0
+
+def main():
+    parser = argparse.ArgumentParser(description="Minimize many functions in parallel, streaming JSON-lines results")
+    parser.add_argument('inputs', nargs='*', help="JSON, JSON-lines or PLA files, or directories of them")
+    parser.add_argument('--builtin', action='store_true', help="also minimize the four next-state functions")
+    parser.add_argument('-o', '--output', default='batch_results.jsonl', help="results file, - for stdout")
+    parser.add_argument('--workers', type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument('--engine', choices=['auto', 'exact', 'espresso'], default='auto')
+    parser.add_argument('--time-budget', type=float, default=2.0, help="seconds for the exact cover search")
+    parser.add_argument('--timeout', type=float, default=None, help="seconds before a job is abandoned")
+    parser.add_argument('--cache', action='store_true', help="reuse and store results in the result cache")
+    args = parser.parse_args()
+
+    try:
+        jobs = read_functions(args.inputs, skip=[] if args.output == '-' else [args.output])
+    except (OSError, ValueError) as error:
+        parser.error(str(error))
+    if args.builtin:
+        jobs += [Job(name, 5, minterms, [], 'builtin') for name, minterms in NEXT_STATE_FUNCTIONS.items()]
+    if not jobs:
+        parser.error("no functions to minimize")
+
+    report = sys.stderr if args.output == '-' else sys.stdout
+    print("BATCH MINIMIZATION", file=report)
+    print("=" * 60, file=report)
+    print(f"{len(jobs)} functions, {args.workers or os.cpu_count()} workers, engine {args.engine}", file=report)
+
+    start = time.perf_counter()
+    if args.output == '-':
+        records, cancelled = run_batch(jobs, sys.stdout, args.workers, args.engine, args.time_budget,
+                                       args.timeout, args.cache)
+    else:
+        with open(args.output, 'w') as output:
+            records, cancelled = run_batch(jobs, output, args.workers, args.engine, args.time_budget,
+                                           args.timeout, args.cache)
+    elapsed = time.perf_counter() - start
+
+    statuses = {}
+    for record in records:
+        statuses[record['status']] = statuses.get(record['status'], 0) + 1
+    busy = sum(record['seconds'] for record in records)
+    print(f"Finished {len(records)} in {elapsed:.2f}s ({busy:.2f}s summed over jobs, "
+          f"{busy / elapsed if elapsed else 0:.1f} running on average)", file=report)
+    print("Status: " + ', '.join(f"{status} {count}" for status, count in sorted(statuses.items())), file=report)
+    if cancelled:
+        print(f"Cancelled: {cancelled} jobs unfinished", file=report)
+    if args.output != '-':
+        print(f"Results: {args.output}", file=report)
+    if cancelled:
+        # The shell's status for a run stopped by SIGINT
+        sys.exit(130)
+    if statuses.get('wrong') or statuses.get('error'):
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,465 @@
+#!/usr/bin/env python3
+
+# Reduced Ordered Binary Decision Diagrams for the next-state functions
+# Nodes live in flat arrays and are identified by integer ids (0 = FALSE,
+# 1 = TRUE).  A unique table keeps the diagrams canonical, so two functions
+# are equal exactly when their root ids are equal.
+
+from boolean_minimizer import NEXT_STATE_FUNCTIONS, minimize, cover_to_expression, expression_to_cover
+from truth_table import TruthTable
+
+FALSE = 0
+TRUE = 1
+
+class BDD:
+    """ROBDD manager: unique table, lossy ITE cache and variable sifting
+
+    Variable index 0 is the most significant input, matching the minterm
+    numbering and var_names order used by the other scripts.
+    """
+
+    def __init__(self, num_vars, cache_bits=16):
+        self.num_vars = num_vars
+        # Terminals carry the pseudo-variable num_vars, below every level
+        self._var = [num_vars, num_vars]
+        self._low = [FALSE, TRUE]
+        self._high = [FALSE, TRUE]
+        self._unique = {}
+        self._level = list(range(num_vars)) + [num_vars]
+        self._order = list(range(num_vars))
+        # Direct-mapped computed table: a colliding entry evicts the old one
+        self._cache_mask = (1 << cache_bits) - 1
+        self._cache = [None] * (1 << cache_bits)
+        self.cache_hits = 0
+        self.cache_lookups = 0
+
+    # Node access -----------------------------------------------------------
+
+    def var_of(self, node):
+        return self._var[node]
+
+    def low(self, node):
+        return self._low[node]
+
+    def high(self, node):
+        return self._high[node]
+
+    def level_of(self, node):
+        return self._level[self._var[node]]
+
+    def order(self):
+        """Current variable order, top level first"""
+        return list(self._order)
+
+    def _mk(self, var, low, high):
+        if low == high:
+            return low
+        key = (var, low, high)
+        node = self._unique.get(key)
+        if node is None:
+            node = len(self._var)
+            self._var.append(var)
+            self._low.append(low)
+            self._high.append(high)
+            self._unique[key] = node
+        return node
+
+    def variable(self, index):
+        """BDD of a single input variable"""
+        return self._mk(index, FALSE, TRUE)
+
+    def literal(self, index, polarity):
+        """BDD of a variable or its complement"""
+        return self._mk(index, TRUE, FALSE) if not polarity else self._mk(index, FALSE, TRUE)
+
+    # Operations ------------------------------------------------------------
+
+    def _cofactors(self, node, level):
+        if self._level[self._var[node]] == level:
+            return self._low[node], self._high[node]
+        return node, node
+
+    def ite(self, f, g, h):
+        """If-then-else: (f AND g) OR (NOT f AND h)"""
+        if f == TRUE:
+            return g
+        if f == FALSE:
+            return h
+        if g == h:
+            return g
+        if g == TRUE and h == FALSE:
+            return f
+
+        key = (f, g, h)
+        slot = hash(key) & self._cache_mask
+        self.cache_lookups += 1
+        entry = self._cache[slot]
+        if entry is not None and entry[0] == key:
+            self.cache_hits += 1
+            return entry[1]
+
+        level = min(self.level_of(f), self.level_of(g), self.level_of(h))
+        f0, f1 = self._cofactors(f, level)
+        g0, g1 = self._cofactors(g, level)
+        h0, h1 = self._cofactors(h, level)
+        result = self._mk(self._order[level], self.ite(f0, g0, h0), self.ite(f1, g1, h1))
+        self._cache[slot] = (key, result)
+        return result
+
+    def apply_not(self, f):
+        return self.ite(f, FALSE, TRUE)
+
+    def apply_and(self, f, g):
+        return self.ite(f, g, FALSE)
+
+    def apply_or(self, f, g):
+        return self.ite(f, TRUE, g)
+
+    def apply_xor(self, f, g):
+        return self.ite(f, self.apply_not(g), g)
+
+    def cofactor(self, f, index, value):
+        """Restrict input `index` to a constant"""
+        memo = {}
+        target = self._level[index]
+
+        def walk(node):
+            level = self.level_of(node)
+            if level > target:
+                return node
+            if node in memo:
+                return memo[node]
+            if level == target:
+                result = self._high[node] if value else self._low[node]
+            else:
+                result = self._mk(self._var[node], walk(self._low[node]), walk(self._high[node]))
+            memo[node] = result
+            return result
+        return walk(f)
+
+    def restrict(self, f, care):
+        """Coudert-Madre restrict: a small BDD equal to f wherever care is 1
+
+        Points outside the care set are don't cares, which the operator uses
+        to merge or drop nodes of f.
+        """
+        memo = {}
+
+        def walk(f, c):
+            if c == TRUE or f <= TRUE:
+                return f
+            if c == FALSE:
+                return FALSE
+            key = (f, c)
+            if key in memo:
+                return memo[key]
+            f_level, c_level = self.level_of(f), self.level_of(c)
+            if c_level < f_level:
+                # f does not depend on c's top variable: quantify it out of c
+                result = walk(f, self.apply_or(self._low[c], self._high[c]))
+            else:
+                c0, c1 = self._cofactors(c, f_level)
+                if c0 == FALSE:
+                    result = walk(self._high[f], c1)
+                elif c1 == FALSE:
+                    result = walk(self._low[f], c0)
+                else:
+                    result = self._mk(self._var[f], walk(self._low[f], c0), walk(self._high[f], c1))
+            memo[key] = result
+            return result
+        return walk(f, care)
+
+    def exists(self, f, indices):
+        """Existential quantification: OR of the cofactors over every given input"""
+        levels = {self._level[i] for i in indices}
+        bottom = max(levels, default=-1)
+        memo = {}
+
+        def walk(node):
+            level = self.level_of(node)
+            if level > bottom:
+                return node
+            if node in memo:
+                return memo[node]
+            low, high = walk(self._low[node]), walk(self._high[node])
+            if level in levels:
+                result = self.apply_or(low, high)
+            else:
+                result = self._mk(self._var[node], low, high)
+            memo[node] = result
+            return result
+        return walk(f)
+
+    def forall(self, f, indices):
+        """Universal quantification over the given inputs"""
+        return self.apply_not(self.exists(self.apply_not(f), indices))
+
+    def and_exists(self, f, g, indices):
+        """Relational product: exists(f AND g) without building f AND g"""
+        levels = {self._level[i] for i in indices}
+        memo = {}
+
+        def walk(f, g):
+            if f == FALSE or g == FALSE:
+                return FALSE
+            if f == TRUE and g == TRUE:
+                return TRUE
+            if f == TRUE or g == TRUE or f == g:
+                return self.exists(g if f == TRUE else f, indices)
+            key = (f, g) if f < g else (g, f)
+            if key in memo:
+                return memo[key]
+            level = min(self.level_of(f), self.level_of(g))
+            f0, f1 = self._cofactors(f, level)
+            g0, g1 = self._cofactors(g, level)
+            low = walk(f0, g0)
+            if level in levels and low == TRUE:
+                result = TRUE
+            elif level in levels:
+                result = self.apply_or(low, walk(f1, g1))
+            else:
+                result = self._mk(self._order[level], low, walk(f1, g1))
+            memo[key] = result
+            return result
+        return walk(f, g)
+
+    def compose(self, f, substitution):
+        """Replace inputs by functions: substitution maps index -> BDD"""
+        memo = {}
+
+        def walk(node):
+            if node <= TRUE:
+                return node
+            if node in memo:
+                return memo[node]
+            var = self._var[node]
+            low, high = walk(self._low[node]), walk(self._high[node])
+            if var in substitution:
+                result = self.ite(substitution[var], high, low)
+            else:
+                result = self.ite(self.variable(var), high, low)
+            memo[node] = result
+            return result
+        return walk(f)
+
+    def rename(self, f, mapping):
+        """Substitute variables for variables: mapping maps index -> index"""
+        return self.compose(f, {old: self.variable(new) for old, new in mapping.items()})
+
+    # Construction ----------------------------------------------------------
+
+    def from_cube(self, cube):
+        """BDD of a (value, mask) product term"""
+        value, mask = cube
+        node = TRUE
+        # Build bottom-up so every AND only touches one new level
+        for index in sorted(range(self.num_vars), key=lambda i: -self._level[i]):
+            position = self.num_vars - 1 - index
+            if not (mask >> position) & 1:
+                node = self.apply_and(self.literal(index, (value >> position) & 1), node)
+        return node
+
+    def from_cubes(self, cubes):
+        """BDD of a sum of (value, mask) cubes, e.g. a minimized cover"""
+        node = FALSE
+        for cube in cubes:
+            node = self.apply_or(node, self.from_cube(cube))
+        return node
+
+    def from_minterms(self, minterms):
+        """BDD of a minterm list"""
+        return self.from_cubes((m, 0) for m in minterms)
+
+    def from_expression(self, expression, var_names):
+        """BDD of a sum-of-products string as printed by the minimizer"""
+        return self.from_cubes(expression_to_cover(expression, var_names))
+
+    def from_truth_table(self, table):
+        """BDD of a packed TruthTable by Shannon expansion in the current order"""
+        memo = {}
+
+        def build(level, sub_table, indices):
+            if sub_table.on_bits == 0:
+                return FALSE
+            if sub_table.on_bits == sub_table.full:
+                return TRUE
+            key = (level, sub_table.on_bits)
+            if key in memo:
+                return memo[key]
+            var = self._order[level]
+            position = indices.index(var)
+            rest = indices[:position] + indices[position + 1:]
+            low = build(level + 1, sub_table.cofactor(position, 0), rest)
+            high = build(level + 1, sub_table.cofactor(position, 1), rest)
+            memo[key] = self._mk(var, low, high)
+            return memo[key]
+        return build(0, TruthTable(table.num_vars, table.on_bits), list(range(self.num_vars)))
+
+    # Queries ---------------------------------------------------------------
+
+    def equivalent(self, f, g):
+        """Canonical form makes equivalence a constant-time id comparison"""
+        return f == g
+
+    def evaluate(self, f, minterm):
+        """Value of f at a minterm"""
+        node = f
+        while node > TRUE:
+            position = self.num_vars - 1 - self._var[node]
+            node = self._high[node] if (minterm >> position) & 1 else self._low[node]
+        return node
+
+    def sat_count(self, f):
+        """Number of satisfying minterms over all num_vars inputs"""
+        memo = {FALSE: 0, TRUE: 1}
+
+        def count(node):
+            if node in memo:
+                return memo[node]
+            level = self.level_of(node)
+            low, high = self._low[node], self._high[node]
+            total = (count(low) << (self.level_of(low) - level - 1)) + \
+                    (count(high) << (self.level_of(high) - level - 1))
+            memo[node] = total
+            return total
+        return count(f) << self.level_of(f)
+
+    def any_sat(self, f):
+        """One (value, mask) cube on which f is 1, None if f is FALSE"""
+        if f == FALSE:
+            return None
+        full = (1 << self.num_vars) - 1
+        value, fixed = 0, 0
+        node = f
+        while node > TRUE:
+            bit = 1 << (self.num_vars - 1 - self._var[node])
+            fixed |= bit
+            if self._low[node] != FALSE:
+                node = self._low[node]
+            else:
+                value |= bit
+                node = self._high[node]
+        return value, full & ~fixed
+
+    def node_count(self, roots):
+        """Number of internal nodes reachable from the given roots"""
+        seen = set()
+        stack = [r for r in roots if r > TRUE]
+        while stack:
+            node = stack.pop()
+            if node in seen:
+                continue
+            seen.add(node)
+            for child in (self._low[node], self._high[node]):
+                if child > TRUE and child not in seen:
+                    stack.append(child)
+        return len(seen)
+
+    def to_cubes(self, f):
+        """Disjoint cube cover of f, one cube per path to TRUE"""
+        full = (1 << self.num_vars) - 1
+        cubes = []
+
+        def walk(node, value, fixed):
+            if node == FALSE:
+                return
+            if node == TRUE:
+                cubes.append((value, full & ~fixed))
+                return
+            bit = 1 << (self.num_vars - 1 - self._var[node])
+            walk(self._low[node], value, fixed | bit)
+            walk(self._high[node], value | bit, fixed | bit)
+        walk(f, 0, 0)
+        return cubes
+
+    # Reordering ------------------------------------------------------------
+
+    def swap_levels(self, level):
+        """Swap the variables at `level` and `level + 1` in place
+
+        Node ids keep denoting the same functions, so roots held by callers
+        stay valid across reordering.
+        """
+        x, y = self._order[level], self._order[level + 1]
+        x_nodes = [n for n in range(2, len(self._var)) if self._var[n] == x]
+        self._order[level], self._order[level + 1] = y, x
+        self._level[x], self._level[y] = level + 1, level
+        for node in x_nodes:
+            f0, f1 = self._low[node], self._high[node]
+            if self._var[f0] != y and self._var[f1] != y:
+                continue  # Independent of y: node just moves down a level
+            f00, f01 = (self._low[f0], self._high[f0]) if self._var[f0] == y else (f0, f0)
+            f10, f11 = (self._low[f1], self._high[f1]) if self._var[f1] == y else (f1, f1)
+            del self._unique[(x, f0, f1)]
+            g0 = self._mk(x, f00, f10)
+            g1 = self._mk(x, f01, f11)
+            self._var[node], self._low[node], self._high[node] = y, g0, g1
+            self._unique[(y, g0, g1)] = node
+        self._cache = [None] * len(self._cache)
+
+    def sift(self, roots, max_growth=1.2):
+        """Rudell sifting: move each variable to the level minimizing node count"""
+        size = self.node_count(roots)
+        counts = {}
+        stack = [r for r in roots if r > TRUE]
+        seen = set()
+        while stack:
+            node = stack.pop()
+            if node in seen:
+                continue
+            seen.add(node)
+            counts[self._var[node]] = counts.get(self._var[node], 0) + 1
+            stack.extend(c for c in (self._low[node], self._high[node]) if c > TRUE)
+
+        for var in sorted(range(self.num_vars), key=lambda v: -counts.get(v, 0)):
+            best_size, best_level = size, self._level[var]
+            # Sift down to the bottom, then up to the top
+            while self._level[var] < self.num_vars - 1:
+                self.swap_levels(self._level[var])
+                size = self.node_count(roots)
+                if size < best_size:
+                    best_size, best_level = size, self._level[var]
+                if size > max_growth * best_size:
+                    break
+            while self._level[var] > 0:
+                self.swap_levels(self._level[var] - 1)
+                size = self.node_count(roots)
+                if size < best_size:
+                    best_size, best_level = size, self._level[var]
+                if size > max_growth * best_size and self._level[var] < best_level:
+                    break
+            # Return to the best position found
+            while self._level[var] < best_level:
+                self.swap_levels(self._level[var])
+            while self._level[var] > best_level:
+                self.swap_levels(self._level[var] - 1)
+            size = best_size
+        return size
+
+def main():
+    var_names = ['M1', 'M0', 'C1', 'C0', 'D']
+    manager = BDD(5)
+
+    print("ROBDD ANALYSIS OF NEXT-STATE FUNCTIONS")
+    print("=" * 60)
+    roots = {}
+    for name, minterms in NEXT_STATE_FUNCTIONS.items():
+        original = manager.from_minterms(minterms)
+        cover = minimize(minterms)
+        optimized = manager.from_expression(cover_to_expression(cover), var_names)
+        roots[name] = original
+        status = "EQUIVALENT" if manager.equivalent(original, optimized) else "MISMATCH"
+        print(f"\n{name}:")
+        print(f"  Nodes: {manager.node_count([original])}")
+        print(f"  Satisfying minterms: {manager.sat_count(original)} (expected {len(minterms)})")
+        print(f"  Minimized SOP vs original minterms: {status}")
+
+    shared_before = manager.node_count(roots.values())
+    shared_after = manager.sift(list(roots.values()))
+    order = ' < '.join(var_names[v] for v in manager.order())
+    print(f"\nShared BDD nodes for all outputs: {shared_before}")
+    print(f"After sifting: {shared_after} (order {order})")
+    print(f"ITE cache hit rate: {manager.cache_hits / max(manager.cache_lookups, 1) * 100:.1f}%")
+
+if __name__ == "__main__":
+    main()
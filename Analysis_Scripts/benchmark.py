@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+
+# Benchmark suite for the minimization and truth-table paths
+# Cases are seeded random functions (minterm lists at 4-12 inputs, and
+# unions of split cubes at 14-20 inputs, where only the cube-based
+# Espresso engine is practical), the four NEXT_STATE_FUNCTIONS, the
+# generalized puzzle encodings and the report entry points.  Every case
+# records best-of-N wall time, tracemalloc peak and result size (terms and
+# literals) per engine, and can be compared against a stored JSON baseline
+# to flag regressions.
+
+import argparse
+import contextlib
+import gc
+import io
+import json
+import os
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from collections import namedtuple
+
+import boolean_minimizer
+from boolean_minimizer import (NEXT_STATE_FUNCTIONS, minimize, espresso, cube_literal_count,
+                               illegal_puzzle_inputs, quine_mccluskey_simplified, analyze_minimization_potential)
+from logic_analysis import generate_truth_table
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), 'benchmark_baseline.json')
+BASELINE_VERSION = 1
+
+# Exact minimization is only benchmarked up to this many inputs
+EXACT_LIMIT = 12
+DENSITIES = (0.1, 0.3)
+# Dense random functions often run the exact cover into its time budget
+FULL_DENSITIES = (0.1, 0.3, 0.5)
+# Differences smaller than these are timer or allocator noise, not regressions
+MIN_TIME_DELTA = 0.005
+MIN_MEMORY_DELTA = 64 * 1024
+
+Case = namedtuple('Case', ['name', 'num_vars', 'form', 'functions'])
+Measurement = namedtuple('Measurement', ['case', 'engine', 'seconds', 'peak_bytes', 'terms', 'literals'])
+
+# Cases ------------------------------------------------------------------------------
+
+def random_minterm_case(num_vars, density, seed=0):
+    """Uniform random ON set with a tenth of the remaining inputs as don't cares"""
+    name = f"random-n{num_vars}-d{density}"
+    rng = random.Random(f"{seed}:{name}")
+    size = 1 << num_vars
+    on = rng.sample(range(size), max(1, int(size * density)))
+    rest = sorted(set(range(size)) - set(on))
+    dont_cares = rng.sample(rest, len(rest) // 10)
+    return Case(name, num_vars, 'minterms', [(sorted(on), sorted(dont_cares))])
+
+def random_cube_case(num_vars, free, cubes=24, split=2, seed=0):
+    """Union of random cubes with `free` eliminated variables, each handed
+    to the minimizer split into 2^split smaller cubes"""
+    name = f"cubes-n{num_vars}-f{free}"
+    rng = random.Random(f"{seed}:{name}")
+    on = []
+    for _ in range(cubes):
+        positions = rng.sample(range(num_vars), free)
+        mask = sum(1 << position for position in positions)
+        value = rng.getrandbits(num_vars) & ~mask
+        # Re-bind `split` of the free variables in every combination
+        bound = positions[:split]
+        for combination in range(1 << split):
+            part_value, part_mask = value, mask
+            for index, position in enumerate(bound):
+                part_mask &= ~(1 << position)
+                if (combination >> index) & 1:
+                    part_value |= 1 << position
+            on.append((part_value, part_mask))
+    return Case(name, num_vars, 'cubes', [(on, [])])
+
+def next_state_case(dont_cares=False):
+    dc = illegal_puzzle_inputs() if dont_cares else []
+    name = "next-state-dc" if dont_cares else "next-state"
+    return Case(name, 5, 'minterms', [(minterms, dc) for minterms in NEXT_STATE_FUNCTIONS.values()])
+
+def puzzle_case(missionaries, cannibals, capacity):
+    from puzzle_solver import Puzzle
+    puzzle = Puzzle(missionaries, cannibals, capacity)
+    spec = puzzle.next_state_functions(puzzle.solve())
+    return Case(f"puzzle-{missionaries}-{cannibals}-{capacity}", spec.num_vars, 'minterms',
+                [(minterms, spec.dont_cares) for minterms in spec.functions.values()])
+
+def report_cases():
+    """The printing entry points, with their output discarded"""
+    return [
+        Case('report-generate_truth_table', 5, 'table', generate_truth_table),
+        Case('report-quine_mccluskey_simplified', 5, 'report',
+             lambda: [quine_mccluskey_simplified(minterms) for minterms in NEXT_STATE_FUNCTIONS.values()]),
+        Case('report-analyze_minimization_potential', 5, 'report',
+             lambda: [analyze_minimization_potential(minterms, name)
+                      for name, minterms in NEXT_STATE_FUNCTIONS.items()]),
+    ]
+
+def build_cases(full=False, seed=0):
+    cases = [next_state_case(), next_state_case(dont_cares=True)]
+    cases += [puzzle_case(3, 3, 2), puzzle_case(5, 5, 3), puzzle_case(10, 10, 4)]
+    if full:
+        cases += [puzzle_case(30, 30, 4), puzzle_case(100, 100, 10)]
+    for num_vars in (4, 6, 8, 10, 12) if full else (4, 6, 8, 10):
+        cases += [random_minterm_case(num_vars, density, seed) for density in (FULL_DENSITIES if full else DENSITIES)]
+    for num_vars in (14, 16, 18, 20) if full else (14, 16):
+        cases += [random_cube_case(num_vars, free, seed=seed) for free in (num_vars // 4, num_vars // 2, 3 * num_vars // 4)]
+    return cases + report_cases()
+
+def engines_for(case):
+    if case.form in ('report', 'table'):
+        return ['report']
+    if case.form == 'cubes' or case.num_vars > EXACT_LIMIT:
+        return ['espresso']
+    return ['exact', 'espresso']
+
+# Measuring ----------------------------------------------------------------------------
+
+def _runner(case, engine):
+    """Callable returning the covers of a case (truth-table rows for 'table')"""
+    if case.form in ('report', 'table'):
+        def run():
+            with contextlib.redirect_stdout(io.StringIO()):
+                return case.functions()
+        return run
+    if case.form == 'cubes':
+        return lambda: [espresso(on, case.num_vars, dc) for on, dc in case.functions]
+    return lambda: [minimize(on, num_vars=case.num_vars, engine=engine, dont_cares=dc)
+                    for on, dc in case.functions]
+
+def measure(case, engine, repeats=3):
+    """Best-of-repeats wall time, then one traced run for the memory peak"""
+    run = _runner(case, engine)
+    best = float('inf')
+    # As in timeit, collector pauses would only add noise to the timings
+    collecting = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeats):
+            start = time.perf_counter()
+            results = run()
+            best = min(best, time.perf_counter() - start)
+    finally:
+        if collecting:
+            gc.enable()
+    tracemalloc.start()
+    try:
+        run()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    if case.form == 'table':
+        terms, literals = len(results), None
+    else:
+        cubes = [cube for cover in results for cube in cover]
+        terms = len(cubes)
+        literals = sum(cube_literal_count(cube, case.num_vars) for cube in cubes)
+    return Measurement(case.name, engine, best, peak, terms, literals)
+
+# Baselines -----------------------------------------------------------------------------
+
+def _key(measurement):
+    return f"{measurement.case}|{measurement.engine}"
+
+def save_baseline(measurements, path=BASELINE_PATH):
+    data = {
+        'version': BASELINE_VERSION,
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'results': {_key(m): {'seconds': round(m.seconds, 6), 'peak_bytes': m.peak_bytes,
+                              'terms': m.terms, 'literals': m.literals} for m in measurements},
+    }
+    with open(path, 'w') as f:
+        json.dump(data, f, indent=1, sort_keys=True)
+        f.write('\n')
+
+def load_baseline(path=BASELINE_PATH):
+    with open(path) as f:
+        data = json.load(f)
+    if data.get('version') != BASELINE_VERSION:
+        raise ValueError(f"{path}: baseline version {data.get('version')}, expected {BASELINE_VERSION}")
+    return data['results']
+
+def regressions(measurements, baseline, tolerance=0.25):
+    """{key: [reasons]} for measurements worse than the baseline
+
+    Time and memory must exceed the baseline by the tolerance fraction and
+    by an absolute noise floor; any growth in terms or literals counts.
+    """
+    found = {}
+    for m in measurements:
+        base = baseline.get(_key(m))
+        if base is None:
+            continue
+        reasons = []
+        if m.seconds > base['seconds'] * (1 + tolerance) and m.seconds - base['seconds'] > MIN_TIME_DELTA:
+            reasons.append(f"time {base['seconds'] * 1000:.1f} -> {m.seconds * 1000:.1f} ms")
+        if (m.peak_bytes > base['peak_bytes'] * (1 + tolerance)
+                and m.peak_bytes - base['peak_bytes'] > MIN_MEMORY_DELTA):
+            reasons.append(f"peak {base['peak_bytes'] // 1024} -> {m.peak_bytes // 1024} KiB")
+        if m.terms > base['terms']:
+            reasons.append(f"terms {base['terms']} -> {m.terms}")
+        elif m.literals is not None and base['literals'] is not None and m.literals > base['literals']:
+            reasons.append(f"literals {base['literals']} -> {m.literals}")
+        if reasons:
+            found[_key(m)] = reasons
+    return found
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark minimization engines and report paths")
+    parser.add_argument('--full', action='store_true', help="add dense and 12-20 input functions and the larger puzzles")
+    parser.add_argument('--repeats', type=int, default=3, help="timed runs per case (best is kept)")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--filter', help="only cases whose name contains this text")
+    parser.add_argument('--baseline', default=BASELINE_PATH)
+    parser.add_argument('--save-baseline', action='store_true', help="store these results as the new baseline")
+    parser.add_argument('--tolerance', type=float, default=0.25, help="allowed slowdown/growth fraction")
+    args = parser.parse_args()
+
+    # Cached results would measure the disk, not the minimizer
+    boolean_minimizer.RESULT_CACHE = None
+    cases = [case for case in build_cases(args.full, args.seed) if not args.filter or args.filter in case.name]
+    baseline = load_baseline(args.baseline) if os.path.exists(args.baseline) and not args.save_baseline else None
+
+    print("MINIMIZATION BENCHMARKS")
+    print("=" * 60)
+    print(f"Python {platform.python_version()}, best of {args.repeats}, seed {args.seed}")
+    print(f"\n{'Case':<38} {'Engine':<9} {'ms':>9} {'peak KiB':>9} {'terms':>6} {'lits':>6}")
+    print("-" * 82)
+    measurements = []
+    for case in cases:
+        for engine in engines_for(case):
+            m = measure(case, engine, args.repeats)
+            measurements.append(m)
+            literals = '' if m.literals is None else m.literals
+            print(f"{case.name:<38} {engine:<9} {m.seconds * 1000:>9.2f} {m.peak_bytes // 1024:>9} "
+                  f"{m.terms:>6} {literals:>6}")
+            sys.stdout.flush()
+
+    # Engine comparison on the cases both engines ran
+    by_case = {}
+    for m in measurements:
+        by_case.setdefault(m.case, {})[m.engine] = m
+    shared = [engines for engines in by_case.values() if 'exact' in engines and 'espresso' in engines]
+    if shared:
+        exact_time = sum(e['exact'].seconds for e in shared)
+        espresso_time = sum(e['espresso'].seconds for e in shared)
+        exact_terms = sum(e['exact'].terms for e in shared)
+        espresso_terms = sum(e['espresso'].terms for e in shared)
+        print(f"\nExact vs Espresso over {len(shared)} cases: {exact_time * 1000:.0f} vs {espresso_time * 1000:.0f} ms, "
+              f"{exact_terms} vs {espresso_terms} terms")
+
+    if args.save_baseline:
+        save_baseline(measurements, args.baseline)
+        print(f"\nBaseline saved: {args.baseline}")
+    elif baseline is None:
+        print(f"\nNo baseline at {args.baseline} (use --save-baseline)")
+    else:
+        found = regressions(measurements, baseline, args.tolerance)
+        print(f"\nRegressions against {args.baseline} (tolerance {args.tolerance:.0%}): {len(found) or 'none'}")
+        for key, reasons in found.items():
+            print(f"  {key}: {', '.join(reasons)}")
+        if found:
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
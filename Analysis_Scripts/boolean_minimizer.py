@@ -3,7 +3,22 @@
 # Automated Boolean Function Minimization
 # For Missionary-Cannibal Logic Design Project
 
-from itertools import combinations
+import argparse
+import time
+
+from truth_table import TruthTable, as_truth_table
+
+# Original functions
+NEXT_STATE_FUNCTIONS = {
+    "MISSIONARY_NEXT[1]": [0,1,3,6,8,9,10,11,12,13,14,15,16,17,18,19,20,22,23,24,25,26,28,29,30,31],
+    "MISSIONARY_NEXT[0]": [0,1,3,6,8,9,11,12,13,14,15,16,17,18,19,20,22,23,24,25,26,27,28,29,30,31],
+    "CANNIBAL_NEXT[1]": [0,1,2,3,4,6,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,25,26,28,30],
+    "CANNIBAL_NEXT[0]": [0,1,3,4,6,7,8,9,11,12,13,14,15,16,17,18,19,20,22,23,24,25,27,28,30,31]
+}
+
+# Optional result_cache.ResultCache consulted by minimize() and
+# find_prime_implicants(); None recomputes everything
+RESULT_CACHE = None
 
 def find_adjacent_minterms(m1, m2):
     """Check if two minterms differ by exactly one bit"""
@@ -11,14 +26,47 @@ def find_adjacent_minterms(m1, m2):
     return diff != 0 and (diff & (diff - 1)) == 0
 
 def combine_minterms(m1, m2):
-    """Combine two adjacent minterms, return combined term with don't care"""
+    """Combine two adjacent minterms into a (value, mask) cube"""
     diff = m1 ^ m2
-    return m1 & ~diff  # Set differing bit to don't care (0 in mask)
+    return (m1 & ~diff, diff)  # Differing bit becomes don't care (1 in mask)
 
 def minterm_to_binary(minterm, bits=5):
     """Convert minterm to binary string"""
     return format(minterm, f'0{bits}b')
 
+def cube_to_binary(cube, bits=5):
+    """Convert a (value, mask) cube to a binary string with X for don't cares"""
+    value, mask = cube
+    chars = []
+    for position in range(bits - 1, -1, -1):
+        if (mask >> position) & 1:
+            chars.append('X')
+        else:
+            chars.append('1' if (value >> position) & 1 else '0')
+    return ''.join(chars)
+
+def cube_covers(cube, minterm):
+    """Check if a (value, mask) cube contains the given minterm"""
+    value, mask = cube
+    return (minterm & ~mask) == value
+
+def cube_minterms(cube):
+    """List every minterm contained in a (value, mask) cube"""
+    value, mask = cube
+    free_bits = [1 << i for i in range(mask.bit_length()) if (mask >> i) & 1]
+    minterms = []
+    for combination in range(1 << len(free_bits)):
+        minterm = value
+        for i, bit in enumerate(free_bits):
+            if (combination >> i) & 1:
+                minterm |= bit
+        minterms.append(minterm)
+    return minterms
+
+def cube_literal_count(cube, num_vars):
+    """Number of literals in the product term of a cube"""
+    return num_vars - cube[1].bit_count()
+
 def binary_to_expression(binary_str, var_names=['M1', 'M0', 'C1', 'C0', 'D']):
     """Convert binary string to Boolean expression"""
     terms = []
@@ -30,8 +78,60 @@ def binary_to_expression(binary_str, var_names=['M1', 'M0', 'C1', 'C0', 'D']):
         # 'X' means don't care, so skip
     return ''.join(terms) if terms else '1'
 
-def quine_mccluskey_simplified(minterms):
-    """Simplified Quine-McCluskey algorithm for Boolean minimization"""
+def find_prime_implicants(minterms, num_vars=5, dont_cares=()):
+    """Cube-based Quine-McCluskey: return all prime implicants as (value, mask) cubes
+
+    Implicants are kept as (value, mask) pairs, where a 1 in the mask marks an
+    eliminated variable and the value holds 0 in those positions.  Each round
+    buckets the implicants by (mask, number of ones) and only looks for
+    partners in the neighbouring popcount bucket with the same mask, using a
+    hash lookup per free variable instead of comparing every pair of terms.
+    Don't cares take part in merging, but primes made only of don't cares
+    are dropped.
+    """
+    if RESULT_CACHE is not None:
+        return RESULT_CACHE.memoize('primes', num_vars, minterms, dont_cares,
+                                    lambda: _prime_implicants(minterms, num_vars, dont_cares))
+    return _prime_implicants(minterms, num_vars, dont_cares)
+
+def _prime_implicants(minterms, num_vars, dont_cares):
+    full = (1 << num_vars) - 1
+    # Each implicant maps to whether it holds at least one ON-set minterm;
+    # a minterm listed in both sets is a don't care
+    current = {(m, 0): True for m in minterms}
+    current.update({(m, 0): False for m in dont_cares})
+    primes = []
+
+    while current:
+        buckets = {}
+        for (value, mask), has_on in current.items():
+            buckets.setdefault((mask, value.bit_count()), {})[value] = has_on
+
+        combined = {}
+        merged = set()
+        for (mask, ones), values in buckets.items():
+            upper = buckets.get((mask, ones + 1))
+            if not upper:
+                continue
+            for value, has_on in values.items():
+                free = full & ~(value | mask)
+                while free:
+                    bit = free & -free
+                    free ^= bit
+                    partner = upper.get(value | bit)
+                    if partner is not None:
+                        key = (value, mask | bit)
+                        combined[key] = combined.get(key, False) or has_on or partner
+                        merged.add((value, mask))
+                        merged.add((value | bit, mask))
+
+        primes.extend(term for term, has_on in current.items() if has_on and term not in merged)
+        current = combined
+
+    return sorted(primes, key=lambda cube: (-cube[1].bit_count(), cube))
+
+def quine_mccluskey_simplified(minterms, num_vars=5, dont_cares=()):
+    """Quine-McCluskey minimization report, returns the prime implicants"""
     print(f"\nQuine-McCluskey Minimization:")
     print(f"Starting minterms: {sorted(minterms)}")
     
@@ -48,43 +148,629 @@ def quine_mccluskey_simplified(minterms):
         print(f"  Group {count}: {groups[count]}")
     
     # Step 2: Find prime implicants
-    current_terms = set(minterms)
-    prime_implicants = []
-    iteration = 0
-    
-    while current_terms:
-        iteration += 1
-        print(f"\nIteration {iteration}:")
-        
-        new_terms = set()
-        used_terms = set()
-        
-        # Try to combine terms
-        terms_list = list(current_terms)
-        for i in range(len(terms_list)):
-            for j in range(i + 1, len(terms_list)):
-                m1, m2 = terms_list[i], terms_list[j]
-                if find_adjacent_minterms(m1, m2):
-                    combined = combine_minterms(m1, m2)
-                    new_terms.add(combined)
-                    used_terms.add(m1)
-                    used_terms.add(m2)
-        
-        # Add unused terms as prime implicants
-        for term in current_terms:
-            if term not in used_terms:
-                prime_implicants.append(term)
-        
-        current_terms = new_terms
-        print(f"  New combined terms: {list(new_terms)}")
-        print(f"  Prime implicants found: {len([t for t in current_terms if t not in used_terms])}")
-        
-        # Safety check to prevent infinite loops
-        if iteration > 10:
-            break
+    prime_implicants = find_prime_implicants(minterms, num_vars, dont_cares)
+    
+    print(f"\nPrime implicants found: {len(prime_implicants)}")
+    for cube in prime_implicants:
+        binary = cube_to_binary(cube, num_vars)
+        print(f"  {binary}  {binary_to_expression(binary)}")
     
     return prime_implicants
 
+# Row/column dominance is quadratic in the chart size, so very large charts
+# go straight to branch-and-bound (which falls back to greedy on timeout)
+DOMINANCE_LIMIT = 4_000_000
+
+class _CoverTimeout(Exception):
+    """Raised inside the branch-and-bound search when the time budget runs out"""
+
+def _set_bits(bits):
+    """Yield the indices of the set bits of an integer"""
+    while bits:
+        low = bits & -bits
+        yield low.bit_length() - 1
+        bits ^= low
+
+def _chart_rows(columns, uncovered, active):
+    """Build the chart rows: for each uncovered row, the bitset of active columns covering it"""
+    rows = {}
+    for col in active:
+        for row in _set_bits(columns[col] & uncovered):
+            rows[row] = rows.get(row, 0) | (1 << col)
+    return rows
+
+def _greedy_cover(columns, costs, uncovered, active):
+    """Pick columns by best newly-covered-rows per cost until every row is covered"""
+    chosen = []
+    while uncovered:
+        best = max(active, key=lambda col: ((columns[col] & uncovered).bit_count() / costs[col], -col))
+        if not columns[best] & uncovered:
+            raise ValueError("Rows cannot be covered by the given columns")
+        chosen.append(best)
+        uncovered &= ~columns[best]
+    return chosen
+
+def _independent_rows_bound(rows, costs):
+    """Lower bound: rows sharing no column each need a different column"""
+    bound = 0
+    used = 0
+    for row in sorted(rows, key=lambda r: r.bit_count()):
+        if row & used == 0:
+            bound += min(costs[col] for col in _set_bits(row))
+            used |= row
+    return bound
+
+def _reduce_chart(columns, costs, uncovered, active):
+    """Apply essential columns, row dominance and column dominance until stable"""
+    chosen = []
+    changed = True
+    while changed and uncovered:
+        changed = False
+        rows = _chart_rows(columns, uncovered, active)
+
+        # Essential columns: the only column covering some row
+        for row_cols in rows.values():
+            if row_cols.bit_count() == 1:
+                col = row_cols.bit_length() - 1
+                if col in active:
+                    chosen.append(col)
+                    active.discard(col)
+                    uncovered &= ~columns[col]
+                    changed = True
+        if changed or len(rows) * len(active) > DOMINANCE_LIMIT:
+            continue
+
+        # Row dominance: a row whose columns include another row's columns is
+        # covered automatically and can be dropped
+        ordered = sorted(rows.items(), key=lambda item: item[1].bit_count())
+        kept = []
+        for row, row_cols in ordered:
+            if any(other & ~row_cols == 0 for other in kept):
+                uncovered &= ~(1 << row)
+                changed = True
+            else:
+                kept.append(row_cols)
+
+        # Column dominance: drop a column whose rows are a subset of a
+        # cheaper (or equal cost) column's rows
+        for col in sorted(active, key=lambda c: (-costs[c], -c)):
+            rows_covered = columns[col] & uncovered
+            for other in active:
+                if other != col and costs[other] <= costs[col] and rows_covered & ~columns[other] == 0:
+                    active.discard(col)
+                    changed = True
+                    break
+    return chosen, uncovered
+
+def solve_cover(columns, costs, time_budget=2.0):
+    """Minimum-cost set cover of a chart given as per-column row bitsets
+
+    Returns (chosen column indices, optimal flag).  Essential columns and
+    row/column dominance shrink the chart first, then a branch-and-bound
+    search with an independent-row lower bound finds the exact cover.  If
+    the time budget runs out the best cover found so far (at worst the
+    greedy one) is returned with optimal=False.
+    """
+    uncovered = 0
+    for col_rows in columns:
+        uncovered |= col_rows
+    active = set(range(len(columns)))
+
+    chosen, uncovered = _reduce_chart(columns, costs, uncovered, active)
+    if not uncovered:
+        return sorted(chosen), True
+
+    greedy = _greedy_cover(columns, costs, uncovered, active)
+    best = {'cost': sum(costs[c] for c in greedy), 'cols': greedy}
+    deadline = time.perf_counter() + time_budget
+
+    def search(rows, cost, picked):
+        if time.perf_counter() > deadline:
+            raise _CoverTimeout
+        if not rows:
+            if cost < best['cost']:
+                best['cost'] = cost
+                best['cols'] = list(picked)
+            return
+        if cost + _independent_rows_bound(rows, costs) >= best['cost']:
+            return
+        branch_row = min(rows, key=lambda r: r.bit_count())
+        for col in sorted(_set_bits(branch_row), key=lambda c: costs[c]):
+            picked.append(col)
+            search([r for r in rows if not (r >> col) & 1], cost + costs[col], picked)
+            picked.pop()
+
+    optimal = True
+    try:
+        search(list(_chart_rows(columns, uncovered, active).values()), 0, [])
+    except _CoverTimeout:
+        optimal = False
+    return sorted(chosen + best['cols']), optimal
+
+def select_minimum_cover(primes, minterms, num_vars=5, time_budget=2.0):
+    """Choose a minimum set of prime implicants covering every minterm
+
+    Cost is the number of product terms first and the number of literals
+    second.  Returns (cover, optimal flag).
+    """
+    index = {m: i for i, m in enumerate(sorted(set(minterms)))}
+    columns = []
+    for cube in primes:
+        rows = 0
+        for m in cube_minterms(cube):
+            if m in index:
+                rows |= 1 << index[m]
+        columns.append(rows)
+    costs = [(num_vars + 1) + cube_literal_count(cube, num_vars) for cube in primes]
+    chosen, optimal = solve_cover(columns, costs, time_budget)
+    return [primes[i] for i in chosen], optimal
+
+# Above this many inputs minimize() switches from exact Quine-McCluskey to
+# the Espresso-style heuristic, whose cost follows the cube count instead of 2^n
+EXACT_VAR_LIMIT = 10
+
+# EXPAND uses an explicit OFF-set unless its complement grows past this many
+# cubes, in which case it falls back to tautology-based containment checks
+OFF_SET_LIMIT = 4096
+
+def _cube_intersect(a, b):
+    """Intersection of two cubes, or None if they are disjoint"""
+    if (a[0] ^ b[0]) & ~a[1] & ~b[1]:
+        return None
+    return (a[0] | b[0], a[1] & b[1])
+
+def _cube_contains(a, b):
+    """Check if cube a contains cube b"""
+    return (b[1] & ~a[1]) == 0 and (b[0] & ~a[1]) == a[0]
+
+def _cofactor(cubes, cube, full):
+    """Cofactor of a cube list with respect to a cube"""
+    fixed = full & ~cube[1]
+    result = []
+    for other in cubes:
+        if (other[0] ^ cube[0]) & fixed & ~other[1]:
+            continue
+        result.append((other[0] & ~fixed, other[1] | fixed))
+    return result
+
+def _literal_cofactor(cubes, bit, polarity):
+    """Cofactor of a cube list with respect to a single literal"""
+    result = []
+    for value, mask in cubes:
+        if mask & bit:
+            result.append((value, mask))
+        elif bool(value & bit) == polarity:
+            result.append((value & ~bit, mask | bit))
+    return result
+
+def _splitting_variable(cubes, full):
+    """Pick the most binate variable, returns (bit, binate flag)"""
+    best_bit, best_score, binate = 0, -1, False
+    bits = full
+    while bits:
+        bit = bits & -bits
+        bits ^= bit
+        ones = zeros = 0
+        for value, mask in cubes:
+            if not mask & bit:
+                if value & bit:
+                    ones += 1
+                else:
+                    zeros += 1
+        is_binate = ones > 0 and zeros > 0
+        score = ones + zeros
+        if (is_binate, score) > (binate, best_score):
+            best_bit, best_score, binate = bit, score, is_binate
+    return best_bit, binate
+
+def _is_tautology(cubes, full):
+    """Unate-recursive tautology check of a cube list"""
+    if not cubes:
+        return False
+    if any(mask == full for _, mask in cubes):
+        return True
+    bit, binate = _splitting_variable(cubes, full)
+    if not binate:
+        # A unate cover is a tautology only if it holds the universal cube
+        return False
+    return (_is_tautology(_literal_cofactor(cubes, bit, False), full) and
+            _is_tautology(_literal_cofactor(cubes, bit, True), full))
+
+def _drop_contained(cubes):
+    """Single-cube containment: remove cubes contained in another cube"""
+    # Only a cube with strictly more free variables can contain a different
+    # cube, so compare against wider cubes kept so far
+    by_width = {}
+    for cube in set(cubes):
+        by_width.setdefault(cube[1].bit_count(), []).append(cube)
+    kept = []
+    for width in sorted(by_width, reverse=True):
+        wider = list(kept)
+        for value, mask in by_width[width]:
+            if not any((mask & ~other_mask) == 0 and (value & ~other_mask) == other_value
+                       for other_value, other_mask in wider):
+                kept.append((value, mask))
+    return kept
+
+class _ComplementTooLarge(Exception):
+    """Raised when a complement grows past its cube limit"""
+
+def complement_cover(cubes, num_vars):
+    """Complement of a cube list, computed by unate-recursive Shannon expansion"""
+    full = (1 << num_vars) - 1
+    return _complement(list(cubes), full)
+
+def _complement(cubes, full, limit=None):
+    if not cubes:
+        return [(0, full)]
+    if any(mask == full for _, mask in cubes):
+        return []
+    if len(cubes) == 1:
+        # De Morgan on a single product term
+        value, mask = cubes[0]
+        return [((~value) & bit, full & ~bit) for bit in _bits_of(full & ~mask)]
+
+    bit, _ = _splitting_variable(cubes, full)
+    low = _complement(_literal_cofactor(cubes, bit, False), full, limit)
+    high = _complement(_literal_cofactor(cubes, bit, True), full, limit)
+    high_set = set(high)
+    result = []
+    for cube in low:
+        if cube in high_set:
+            high_set.discard(cube)
+            result.append(cube)
+        else:
+            result.append((cube[0], cube[1] & ~bit))
+    for cube in high:
+        if cube in high_set:
+            result.append((cube[0] | bit, cube[1] & ~bit))
+    if limit is not None and len(result) > limit:
+        raise _ComplementTooLarge
+    return _drop_contained(result)
+
+def _complement_supercube(cubes, full):
+    """Supercube of the complement of a cube list, or None if the complement is empty"""
+    if not cubes:
+        return (0, full)
+    if any(mask == full for _, mask in cubes):
+        return None
+    if len(cubes) == 1:
+        value, mask = cubes[0]
+        fixed = full & ~mask
+        if fixed.bit_count() > 1:
+            return (0, full)
+        return ((~value) & fixed, mask)
+
+    bit, _ = _splitting_variable(cubes, full)
+    halves = []
+    low = _complement_supercube(_literal_cofactor(cubes, bit, False), full)
+    if low is not None:
+        halves.append((low[0], low[1] & ~bit))
+    high = _complement_supercube(_literal_cofactor(cubes, bit, True), full)
+    if high is not None:
+        halves.append((high[0] | bit, high[1] & ~bit))
+    if not halves:
+        return None
+    return _supercube(halves)
+
+def _bits_of(bits):
+    """List the single-bit masks of the set bits of an integer"""
+    result = []
+    while bits:
+        low = bits & -bits
+        result.append(low)
+        bits ^= low
+    return result
+
+def _cover_cost(cubes, num_vars):
+    """(terms, literals) cost used to decide whether an Espresso pass helped"""
+    return (len(cubes), sum(cube_literal_count(cube, num_vars) for cube in cubes))
+
+def _expand(cover, dc_cubes, off_set, full):
+    """EXPAND: raise literals of each cube as long as it stays off the OFF-set
+
+    With an explicit OFF-set a raise is checked against the variables that
+    separate the cube from each OFF-set cube.  Without one (the complement
+    was too large) the raised cube is checked for containment in the ON-set
+    plus don't cares by a tautology test.
+    """
+    free_count = {}
+    for bit in _bits_of(full):
+        free_count[bit] = sum(1 for _, mask in cover if mask & bit)
+
+    care = list(cover) + list(dc_cubes)
+    expanded = []
+    remaining = sorted(cover, key=lambda cube: -cube[1].bit_count())
+    while remaining:
+        value, mask = remaining.pop(0)
+        order = sorted(_bits_of(full & ~mask), key=lambda b: -free_count[b])
+        if off_set is not None:
+            # Raising a variable is illegal if it is the only one separating
+            # the cube from some OFF-set cube
+            conflicts = {(value ^ off_value) & ~off_mask & ~mask for off_value, off_mask in off_set}
+            for bit in order:
+                if bit not in conflicts:
+                    value, mask = value & ~bit, mask | bit
+                    conflicts = {conflict & ~bit for conflict in conflicts}
+        else:
+            for bit in order:
+                candidate = (value & ~bit, mask | bit)
+                if _is_tautology(_cofactor(care, candidate, full), full):
+                    value, mask = candidate
+        expanded.append((value, mask))
+        remaining = [(other_value, other_mask) for other_value, other_mask in remaining
+                     if (other_mask & ~mask) != 0 or (other_value & ~mask) != value]
+    return expanded
+
+def _irredundant(cover, dc_cubes, full):
+    """IRREDUNDANT: drop cubes already covered by the rest of the cover plus don't cares"""
+    cover = sorted(cover, key=lambda cube: cube[1].bit_count())
+    kept = list(cover)
+    for cube in cover:
+        rest = [other for other in kept if other != cube] + list(dc_cubes)
+        if _is_tautology(_cofactor(rest, cube, full), full):
+            kept.remove(cube)
+    return kept
+
+def _supercube(cubes):
+    """Smallest cube containing every cube in the list"""
+    and_value, or_value, mask = -1, 0, 0
+    for value, cube_mask in cubes:
+        and_value &= value
+        or_value |= value
+        mask |= cube_mask
+    mask |= and_value ^ or_value
+    return (and_value & ~mask, mask)
+
+def _reduce(cover, dc_cubes, full):
+    """REDUCE: shrink each cube to the smallest cube still covering its own part"""
+    reduced = sorted(cover, key=lambda cube: -cube[1].bit_count())
+    i = 0
+    while i < len(reduced):
+        cube = reduced[i]
+        rest = reduced[:i] + reduced[i + 1:] + list(dc_cubes)
+        uncovered = _complement_supercube(_cofactor(rest, cube, full), full)
+        if uncovered is None:
+            del reduced[i]
+            continue
+        reduced[i] = _cube_intersect(cube, uncovered)
+        i += 1
+    return reduced
+
+def espresso(on_cubes, num_vars, dc_cubes=None, max_passes=20):
+    """Espresso-style heuristic minimization of a cube list
+
+    Works on cubes throughout (OFF-set by cube complementation, containment
+    by unate-recursive tautology checks, REDUCE by the supercube of a
+    cofactor's complement), so runtime follows the number of cubes rather
+    than 2^num_vars.  Repeats REDUCE/EXPAND/IRREDUNDANT until the cost
+    stops improving.
+    """
+    full = (1 << num_vars) - 1
+    dc_cubes = list(dc_cubes or [])
+    cover = _drop_contained(on_cubes)
+    if not cover:
+        return []
+    try:
+        off_set = _complement(cover + dc_cubes, full, OFF_SET_LIMIT)
+    except _ComplementTooLarge:
+        off_set = None
+
+    cover = _expand(cover, dc_cubes, off_set, full)
+    cover = _irredundant(cover, dc_cubes, full)
+    cost = _cover_cost(cover, num_vars)
+    for _ in range(max_passes):
+        candidate = _reduce(cover, dc_cubes, full)
+        candidate = _expand(candidate, dc_cubes, off_set, full)
+        candidate = _irredundant(candidate, dc_cubes, full)
+        candidate_cost = _cover_cost(candidate, num_vars)
+        if candidate_cost >= cost:
+            break
+        cover, cost = candidate, candidate_cost
+    return sorted(cover, key=lambda cube: (-cube[1].bit_count(), cube))
+
+def minimize(minterms, num_vars=5, time_budget=2.0, engine='auto', dont_cares=()):
+    """Minimize a single-output function to a sum-of-products cover of cubes
+
+    engine is 'exact' (Quine-McCluskey plus minimum cover), 'espresso', or
+    'auto', which picks exact up to EXACT_VAR_LIMIT inputs.  minterms may be
+    a TruthTable, whose don't-care set is then used as well.
+    """
+    if isinstance(minterms, TruthTable):
+        dont_cares = list(dont_cares) + minterms.dont_cares()
+        minterms = minterms.minterms()
+    dc_set = set(dont_cares)
+    minterms = [m for m in minterms if m not in dc_set]
+    if not minterms:
+        return []
+    if engine == 'auto':
+        engine = 'exact' if num_vars <= EXACT_VAR_LIMIT else 'espresso'
+    if RESULT_CACHE is not None:
+        # Only finished searches are stored, so the time budget is not part
+        # of the key: a greedy fallback from a timed-out search is never reused
+        cover, _ = RESULT_CACHE.memoize('cover', num_vars, minterms, dc_set,
+                                        lambda: _minimize(minterms, num_vars, time_budget, engine, dont_cares),
+                                        keep=lambda result: result[1], engine=engine)
+        return cover
+    return _minimize(minterms, num_vars, time_budget, engine, dont_cares)[0]
+
+def _minimize(minterms, num_vars, time_budget, engine, dont_cares):
+    """(cover, complete) where complete is False if the exact cover search timed out"""
+    if engine == 'espresso':
+        return espresso([(m, 0) for m in minterms], num_vars, [(m, 0) for m in dont_cares]), True
+    if engine != 'exact':
+        raise ValueError(f"Unknown minimization engine: {engine}")
+    primes = find_prime_implicants(minterms, num_vars, dont_cares)
+    return select_minimum_cover(primes, minterms, num_vars, time_budget)
+
+def find_multi_output_primes(functions, num_vars=5, dont_cares=None):
+    """Multi-output Quine-McCluskey: return prime implicants as (value, mask, tag)
+
+    functions is a list of minterm lists and dont_cares an optional list of
+    don't-care lists, one per function; bit i of a tag means the cube is an
+    implicant of function i.  Two cubes combine when they are adjacent and
+    share at least one output, and the result carries the shared outputs.  A
+    cube stops being prime only when it combines without losing any of its
+    outputs, so a product term useful to several outputs is found once.
+    """
+    full = (1 << num_vars) - 1
+    current = {}
+    for index, minterms in enumerate(functions):
+        extra = dont_cares[index] if dont_cares else ()
+        for m in list(minterms) + list(extra):
+            current[(m, 0)] = current.get((m, 0), 0) | (1 << index)
+    primes = []
+
+    while current:
+        buckets = {}
+        for (value, mask), tag in current.items():
+            buckets.setdefault((mask, value.bit_count()), {})[value] = tag
+
+        combined = {}
+        merged = set()
+        for (mask, ones), values in buckets.items():
+            upper = buckets.get((mask, ones + 1))
+            if not upper:
+                continue
+            for value, tag in values.items():
+                free = full & ~(value | mask)
+                while free:
+                    bit = free & -free
+                    free ^= bit
+                    other_tag = upper.get(value | bit)
+                    if other_tag is None or not tag & other_tag:
+                        continue
+                    shared = tag & other_tag
+                    key = (value, mask | bit)
+                    combined[key] = combined.get(key, 0) | shared
+                    if shared == tag:
+                        merged.add((value, mask))
+                    if shared == other_tag:
+                        merged.add((value | bit, mask))
+
+        primes.extend((value, mask, tag) for (value, mask), tag in current.items()
+                      if (value, mask) not in merged)
+        current = combined
+
+    return sorted(primes, key=lambda prime: (-prime[1].bit_count(), prime))
+
+def minimize_multi_output(functions, num_vars=5, time_budget=2.0, dont_cares=None):
+    """Minimize several functions together with shared product terms
+
+    Returns a list of (cube, outputs) where outputs is a bitmask of the
+    functions whose OR gate the product term feeds.  Every product term is
+    paid for once in the cover cost, however many outputs use it.
+    """
+    rows = {}
+    for index, minterms in enumerate(functions):
+        dc_set = set(dont_cares[index]) if dont_cares else set()
+        for m in minterms:
+            if m not in dc_set:
+                rows[(index, m)] = len(rows)
+    primes = find_multi_output_primes(functions, num_vars, dont_cares)
+
+    columns = []
+    for value, mask, tag in primes:
+        col_rows = 0
+        for m in cube_minterms((value, mask)):
+            for index in _set_bits(tag):
+                row = rows.get((index, m))
+                if row is not None:
+                    col_rows |= 1 << row
+        columns.append(col_rows)
+    costs = [(num_vars + 1) + cube_literal_count((value, mask), num_vars) for value, mask, _ in primes]
+    chosen, _ = solve_cover(columns, costs, time_budget)
+
+    # Connect each chosen term only to the outputs that still need it
+    terms = [((primes[i][0], primes[i][1]), primes[i][2]) for i in chosen]
+    connections = [0] * len(terms)
+    for index, minterms in enumerate(functions):
+        needed = set(minterms) - (set(dont_cares[index]) if dont_cares else set())
+        candidates = sorted((i for i, (_, tag) in enumerate(terms) if (tag >> index) & 1),
+                            key=lambda i: -terms[i][0][1].bit_count())
+        for i in candidates:
+            covered = needed.intersection(cube_minterms(terms[i][0]))
+            if covered:
+                needed -= covered
+                connections[i] |= 1 << index
+    return [(cube, outputs) for (cube, _), outputs in zip(terms, connections) if outputs]
+
+def cover_to_expression(cover, num_vars=5, var_names=['M1', 'M0', 'C1', 'C0', 'D']):
+    """Convert a cover to a sum-of-products expression string"""
+    if not cover:
+        return '0'
+    return ' + '.join(binary_to_expression(cube_to_binary(cube, num_vars), var_names) for cube in cover)
+
+def expression_to_cover(expression, var_names=['M1', 'M0', 'C1', 'C0', 'D']):
+    """Parse a sum-of-products string like "M1'D + C1C0" back into cubes"""
+    num_vars = len(var_names)
+    full = (1 << num_vars) - 1
+    # Longest names first so that e.g. 'C10' is not read as 'C1' followed by '0'
+    names = sorted(range(num_vars), key=lambda i: -len(var_names[i]))
+    cover = []
+    for term in expression.replace(' ', '').split('+'):
+        if term == '0':
+            continue
+        if term == '1':
+            cover.append((0, full))
+            continue
+        value, fixed, empty = 0, 0, False
+        position = 0
+        while position < len(term):
+            index = next((i for i in names if term.startswith(var_names[i], position)), None)
+            if index is None:
+                raise ValueError(f"Cannot parse product term '{term}' at position {position}")
+            position += len(var_names[index])
+            negated = term.startswith("'", position)
+            if negated:
+                position += 1
+            bit = 1 << (num_vars - 1 - index)
+            if fixed & bit and bool(value & bit) == negated:
+                empty = True  # x & x' never holds
+            fixed |= bit
+            if not negated:
+                value |= bit
+        if not empty:
+            cover.append((value & fixed, full & ~fixed))
+    return cover
+
+def _tree_depth(inputs):
+    """Levels of 2-input gates needed to combine the given number of inputs"""
+    return max(inputs - 1, 0).bit_length()
+
+def cover_statistics(cover, num_vars=5):
+    """Count terms, literals, gates and 2-input logic depth of a two-level cover"""
+    literals = sum(cube_literal_count(cube, num_vars) for cube in cover)
+    full = (1 << num_vars) - 1
+    complemented = 0
+    for value, mask in cover:
+        complemented |= full & ~(value | mask)
+    widest_term = max((cube_literal_count(cube, num_vars) for cube in cover), default=0)
+    return {
+        'terms': len(cover),
+        'literals': literals,
+        'and_gates': sum(1 for cube in cover if cube_literal_count(cube, num_vars) > 1),
+        'or_gates': 1 if len(cover) > 1 else 0,
+        'complemented_vars': complemented,
+        'depth': (1 if complemented else 0) + _tree_depth(widest_term) + _tree_depth(len(cover)),
+    }
+
+def illegal_puzzle_inputs(missionaries=3, cannibals=3):
+    """Minterms M1M0C1C0D where cannibals outnumber missionaries on either bank
+
+    Such inputs are never reached by a correct solver, so the next-state
+    functions may treat them as don't cares.
+    """
+    dont_cares = []
+    for minterm in range(32):
+        m_left, c_left = minterm >> 3, (minterm >> 1) & 3
+        m_right, c_right = missionaries - m_left, cannibals - c_left
+        left_unsafe = 0 < m_left < c_left
+        right_unsafe = 0 < m_right < c_right
+        if left_unsafe or right_unsafe or m_right < 0 or c_right < 0:
+            dont_cares.append(minterm)
+    return dont_cares
+
 def analyze_minimization_potential(minterms, output_name):
     """Analyze the minimization potential of a function"""
     print(f"\n{'='*60}")
@@ -98,12 +784,14 @@ def analyze_minimization_potential(minterms, output_name):
     # Simple grouping analysis
     print("\nSimple Adjacent Groupings Analysis:")
     
-    # Find pairs that can be combined
+    # Find pairs that can be combined: flip each 0 bit and test membership
+    table = as_truth_table(minterms, 5)
     pairs = []
-    for i in range(len(minterms)):
-        for j in range(i + 1, len(minterms)):
-            if find_adjacent_minterms(minterms[i], minterms[j]):
-                pairs.append((minterms[i], minterms[j]))
+    for m in table:
+        for position in range(5):
+            partner = m | (1 << position)
+            if partner != m and partner in table:
+                pairs.append((m, partner))
     
     print(f"Adjacent pairs found: {len(pairs)}")
     if len(pairs) <= 5:
@@ -116,59 +804,125 @@ def analyze_minimization_potential(minterms, output_name):
             m1, m2 = pair
             print(f"  {m1} ({minterm_to_binary(m1)}) + {m2} ({minterm_to_binary(m2)})")
     
-    # Estimate potential reduction
-    estimated_reduction = min(len(pairs) // 2, total_minterms // 3)
-    estimated_final_terms = max(3, total_minterms - estimated_reduction)
+    # Exact prime implicants from the cube-based engine
+    primes = find_prime_implicants(minterms)
+    print(f"\nPrime implicants: {len(primes)}")
+    for cube in primes:
+        binary = cube_to_binary(cube)
+        print(f"  {binary}  {binary_to_expression(binary)}")
+
+    # Exact minimum cover of the prime implicant chart
+    cover, optimal = select_minimum_cover(primes, minterms)
+    stats = cover_statistics(cover)
+    final_terms = stats['terms']
     
-    print(f"\nEstimated optimization:")
+    print(f"\nMinimum cover ({'exact' if optimal else 'greedy fallback'}):")
+    print(f"  {output_name} = {cover_to_expression(cover)}")
     print(f"  Original terms: {total_minterms}")
-    print(f"  Estimated final terms: {estimated_final_terms}")
-    print(f"  Potential reduction: {((total_minterms - estimated_final_terms) / total_minterms * 100):.1f}%")
+    print(f"  Final terms: {final_terms} ({stats['literals']} literals)")
+    print(f"  Reduction: {((total_minterms - final_terms) / total_minterms * 100):.1f}%")
+    
+    heuristic = espresso([(m, 0) for m in minterms], 5)
+    print(f"  Espresso heuristic cross-check: {len(heuristic)} terms")
     
-    return estimated_final_terms
+    return cover
 
 def create_optimized_expressions():
     """Create optimized Boolean expressions for all outputs"""
     print("AUTOMATED BOOLEAN MINIMIZATION ANALYSIS")
     print("=" * 80)
     
-    # Original functions
-    functions = {
-        "MISSIONARY_NEXT[1]": [0,1,3,6,8,9,10,11,12,13,14,15,16,17,18,19,20,22,23,24,25,26,28,29,30,31],
-        "MISSIONARY_NEXT[0]": [0,1,3,6,8,9,11,12,13,14,15,16,17,18,19,20,22,23,24,25,26,27,28,29,30,31],
-        "CANNIBAL_NEXT[1]": [0,1,2,3,4,6,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,25,26,28,30],
-        "CANNIBAL_NEXT[0]": [0,1,3,4,6,7,8,9,11,12,13,14,15,16,17,18,19,20,22,23,24,25,27,28,30,31]
-    }
+    functions = NEXT_STATE_FUNCTIONS
     
     total_original_terms = 0
-    total_estimated_final = 0
+    total_final_terms = 0
+    and_gates = 0
+    or_gates = 0
+    complemented = 0
+    depth = 0
     
     for output_name, minterms in functions.items():
-        estimated_final = analyze_minimization_potential(minterms, output_name)
+        cover = analyze_minimization_potential(minterms, output_name)
+        stats = cover_statistics(cover)
         total_original_terms += len(minterms)
-        total_estimated_final += estimated_final
+        total_final_terms += stats['terms']
+        and_gates += stats['and_gates']
+        or_gates += stats['or_gates']
+        complemented |= stats['complemented_vars']
+        depth = max(depth, stats['depth'])
+    not_gates = complemented.bit_count()
     
     print(f"\n\nOVERALL OPTIMIZATION SUMMARY:")
     print(f"{'='*50}")
     print(f"Total original terms: {total_original_terms}")
-    print(f"Total estimated optimized terms: {total_estimated_final}")
-    print(f"Overall reduction: {((total_original_terms - total_estimated_final) / total_original_terms * 100):.1f}%")
+    print(f"Total optimized terms: {total_final_terms}")
+    print(f"Overall reduction: {((total_original_terms - total_final_terms) / total_original_terms * 100):.1f}%")
     
     print(f"\nGATE COUNT ANALYSIS:")
     print(f"Original implementation:")
     print(f"  - AND gates: {total_original_terms} (for product terms)")
     print(f"  - OR gates: 4 large (one per output)")
-    print(f"  - NOT gates: ~15 (for variable complements)")
-    print(f"  - Total gates: ~{total_original_terms + 19}")
+    print(f"  - NOT gates: 5 (one per input variable)")
+    print(f"  - Total gates: {total_original_terms + 9}")
+    
+    optimized_total = and_gates + or_gates + not_gates
+    print(f"\nOptimized implementation:")
+    print(f"  - AND gates: {and_gates} (for product terms)")
+    print(f"  - OR gates: {or_gates} (one per multi-term output)")
+    print(f"  - NOT gates: {not_gates} (for variable complements)")
+    print(f"  - Total gates: {optimized_total}")
+    print(f"  - Logic depth: {depth} levels of 2-input gates")
+    
+    gate_reduction = total_original_terms + 9 - optimized_total
+    print(f"  - Gate reduction: {gate_reduction} gates ({gate_reduction/(total_original_terms + 9)*100:.1f}%)")
+    
+    # Illegal bank states never occur, so their outputs are free to choose
+    dont_cares = illegal_puzzle_inputs()
+    print(f"\nDON'T-CARE OPTIMIZATION (illegal bank states):")
+    print(f"Don't-care inputs: {dont_cares}")
+    print(f"{'Output':<20} {'Current':<22}   With don't cares")
+    totals = [0, 0, 0, 0]
+    for output_name, minterms in functions.items():
+        current = cover_statistics(minimize(minterms))
+        relaxed = cover_statistics(minimize(minterms, dont_cares=dont_cares))
+        print(f"{output_name:<20} {current['terms']:>3} terms {current['literals']:>3} lits d={current['depth']}"
+              f"   {relaxed['terms']:>3} terms {relaxed['literals']:>3} lits d={relaxed['depth']}")
+        totals[0] += current['terms']
+        totals[1] += relaxed['terms']
+        totals[2] = max(totals[2], current['depth'])
+        totals[3] = max(totals[3], relaxed['depth'])
+    print(f"Product terms: {totals[0]} -> {totals[1]} ({totals[0] - totals[1]} fewer)")
+    print(f"Logic depth: {totals[2]} -> {totals[3]} levels")
+
+def analyze_shared_terms():
+    """Report multi-output minimization with product terms shared across outputs"""
+    names = list(NEXT_STATE_FUNCTIONS)
+    functions = [NEXT_STATE_FUNCTIONS[name] for name in names]
+    
+    print(f"\n\nMULTI-OUTPUT MINIMIZATION (SHARED PRODUCT TERMS):")
+    print(f"{'='*50}")
+    primes = find_multi_output_primes(functions)
+    shared_primes = sum(1 for _, _, tag in primes if tag.bit_count() > 1)
+    print(f"Multi-output prime implicants: {len(primes)} ({shared_primes} usable by several outputs)")
+    
+    terms = minimize_multi_output(functions)
+    print(f"\nSelected product terms:")
+    for cube, outputs in terms:
+        users = ', '.join(names[i] for i in _set_bits(outputs))
+        print(f"  {binary_to_expression(cube_to_binary(cube)):<12} -> {users}")
     
-    print(f"\nOptimized implementation (estimated):")
-    print(f"  - AND gates: {total_estimated_final} (for product terms)")
-    print(f"  - OR gates: 4 smaller (one per output)")
-    print(f"  - NOT gates: ~15 (for variable complements)")
-    print(f"  - Total gates: ~{total_estimated_final + 19}")
+    print(f"\nPer-output equations:")
+    for index, name in enumerate(names):
+        cover = [cube for cube, outputs in terms if (outputs >> index) & 1]
+        print(f"  {name} = {cover_to_expression(cover)}")
     
-    gate_reduction = total_original_terms - total_estimated_final
-    print(f"  - Gate reduction: {gate_reduction} gates ({gate_reduction/(total_original_terms + 19)*100:.1f}%)")
+    separate_terms = sum(len(minimize(minterms)) for minterms in functions)
+    shared_terms = sum(1 for _, outputs in terms if outputs.bit_count() > 1)
+    print(f"\nAND-plane comparison:")
+    print(f"  Separate minimization: {separate_terms} product terms")
+    print(f"  Multi-output minimization: {len(terms)} distinct product terms ({shared_terms} shared)")
+    saving = separate_terms - len(terms)
+    print(f"  Shared-term savings: {saving} AND gates ({saving / separate_terms * 100:.1f}%)")
 
 def suggest_next_actions():
     """Suggest the next steps in the project"""
@@ -217,6 +971,15 @@ def suggest_next_actions():
     print("   - Verification methodology")
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Minimize the next-state functions and report the savings")
+    parser.add_argument('--cache', action='store_true', help="reuse and store results in the result cache")
+    args = parser.parse_args()
+    if args.cache:
+        from result_cache import ResultCache
+        RESULT_CACHE = ResultCache()
     create_optimized_expressions()
+    analyze_shared_terms()
     suggest_next_actions()
+    if RESULT_CACHE is not None:
+        print(f"\nResult cache: {RESULT_CACHE.summary()}")
 
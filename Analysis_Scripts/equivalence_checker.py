@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+
+# Exhaustive functional equivalence checking
+# Compares the original Σm lists against optimized sum-of-products
+# expressions or Verilog assign statements over every input vector.
+# Vectors are evaluated word-parallel: each Python integer holds a block of
+# 2^16 input vectors, so all 2^n inputs of a function take 2^(n-16) rounds of
+# AND/OR on packed bitsets.
+
+import argparse
+import re
+import sys
+from collections import namedtuple
+
+from boolean_minimizer import NEXT_STATE_FUNCTIONS, minimize, cover_to_expression, expression_to_cover
+from truth_table import TruthTable, as_truth_table, variable_bits
+
+SOP_VAR_NAMES = ['M1', 'M0', 'C1', 'C0', 'D']
+VERILOG_VAR_NAMES = ['missionary_curr[1]', 'missionary_curr[0]', 'cannibal_curr[1]', 'cannibal_curr[0]', 'direction']
+
+# Input vectors evaluated per packed word
+BLOCK_BITS = 16
+
+EquivalenceResult = namedtuple('EquivalenceResult',
+                               ['equivalent', 'counterexample', 'expected', 'actual', 'vectors_checked'])
+
+# Expression trees ------------------------------------------------------------
+
+def cover_to_tree(cover, num_vars):
+    """Expression tree of a (value, mask) cube cover"""
+    terms = []
+    for value, mask in cover:
+        literals = []
+        for index in range(num_vars):
+            position = num_vars - 1 - index
+            if not (mask >> position) & 1:
+                literal = ('var', index)
+                literals.append(literal if (value >> position) & 1 else ('not', literal))
+        terms.append(_fold('and', literals, ('const', 1)))
+    return _fold('or', terms, ('const', 0))
+
+def _fold(op, operands, empty):
+    if not operands:
+        return empty
+    tree = operands[0]
+    for operand in operands[1:]:
+        tree = (op, tree, operand)
+    return tree
+
+def sop_to_tree(expression, var_names=SOP_VAR_NAMES):
+    """Expression tree of a binary_to_expression-style SOP string"""
+    return cover_to_tree(expression_to_cover(expression, var_names), len(var_names))
+
+_TOKEN = re.compile(r"\s*(?:(\d+'[bB][01]+|\d+)|([A-Za-z_][A-Za-z0-9_$]*(?:\s*\[\s*\d+\s*\])?)|(&&|\|\||[~!&|^()]))")
+
+def _parse_constant(text):
+    """Value of a decimal or sized binary literal, truncated to one bit"""
+    if "'" in text:
+        return int(text.split("'")[1][1:], 2) & 1
+    return int(text) & 1
+
+def _tokenize(text):
+    tokens = []
+    position = 0
+    text = text.strip()
+    while position < len(text):
+        match = _TOKEN.match(text, position)
+        if not match:
+            raise ValueError(f"Unexpected character in expression: '{text[position:]}'")
+        number, name, op = match.groups()
+        if number is not None:
+            tokens.append(('const', _parse_constant(number)))
+        elif name is not None:
+            tokens.append(('name', re.sub(r'\s+', '', name)))
+        else:
+            tokens.append(('op', op))
+        position = match.end()
+    return tokens
+
+# Binary operators from loosest to tightest binding
+_PRECEDENCE = [('||', 'or'), ('&&', 'and'), ('|', 'or'), ('^', 'xor'), ('&', 'and')]
+
+def verilog_to_tree(expression, var_names=VERILOG_VAR_NAMES):
+    """Expression tree of a single-bit Verilog expression using ~ ! & && | || ^"""
+    tokens = _tokenize(expression)
+    indices = {name: i for i, name in enumerate(var_names)}
+    position = 0
+
+    def peek():
+        return tokens[position] if position < len(tokens) else (None, None)
+
+    def parse_binary(level):
+        nonlocal position
+        if level == len(_PRECEDENCE):
+            return parse_unary()
+        symbol, op = _PRECEDENCE[level]
+        tree = parse_binary(level + 1)
+        while peek() == ('op', symbol):
+            position += 1
+            tree = (op, tree, parse_binary(level + 1))
+        return tree
+
+    def parse_unary():
+        nonlocal position
+        kind, value = peek()
+        if kind is None:
+            raise ValueError(f"Unexpected end of expression: '{expression}'")
+        position += 1
+        if kind == 'op' and value in ('~', '!'):
+            return ('not', parse_unary())
+        if kind == 'op' and value == '(':
+            tree = parse_binary(0)
+            if peek() != ('op', ')'):
+                raise ValueError(f"Missing ')' in expression: '{expression}'")
+            position += 1
+            return tree
+        if kind == 'const':
+            return ('const', value)
+        if kind == 'name':
+            if value not in indices:
+                raise ValueError(f"Unknown signal '{value}' (inputs are {', '.join(var_names)})")
+            return ('var', indices[value])
+        raise ValueError(f"Unexpected '{value}' in expression: '{expression}'")
+
+    tree = parse_binary(0)
+    if position != len(tokens):
+        raise ValueError(f"Trailing input in expression: '{expression}'")
+    return tree
+
+def read_verilog_assigns(path):
+    """Map each `assign lhs = expr;` target in a Verilog file to its expression"""
+    with open(path) as f:
+        text = f.read()
+    text = re.sub(r'/\*.*?\*/', '', text, flags=re.DOTALL)
+    text = re.sub(r'//[^\n]*', '', text)
+    assigns = {}
+    for lhs, rhs in re.findall(r'\bassign\s+([^=;]+?)\s*=\s*([^;]+);', text):
+        assigns[re.sub(r'\s+', '', lhs)] = rhs.strip()
+    return assigns
+
+# Word-parallel evaluation ----------------------------------------------------
+
+def _evaluate(tree, inputs, ones):
+    kind = tree[0]
+    if kind == 'var':
+        return inputs[tree[1]]
+    if kind == 'const':
+        return ones if tree[1] else 0
+    if kind == 'not':
+        return ones & ~_evaluate(tree[1], inputs, ones)
+    left = _evaluate(tree[1], inputs, ones)
+    right = _evaluate(tree[2], inputs, ones)
+    if kind == 'and':
+        return left & right
+    if kind == 'or':
+        return left | right
+    return left ^ right
+
+def check_equivalence(original, tree, num_vars):
+    """Compare a function against an expression tree on all 2^num_vars inputs
+
+    original is a TruthTable (or a minterm list); its don't cares are
+    skipped.  Stops at the first block holding a mismatch and reports the
+    lowest differing minterm.
+    """
+    table = as_truth_table(original, num_vars)
+    block_bits = min(num_vars, BLOCK_BITS)
+    block_size = 1 << block_bits
+    ones = (1 << block_size) - 1
+    low_vars = [variable_bits(block_bits, i - (num_vars - block_bits)) if i >= num_vars - block_bits else None
+                for i in range(num_vars)]
+    checked = 0
+
+    for block in range(1 << (num_vars - block_bits)):
+        # The high inputs are constant inside a block, the low ones periodic
+        inputs = []
+        for index in range(num_vars):
+            if low_vars[index] is not None:
+                inputs.append(low_vars[index])
+            else:
+                position = num_vars - 1 - index - block_bits
+                inputs.append(ones if (block >> position) & 1 else 0)
+        offset = block * block_size
+        expected = (table.on_bits >> offset) & ones
+        care = ones & ~((table.dc_bits >> offset) & ones)
+        actual = _evaluate(tree, inputs, ones)
+        checked += block_size
+        diff = (expected ^ actual) & care
+        if diff:
+            low = (diff & -diff).bit_length() - 1
+            return EquivalenceResult(False, offset + low, (expected >> low) & 1, (actual >> low) & 1, checked)
+    return EquivalenceResult(True, None, None, None, checked)
+
+def format_assignment(minterm, var_names):
+    """Readable input assignment of a minterm"""
+    num_vars = len(var_names)
+    return ' '.join(f"{name}={(minterm >> (num_vars - 1 - i)) & 1}" for i, name in enumerate(var_names))
+
+def report(name, result, var_names):
+    """Print one equivalence result, returns True when equivalent"""
+    if result.equivalent:
+        print(f"  {name:<20} PASS ({result.vectors_checked} vectors)")
+        return True
+    print(f"  {name:<20} FAIL at minterm {result.counterexample}: "
+          f"{format_assignment(result.counterexample, var_names)} "
+          f"expected {result.expected}, got {result.actual}")
+    return False
+
+def main():
+    parser = argparse.ArgumentParser(description="Exhaustive equivalence check of optimized logic against the original Σm lists")
+    parser.add_argument('--verilog', help="Verilog file whose assign statements drive missionary_next/cannibal_next")
+    args = parser.parse_args()
+
+    print("FUNCTIONAL EQUIVALENCE CHECK")
+    print("=" * 60)
+    all_equivalent = True
+
+    print("\nMinimized SOP expressions vs original minterms:")
+    for name, minterms in NEXT_STATE_FUNCTIONS.items():
+        expression = cover_to_expression(minimize(minterms))
+        result = check_equivalence(TruthTable.from_minterms(5, minterms), sop_to_tree(expression), 5)
+        all_equivalent &= report(name, result, SOP_VAR_NAMES)
+
+    if args.verilog:
+        print(f"\nVerilog assigns in {args.verilog} vs original minterms:")
+        assigns = {lhs.lower(): rhs for lhs, rhs in read_verilog_assigns(args.verilog).items()}
+        for name, minterms in NEXT_STATE_FUNCTIONS.items():
+            if name.lower() not in assigns:
+                print(f"  {name:<20} MISSING (no assign statement)")
+                all_equivalent = False
+                continue
+            tree = verilog_to_tree(assigns[name.lower()])
+            result = check_equivalence(TruthTable.from_minterms(5, minterms), tree, 5)
+            all_equivalent &= report(name, result, VERILOG_VAR_NAMES)
+
+    print(f"\nResult: {'ALL FUNCTIONS EQUIVALENT' if all_equivalent else 'MISMATCH FOUND'}")
+    return 0 if all_equivalent else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
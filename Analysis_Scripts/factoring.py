@@ -0,0 +1,372 @@
+#!/usr/bin/env python3
+
+# Multi-level logic optimization by algebraic factoring
+# Minimized covers are treated as algebraic sums of products (cubes are sets
+# of literals).  Kernels and co-kernels found by recursive division are
+# extracted greedily as shared intermediate signals across all outputs,
+# followed by common-cube extraction, and every node is then factored into
+# a nested AND/OR form.  The result is built as a logic_network with
+# depth-aware gate trees and checked against the original functions.
+
+import argparse
+import heapq
+
+from boolean_minimizer import NEXT_STATE_FUNCTIONS, minimize, cube_literal_count, illegal_puzzle_inputs
+from logic_network import LogicNetwork, from_covers, AND, OR, NOT
+from truth_table import TruthTable
+
+# Limits that keep extraction tractable on large generalized-puzzle covers
+MAX_KERNELS = 400
+MAX_CUBE_PAIRS = 20000
+
+# Literals are integers: 2 * variable + 1 for the complemented form.  Extracted
+# signals are new variables numbered after the inputs and only used uncomplemented.
+
+def cover_to_sop(cover, num_vars):
+    """Cubes (value, mask) as a list of literal sets"""
+    sop = []
+    for value, mask in cover:
+        cube = set()
+        for index in range(num_vars):
+            position = num_vars - 1 - index
+            if not (mask >> position) & 1:
+                cube.add(2 * index + (0 if (value >> position) & 1 else 1))
+        sop.append(frozenset(cube))
+    return sop
+
+def sop_literals(sop):
+    return sum(len(cube) for cube in sop)
+
+def literal_name(literal, names):
+    return names[literal // 2] + ("'" if literal & 1 else '')
+
+def divide(f, d):
+    """Algebraic (weak) division f = quotient * d + remainder"""
+    quotient = None
+    for divisor_cube in d:
+        partial = {cube - divisor_cube for cube in f if divisor_cube <= cube}
+        quotient = partial if quotient is None else quotient & partial
+        if not quotient:
+            return [], list(f)
+    product = {q | divisor_cube for q in quotient for divisor_cube in d}
+    return sorted(quotient, key=sorted), [cube for cube in f if cube not in product]
+
+def _common_cube(sop):
+    return frozenset.intersection(*sop) if sop else frozenset()
+
+def kernels(f, start=0, limit=MAX_KERNELS):
+    """(co-kernel, kernel) pairs of f: cube-free quotients of f by a cube"""
+    found = []
+    literals = sorted({literal for cube in f for literal in cube})
+    for literal in literals:
+        if literal < start or len(found) >= limit:
+            continue
+        containing = [cube for cube in f if literal in cube]
+        if len(containing) < 2:
+            continue
+        common = _common_cube(containing)
+        # Seen already from a smaller literal of the same co-kernel
+        if any(other < literal for other in common):
+            continue
+        quotient = [cube - common for cube in containing]
+        for co_kernel, kernel in kernels(quotient, literal + 1, limit - len(found)):
+            found.append((co_kernel | common, kernel))
+    if len(f) > 1 and not _common_cube(f):
+        found.append((frozenset(), list(f)))
+    return found
+
+# Extraction -------------------------------------------------------------------
+
+class FactoredNetwork:
+    """Named SOP nodes over input literals and extracted intermediate signals"""
+
+    def __init__(self, covers, num_vars, var_names):
+        self.num_vars = num_vars
+        self.names = list(var_names[:num_vars])
+        self.outputs = list(covers)
+        self.nodes = {name: cover_to_sop(cover, num_vars) for name, cover in covers.items()}
+        self.variable_of = {}  # extracted node name -> variable index
+
+    def literals(self):
+        return sum(sop_literals(sop) for sop in self.nodes.values())
+
+    def _new_signal(self, sop):
+        name = f"G{len(self.variable_of)}"
+        self.variable_of[name] = len(self.names)
+        self.names.append(name)
+        self.nodes[name] = sop
+        return 2 * self.variable_of[name]
+
+    def _dependents(self, sop):
+        """Extracted signals a SOP depends on, transitively"""
+        pending = [literal // 2 for cube in sop for literal in cube if literal // 2 >= self.num_vars]
+        seen = set()
+        while pending:
+            variable = pending.pop()
+            if variable in seen:
+                continue
+            seen.add(variable)
+            name = self.names[variable]
+            pending += [literal // 2 for cube in self.nodes[name] for literal in cube
+                        if literal // 2 >= self.num_vars]
+        return {self.names[variable] for variable in seen}
+
+    def _kernel_gain(self, kernel):
+        """Literals saved by extracting a kernel, and the nodes it divides"""
+        blocked = self._dependents(kernel)
+        gain, uses = -sop_literals(kernel), []
+        for name, sop in self.nodes.items():
+            if name in blocked:
+                continue
+            quotient, remainder = divide(sop, kernel)
+            if not quotient:
+                continue
+            after = sop_literals(quotient) + len(quotient) + sop_literals(remainder)
+            if after < sop_literals(sop):
+                gain += sop_literals(sop) - after
+                uses.append(name)
+        return gain, uses
+
+    def extract_kernels(self):
+        """Greedily extract the multi-cube divisor saving the most literals; number extracted"""
+        extracted = 0
+        while True:
+            candidates = {}
+            for sop in self.nodes.values():
+                for _, kernel in kernels(sop):
+                    if len(kernel) > 1:
+                        candidates.setdefault(frozenset(kernel), kernel)
+            best = None
+            for kernel in candidates.values():
+                gain, uses = self._kernel_gain(kernel)
+                # The gain already pays for the divisor's own literals
+                if gain > 0 and (best is None or gain > best[0]):
+                    best = (gain, kernel, uses)
+            if best is None:
+                return extracted
+            _, kernel, uses = best
+            literal = self._new_signal(sorted(kernel, key=sorted))
+            for name in uses:
+                quotient, remainder = divide(self.nodes[name], kernel)
+                self.nodes[name] = [q | {literal} for q in quotient] + remainder
+            extracted += 1
+
+    def extract_cubes(self):
+        """Greedily extract common cubes of two or more literals; number extracted"""
+        extracted = 0
+        while True:
+            candidates = set()
+            cubes = [cube for sop in self.nodes.values() for cube in sop if len(cube) > 2]
+            pairs = 0
+            for i, a in enumerate(cubes):
+                for b in cubes[i + 1:]:
+                    common = a & b
+                    if len(common) >= 2:
+                        candidates.add(common)
+                    pairs += 1
+                    if pairs > MAX_CUBE_PAIRS:
+                        break
+                if pairs > MAX_CUBE_PAIRS:
+                    break
+            best = None
+            for common in sorted(candidates, key=sorted):
+                blocked = self._dependents([common])
+                uses = sum(1 for name, sop in self.nodes.items() if name not in blocked
+                           for cube in sop if common <= cube and common != cube)
+                gain = uses * (len(common) - 1) - len(common)
+                if gain > 0 and (best is None or gain > best[0]):
+                    best = (gain, common, blocked)
+            if best is None:
+                return extracted
+            _, common, blocked = best
+            literal = self._new_signal([common])
+            for name, sop in list(self.nodes.items()):
+                if name not in blocked and name != self.names[literal // 2]:
+                    self.nodes[name] = [(cube - common) | {literal} if common <= cube and common != cube else cube
+                                        for cube in sop]
+            extracted += 1
+
+    def order(self):
+        """Extracted signals before their users, outputs last"""
+        ordered, seen = [], set()
+
+        def visit(name):
+            if name in seen:
+                return
+            seen.add(name)
+            for dependency in sorted(self._dependents(self.nodes[name])):
+                visit(dependency)
+            ordered.append(name)
+
+        for name in self.variable_of:
+            visit(name)
+        return ordered + self.outputs
+
+# Factoring ------------------------------------------------------------------------
+
+def factor(sop):
+    """Factored form of a SOP as ('lit', l) / ('const', v) / ('and' | 'or', [forms])"""
+    if not sop:
+        return ('const', 0)
+    if any(not cube for cube in sop):
+        return ('const', 1)
+    if len(sop) == 1:
+        literals = [('lit', literal) for literal in sorted(sop[0])]
+        return literals[0] if len(literals) == 1 else ('and', literals)
+    common = _common_cube(sop)
+    if common:
+        rest = factor([cube - common for cube in sop])
+        return ('and', [('lit', literal) for literal in sorted(common)] + [rest])
+    # Best proper kernel as divisor, by literals of q * d + r
+    best = None
+    for _, kernel in kernels(sop):
+        if len(kernel) == len(sop):
+            continue
+        quotient, remainder = divide(sop, kernel)
+        if quotient:
+            cost = sop_literals(quotient) + sop_literals(kernel) + sop_literals(remainder)
+            if best is None or cost < best[0]:
+                best = (cost, quotient, kernel, remainder)
+    if best is None:
+        # No kernel below the whole function: factor out the most frequent literal
+        counts = {}
+        for cube in sop:
+            for literal in cube:
+                counts[literal] = counts.get(literal, 0) + 1
+        literal, count = max(sorted(counts.items()), key=lambda item: item[1])
+        if count < 2:
+            return ('or', [factor([cube]) for cube in sop])
+        quotient = [cube - {literal} for cube in sop if literal in cube]
+        remainder = [cube for cube in sop if literal not in cube]
+        best = (0, quotient, [frozenset([literal])], remainder)
+    _, quotient, divisor, remainder = best
+    product = ('and', [factor(quotient), factor(divisor)])
+    return ('or', [product, factor(remainder)]) if remainder else product
+
+def form_literals(form):
+    """Literal count of a factored form"""
+    if form[0] == 'lit':
+        return 1
+    if form[0] == 'const':
+        return 0
+    return sum(form_literals(child) for child in form[1])
+
+def form_to_string(form, names):
+    if form[0] == 'lit':
+        return literal_name(form[1], names)
+    if form[0] == 'const':
+        return str(form[1])
+    parts = [form_to_string(child, names) for child in form[1]]
+    if form[0] == 'and':
+        return ''.join(part if child[0] != 'or' else f"({part})" for part, child in zip(parts, form[1]))
+    return ' + '.join(parts)
+
+# Network construction ----------------------------------------------------------------
+
+class _Builder:
+    """Adds factored forms to a LogicNetwork, combining the shallowest operands first"""
+
+    def __init__(self, network, max_fanin):
+        self.network = network
+        self.max_fanin = max_fanin
+        self.level = {}
+        self.signals = {}
+
+    def level_of(self, node):
+        if node not in self.level:
+            sources = self.network.fanins[node]
+            self.level[node] = 1 + max(self.level_of(s) for s in sources) if sources else 0
+        return self.level[node]
+
+    def combine(self, kind, nodes):
+        heap = [(self.level_of(node), node) for node in dict.fromkeys(nodes)]
+        heapq.heapify(heap)
+        while len(heap) > 1:
+            group = [heapq.heappop(heap)[1] for _ in range(min(self.max_fanin, len(heap)))]
+            node = self.network.add_gate(kind, group)
+            heapq.heappush(heap, (self.level_of(node), node))
+        return heap[0][1] if heap else self.network.constant(kind == AND)
+
+    def literal(self, literal):
+        node = self.signals[literal // 2]
+        return self.network.add_gate(NOT, [node]) if literal & 1 else node
+
+    def build(self, form):
+        if form[0] == 'lit':
+            return self.literal(form[1])
+        if form[0] == 'const':
+            return self.network.constant(form[1])
+        return self.combine(AND if form[0] == 'and' else OR, [self.build(child) for child in form[1]])
+
+def to_network(factored, forms, max_fanin=2):
+    """LogicNetwork of the factored forms, extracted signals as shared nodes"""
+    network = LogicNetwork()
+    builder = _Builder(network, max_fanin)
+    for index in range(factored.num_vars):
+        builder.signals[index] = network.add_input(factored.names[index])
+    for name in factored.order():
+        node = builder.build(forms[name])
+        if name in factored.variable_of:
+            builder.signals[factored.variable_of[name]] = node
+        else:
+            network.add_output(name, node)
+    return network
+
+def optimize(covers, num_vars=5, var_names=['M1', 'M0', 'C1', 'C0', 'D'], max_fanin=2):
+    """(FactoredNetwork, {node: factored form}, LogicNetwork) of a set of covers"""
+    factored = FactoredNetwork(covers, num_vars, var_names)
+    factored.extract_kernels()
+    factored.extract_cubes()
+    forms = {name: factor(sop) for name, sop in factored.nodes.items()}
+    return factored, forms, to_network(factored, forms, max_fanin)
+
+def main():
+    parser = argparse.ArgumentParser(description="Multi-level factoring of the minimized next-state logic")
+    parser.add_argument('--dont-cares', action='store_true', help="minimize with unsafe puzzle inputs as don't cares")
+    parser.add_argument('--puzzle', type=int, nargs=3, metavar=('M', 'C', 'K'),
+                        help="use the next-state functions of a generalized puzzle instead")
+    parser.add_argument('--max-fanin', type=int, default=2)
+    args = parser.parse_args()
+
+    if args.puzzle:
+        from puzzle_solver import Puzzle
+        puzzle = Puzzle(*args.puzzle)
+        solution = puzzle.solve()
+        if solution is None:
+            raise SystemExit("Puzzle instance has no solution")
+        spec = puzzle.next_state_functions(solution)
+        functions, dont_cares, num_vars, var_names = spec
+        title = f"M={args.puzzle[0]}, C={args.puzzle[1]}, boat={args.puzzle[2]}"
+    else:
+        functions, num_vars, var_names = NEXT_STATE_FUNCTIONS, 5, ['M1', 'M0', 'C1', 'C0', 'D']
+        dont_cares = illegal_puzzle_inputs() if args.dont_cares else ()
+        title = "3/3/2 next-state functions"
+
+    covers = {name: minimize(minterms, num_vars=num_vars, dont_cares=dont_cares)
+              for name, minterms in functions.items()}
+    flat = from_covers(covers, num_vars, var_names, args.max_fanin)
+    factored, forms, network = optimize(covers, num_vars, var_names, args.max_fanin)
+
+    print(f"MULTI-LEVEL FACTORING: {title}")
+    print("=" * 60)
+    for name in factored.order():
+        kind = "extracted" if name in factored.variable_of else "output"
+        print(f"{name:<20} = {form_to_string(forms[name], factored.names)}   [{kind}]")
+
+    sop_total = sum(cube_literal_count(cube, num_vars) for cover in covers.values() for cube in cover)
+    factored_total = sum(form_literals(form) for form in forms.values())
+    print(f"\n{'':<22} {'Literals':>9} {'Gates':>7} {'Levels':>7}")
+    print("-" * 48)
+    print(f"{'Two-level SOP':<22} {sop_total:>9} {flat.gate_count():>7} {flat.depth():>7}")
+    print(f"{'Factored, shared':<22} {factored_total:>9} {network.gate_count():>7} {network.depth():>7}")
+    print(f"Extracted signals: {len(factored.variable_of)}")
+
+    # Equivalence on the care set
+    care = ~TruthTable.from_minterms(num_vars, [], dont_cares).dc_bits
+    tables = network.truth_tables()
+    wrong = [name for name, minterms in functions.items()
+             if (tables[name].on_bits ^ TruthTable.from_minterms(num_vars, minterms).on_bits) & care]
+    print(f"Equivalence with the original functions: {'PASS' if not wrong else 'FAIL ' + ', '.join(wrong)}")
+
+if __name__ == "__main__":
+    main()
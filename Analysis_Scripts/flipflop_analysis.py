@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+
+# Flip-flop type comparison for the state register
+# Derives the D, T and JK excitation functions of every state bit from the
+# transition table, minimizes them with the shared engine (unreachable
+# states and JK's free inputs are don't cares) and compares the cost of
+# the input logic each flip-flop type needs.
+
+from boolean_minimizer import minimize, cover_statistics, cover_to_expression
+from generate_kmaps import STATE_TRANSITIONS, STATE_VAR_NAMES, reachable_states
+from truth_table import TruthTable
+
+FLIP_FLOP_TYPES = ['D', 'T', 'JK']
+
+def excitation_functions(flip_flop, transitions=STATE_TRANSITIONS, bits=4, reset_state=0):
+    """Excitation truth tables of every state bit for one flip-flop type
+
+    Returns a list of (input name, TruthTable) over the current-state bits.
+    D follows the next state, T is 1 when the bit toggles, and JK sets J
+    when a 0 must become 1 and K when a 1 must become 0 (the other input
+    of the pair is free).
+    """
+    reachable = reachable_states(transitions, reset_state)
+    unused = 0
+    for code in range(1 << bits):
+        if code not in reachable:
+            unused |= 1 << code
+
+    functions = []
+    for bit in range(bits - 1, -1, -1):
+        name = f"Q{bit}"
+        d_bits = t_bits = j_bits = k_bits = 0
+        j_free = k_free = 0
+        for state in reachable:
+            now = (state >> bit) & 1
+            after = (transitions[state] >> bit) & 1
+            d_bits |= after << state
+            t_bits |= (now ^ after) << state
+            if now:
+                j_free |= 1 << state
+                k_bits |= (1 - after) << state
+            else:
+                k_free |= 1 << state
+                j_bits |= after << state
+        if flip_flop == 'D':
+            functions.append((f"D{bit}", TruthTable(bits, d_bits, unused)))
+        elif flip_flop == 'T':
+            functions.append((f"T{bit}", TruthTable(bits, t_bits, unused)))
+        elif flip_flop == 'JK':
+            functions.append((f"J{bit}", TruthTable(bits, j_bits, unused | j_free)))
+            functions.append((f"K{bit}", TruthTable(bits, k_bits, unused | k_free)))
+        else:
+            raise ValueError(f"Unknown flip-flop type: {flip_flop} (expected one of {', '.join(FLIP_FLOP_TYPES)})")
+    return functions
+
+def flip_flop_cost(flip_flop, transitions=STATE_TRANSITIONS, bits=4, var_names=STATE_VAR_NAMES):
+    """Minimize every excitation function of a flip-flop type and total the cost
+
+    Inverters are counted once per complemented state bit, since all
+    excitation functions can share them.
+    """
+    functions = []
+    literals = gates = depth = 0
+    complemented = 0
+    for name, table in excitation_functions(flip_flop, transitions, bits):
+        cover = minimize(table, num_vars=bits)
+        stats = cover_statistics(cover, bits)
+        literals += stats['literals']
+        gates += stats['and_gates'] + stats['or_gates']
+        complemented |= stats['complemented_vars']
+        depth = max(depth, stats['depth'])
+        functions.append((name, cover_to_expression(cover, bits, var_names), stats))
+    inverters = complemented.bit_count()
+    return {
+        'functions': functions,
+        'literals': literals,
+        'gates': gates + inverters,
+        'inverters': inverters,
+        'depth': depth,
+    }
+
+def compare_flip_flops(transitions=STATE_TRANSITIONS, bits=4, var_names=STATE_VAR_NAMES):
+    """Print excitation logic and cost for D, T and JK and return the costs"""
+    print("FLIP-FLOP TYPE COMPARISON")
+    print("=" * 60)
+    costs = {}
+    for flip_flop in FLIP_FLOP_TYPES:
+        cost = flip_flop_cost(flip_flop, transitions, bits, var_names)
+        costs[flip_flop] = cost
+        print(f"\n{flip_flop} flip-flops:")
+        for name, expression, stats in cost['functions']:
+            print(f"  {name:<3} = {expression:<32} ({stats['literals']} literals, depth {stats['depth']})")
+
+    print("\n" + "=" * 60)
+    print(f"{'Type':<6} {'Literals':>9} {'Gates':>7} {'Inverters':>10} {'Depth':>7}")
+    print("-" * 43)
+    for flip_flop, cost in costs.items():
+        print(f"{flip_flop:<6} {cost['literals']:>9} {cost['gates']:>7} {cost['inverters']:>10} {cost['depth']:>7}")
+
+    cheapest = min(costs, key=lambda f: (costs[f]['gates'], costs[f]['literals'], costs[f]['depth']))
+    fastest = min(costs, key=lambda f: (costs[f]['depth'], costs[f]['gates'], costs[f]['literals']))
+    print(f"\nCheapest input logic: {cheapest} flip-flops ({costs[cheapest]['gates']} gates)")
+    print(f"Shallowest input logic: {fastest} flip-flops (depth {costs[fastest]['depth']})")
+    print("Note: JK flip-flops need two input networks per bit, so compare")
+    print("against the flip-flop cell cost of the target library as well.")
+    return costs
+
+if __name__ == "__main__":
+    compare_flip_flops()
@@ -3,11 +3,52 @@
 # Generate correct K-maps for the Missionary-Cannibal State Machine
 # This will give you the actual Boolean expressions for the flip-flops
 
-def print_kmap(minterms, title, variables=['Q3', 'Q2', 'Q1', 'Q0']):
-    """Print a K-map for 4 variables with the given minterms"""
+from boolean_minimizer import minimize, cover_statistics, cover_to_expression
+from truth_table import TruthTable, as_truth_table
+
+STATE_VAR_NAMES = ['Q3', 'Q2', 'Q1', 'Q0']
+
+# Define state transitions based on our design
+STATE_TRANSITIONS = {
+    0:  1,   # S0 (0000) -> S1 (0001)
+    1:  2,   # S1 (0001) -> S2 (0010)
+    2:  3,   # S2 (0010) -> S3 (0011)
+    3:  4,   # S3 (0011) -> S4 (0100)
+    4:  5,   # S4 (0100) -> S5 (0101)
+    5:  6,   # S5 (0101) -> S6 (0110)
+    6:  7,   # S6 (0110) -> S7 (0111)
+    7:  8,   # S7 (0111) -> S8 (1000)
+    8:  9,   # S8 (1000) -> S9 (1001)
+    9:  10,  # S9 (1001) -> S10 (1010)
+    10: 11,  # S10 (1010) -> S11 (1011)
+    11: 0,   # S11 (1011) -> S0 (0000) - Auto restart
+    # Unused states go to 0
+    12: 0, 13: 0, 14: 0, 15: 0
+}
+
+# Moore outputs for each state: (missionaries, cannibals, finished)
+STATE_OUTPUTS = {
+    0:  (3, 3, 0),  # S0: M=3, C=3, F=0
+    1:  (3, 1, 0),  # S1: M=3, C=1, F=0
+    2:  (3, 2, 0),  # S2: M=3, C=2, F=0
+    3:  (3, 0, 0),  # S3: M=3, C=0, F=0
+    4:  (3, 1, 0),  # S4: M=3, C=1, F=0
+    5:  (1, 1, 0),  # S5: M=1, C=1, F=0
+    6:  (2, 2, 0),  # S6: M=2, C=2, F=0
+    7:  (0, 2, 0),  # S7: M=0, C=2, F=0
+    8:  (0, 3, 0),  # S8: M=0, C=3, F=0
+    9:  (0, 1, 0),  # S9: M=0, C=1, F=0
+    10: (0, 2, 0),  # S10: M=0, C=2, F=0
+    11: (0, 0, 1),  # S11: M=0, C=0, F=1 (FINISHED!)
+}
+
+def print_kmap(minterms, title, variables=['Q3', 'Q2', 'Q1', 'Q0'], dont_cares=()):
+    """Print a K-map for 4 variables with the given minterms (X = don't care)"""
     print(f"\n{title}")
     print("=" * len(title))
     
+    table = as_truth_table(minterms, 4, dont_cares)
+    
     # Create 4x4 K-map
     kmap = [[0 for _ in range(4)] for _ in range(4)]
     
@@ -23,7 +64,7 @@ def print_kmap(minterms, title, variables=['Q3', 'Q2', 'Q1', 'Q0']):
         col_map = [0, 1, 3, 2]  # Gray code: 00,01,11,10
         col = col_map[(q1 << 1) | q0]  # Q1Q0 in Gray code
         
-        kmap[row][col] = 1 if minterm in minterms else 0
+        kmap[row][col] = table.value(minterm)
     
     # Print K-map
     print("      Q1Q0:  00  01  11  10")
@@ -35,38 +76,59 @@ def print_kmap(minterms, title, variables=['Q3', 'Q2', 'Q1', 'Q0']):
             print(f" {kmap[i][j]}  ", end="")
         print()
     
-    print(f"\nMinterms: {sorted(minterms)}")
+    print(f"\nMinterms: {table.minterms()}")
+    if table.dc_bits:
+        print(f"Don't cares: {table.dont_cares()}")
     return kmap
 
+def reachable_states(state_transitions, reset_state=0):
+    """States reachable from reset by following the transition table"""
+    reached = {reset_state}
+    frontier = [reset_state]
+    while frontier:
+        next_state = state_transitions[frontier.pop()]
+        if next_state not in reached:
+            reached.add(next_state)
+            frontier.append(next_state)
+    return reached
+
+def compare_dont_care_minimization(tables, dc_bits):
+    """Minimize each next-state table with and without the unreachable-state don't cares"""
+    print("\n" + "=" * 50)
+    print("MINIMIZATION WITH UNREACHABLE STATES AS DON'T CARES:")
+    print("=" * 50)
+    print(f"\n{'Output':<6} {'Terms':>11} {'Literals':>11} {'Depth':>9}   (without -> with)")
+    totals = [0, 0, 0, 0]
+    expressions = []
+    for name, table in tables.items():
+        full = minimize(TruthTable(4, table.on_bits), num_vars=4)
+        reduced = minimize(TruthTable(4, table.on_bits, dc_bits), num_vars=4)
+        before = cover_statistics(full, 4)
+        after = cover_statistics(reduced, 4)
+        print(f"{name:<6} {before['terms']:>4} -> {after['terms']:<4} {before['literals']:>4} -> {after['literals']:<4} "
+              f"{before['depth']:>3} -> {after['depth']}")
+        totals[0] += before['terms']
+        totals[1] += after['terms']
+        totals[2] += before['literals']
+        totals[3] += after['literals']
+        expressions.append((name, cover_to_expression(full, 4, STATE_VAR_NAMES),
+                            cover_to_expression(reduced, 4, STATE_VAR_NAMES)))
+    print(f"{'Total':<6} {totals[0]:>4} -> {totals[1]:<4} {totals[2]:>4} -> {totals[3]:<4}")
+    print("\nExpressions (unused states forced to 0 vs don't care):")
+    for name, without, with_dc in expressions:
+        print(f"  {name} = {without}")
+        print(f"  {name} = {with_dc}  (with don't cares)")
+
 def analyze_state_machine():
     """Analyze the state machine and generate K-maps for each flip-flop"""
     
     print("MISSIONARY-CANNIBAL STATE MACHINE ANALYSIS")
     print("=" * 50)
     
-    # Define state transitions based on our design
-    state_transitions = {
-        0:  1,   # S0 (0000) -> S1 (0001)
-        1:  2,   # S1 (0001) -> S2 (0010)
-        2:  3,   # S2 (0010) -> S3 (0011)
-        3:  4,   # S3 (0011) -> S4 (0100)
-        4:  5,   # S4 (0100) -> S5 (0101)
-        5:  6,   # S5 (0101) -> S6 (0110)
-        6:  7,   # S6 (0110) -> S7 (0111)
-        7:  8,   # S7 (0111) -> S8 (1000)
-        8:  9,   # S8 (1000) -> S9 (1001)
-        9:  10,  # S9 (1001) -> S10 (1010)
-        10: 11,  # S10 (1010) -> S11 (1011)
-        11: 0,   # S11 (1011) -> S0 (0000) - Auto restart
-        # Unused states go to 0
-        12: 0, 13: 0, 14: 0, 15: 0
-    }
-    
-    # Generate minterms for each flip-flop
-    q3_minterms = []
-    q2_minterms = []
-    q1_minterms = []
-    q0_minterms = []
+    state_transitions = STATE_TRANSITIONS
+    
+    # Generate packed next-state tables for each flip-flop
+    q3_bits = q2_bits = q1_bits = q0_bits = 0
     
     for current_state in range(16):
         next_state = state_transitions[current_state]
@@ -77,11 +139,23 @@ def analyze_state_machine():
         q1_next = (next_state >> 1) & 1
         q0_next = next_state & 1
         
-        # Add to minterm lists if the next state bit is 1
-        if q3_next: q3_minterms.append(current_state)
-        if q2_next: q2_minterms.append(current_state)
-        if q1_next: q1_minterms.append(current_state)
-        if q0_next: q0_minterms.append(current_state)
+        # Set the minterm bit if the next state bit is 1
+        q3_bits |= q3_next << current_state
+        q2_bits |= q2_next << current_state
+        q1_bits |= q1_next << current_state
+        q0_bits |= q0_next << current_state
+    
+    # States the counter can never reach from reset are free for minimization
+    reachable = reachable_states(state_transitions)
+    dc_bits = 0
+    for state in range(16):
+        if state not in reachable:
+            dc_bits |= 1 << state
+    
+    q3_minterms = TruthTable(4, q3_bits, dc_bits)
+    q2_minterms = TruthTable(4, q2_bits, dc_bits)
+    q1_minterms = TruthTable(4, q1_bits, dc_bits)
+    q0_minterms = TruthTable(4, q0_bits, dc_bits)
     
     # Print state transition table
     print("\nSTATE TRANSITION TABLE:")
@@ -91,6 +165,8 @@ def analyze_state_machine():
         current = i
         next_st = state_transitions[i]
         print(f"S{current:2d} ({current:04b}) | S{next_st:2d} ({next_st:04b}) | {current:04b} -> {next_st:04b}")
+    unreachable = [s for s in range(16) if s not in reachable]
+    print(f"Unreachable from reset (don't cares): {', '.join(f'S{s}' for s in unreachable)}")
     
     # Generate K-maps
     print_kmap(q3_minterms, "K-MAP FOR Q3+ (Next State of MSB)")
@@ -103,42 +179,31 @@ def analyze_state_machine():
     print("BOOLEAN EXPRESSIONS FOR FLIP-FLOP INPUTS:")
     print("=" * 50)
     
-    print(f"\nQ3+ minterms: {q3_minterms}")
+    print(f"\nQ3+ minterms: {q3_minterms.minterms()}")
     print("Q3+ = Q3'Q2Q1Q0 + Q3Q2'Q1' + Q3Q2'Q1Q0' + Q3Q2'Q1Q0")
     print("Simplified: Q3+ = Q3'Q2Q1Q0 + Q3Q2'(Q1' + Q1Q0' + Q1Q0)")
     print("Final: Q3+ = Q3'Q2Q1Q0 + Q3Q2'")
     
-    print(f"\nQ2+ minterms: {q2_minterms}")
+    print(f"\nQ2+ minterms: {q2_minterms.minterms()}")
     print("Q2+ = Q3'Q2'Q1Q0 + Q3'Q2Q1'Q0' + Q3'Q2Q1Q0' + Q3'Q2Q1Q0")
     print("Simplified: Q2+ = Q3'Q2'Q1Q0 + Q3'Q2Q1'")
     
-    print(f"\nQ1+ minterms: {q1_minterms}")
+    print(f"\nQ1+ minterms: {q1_minterms.minterms()}")
     print("Q1+ = Q3'Q2'Q1'Q0 + Q3'Q2'Q1Q0' + Q3'Q2Q1'Q0 + Q3'Q2Q1Q0' + Q3Q2'Q1' + Q3Q2'Q1Q0'")
     
-    print(f"\nQ0+ minterms: {q0_minterms}")
+    print(f"\nQ0+ minterms: {q0_minterms.minterms()}")
     print("Q0+ = Q3'Q2'Q1'Q0' + Q3'Q2'Q1Q0 + Q3'Q2Q1'Q0 + Q3'Q2Q1Q0 + Q3Q2'Q1'Q0 + Q3Q2'Q1Q0")
     print("Simplified: Q0+ = Q0' (alternating pattern)")
     
+    compare_dont_care_minimization({'Q3+': q3_minterms, 'Q2+': q2_minterms,
+                                    'Q1+': q1_minterms, 'Q0+': q0_minterms}, dc_bits)
+    
     # Output logic analysis
     print("\n" + "=" * 50)
     print("OUTPUT LOGIC (MOORE MACHINE):")
     print("=" * 50)
     
-    # Define outputs for each state
-    outputs = {
-        0:  (3, 3, 0),  # S0: M=3, C=3, F=0
-        1:  (3, 1, 0),  # S1: M=3, C=1, F=0
-        2:  (3, 2, 0),  # S2: M=3, C=2, F=0
-        3:  (3, 0, 0),  # S3: M=3, C=0, F=0
-        4:  (3, 1, 0),  # S4: M=3, C=1, F=0
-        5:  (1, 1, 0),  # S5: M=1, C=1, F=0
-        6:  (2, 2, 0),  # S6: M=2, C=2, F=0
-        7:  (0, 2, 0),  # S7: M=0, C=2, F=0
-        8:  (0, 3, 0),  # S8: M=0, C=3, F=0
-        9:  (0, 1, 0),  # S9: M=0, C=1, F=0
-        10: (0, 2, 0),  # S10: M=0, C=2, F=0
-        11: (0, 0, 1),  # S11: M=0, C=0, F=1 (FINISHED!)
-    }
+    outputs = STATE_OUTPUTS
     
     print("\nOUTPUT TABLE:")
     print("State | Q3Q2Q1Q0 | M1M0 | C1C0 | F")
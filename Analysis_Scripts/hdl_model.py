@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+
+# Cycle-accurate Python model of HDL_Code/missionary_cannibal_complete.v
+# The T flip-flop state register, the `started` latch and the output decode
+# are precomputed into lookup tables.  The scalar model steps one stream
+# through the tables; the batch model compiles each table column to a
+# minimized sum of products and steps thousands of independent streams at
+# once, bit-sliced: lane i of every stream lives in bit i of one Python
+# integer per signal, so a cycle costs a few dozen big-integer AND/ORs.
+
+import argparse
+import random
+import time
+from array import array
+
+from boolean_minimizer import minimize, cube_literal_count
+
+STATE_BITS = 4
+FINAL_STATE = 12  # S12 (1100): the solution is complete and the counter holds
+
+# Register word: started latch above the 4 state bits
+REGISTER_BITS = STATE_BITS + 1
+STARTED_BIT = 1 << STATE_BITS
+
+# Output ports of the module and their widths, in port order
+OUTPUT_PORTS = [
+    ('missionaries_left', 3), ('cannibals_left', 3),
+    ('missionaries_right', 3), ('cannibals_right', 3),
+    ('boat_side', 1), ('solution_complete', 1), ('valid_state', 1),
+]
+
+# Output decode case statement: state -> port values in OUTPUT_PORTS order
+STATE_DECODE = {
+    0:  (3, 3, 0, 0, 0, 0, 1),   # IDLE
+    1:  (3, 3, 0, 0, 0, 0, 1),   # S1
+    2:  (2, 2, 1, 1, 1, 0, 1),   # S2
+    3:  (3, 2, 0, 1, 0, 0, 1),   # S3
+    4:  (3, 0, 0, 3, 1, 0, 1),   # S4
+    5:  (3, 1, 0, 2, 0, 0, 1),   # S5
+    6:  (1, 1, 2, 2, 1, 0, 1),   # S6
+    7:  (2, 2, 1, 1, 0, 0, 1),   # S7
+    8:  (0, 2, 3, 1, 1, 0, 1),   # S8
+    9:  (0, 3, 3, 0, 0, 0, 1),   # S9
+    10: (0, 1, 3, 2, 1, 0, 1),   # S10
+    11: (0, 2, 3, 1, 0, 0, 1),   # S11
+    12: (0, 0, 3, 3, 1, 1, 1),   # S12
+}
+DEFAULT_DECODE = (0, 0, 0, 0, 0, 0, 0)
+
+def t_flip_flop_inputs(state, started):
+    """t_ff[3:0]: binary-counter toggles while started and not in S12"""
+    if not started or state == FINAL_STATE:
+        return 0
+    # Each bit toggles when all lower bits are 1, limited to the states the HDL lists
+    t = 0
+    if state <= 11:
+        t |= 1
+    if state in (1, 3, 5, 7, 9, 11):
+        t |= 2
+    if state in (3, 7, 11):
+        t |= 4
+    if state == 7:
+        t |= 8
+    return t
+
+def next_register(register, reset, start):
+    """Register word after one clock edge
+
+    The asynchronous reset is modelled at cycle granularity: a reset seen
+    in a cycle clears the state and the started latch at its edge.
+    """
+    if reset:
+        return 0
+    state, started = register & (STARTED_BIT - 1), register & STARTED_BIT
+    state ^= t_flip_flop_inputs(state, started)
+    if start:
+        started = STARTED_BIT
+    return started | state
+
+def _pack_outputs(values):
+    word = 0
+    for (_, width), value in zip(OUTPUT_PORTS, values):
+        word = (word << width) | value
+    return word
+
+# Index (register << 2) | (reset << 1) | start
+NEXT_REGISTER_LUT = array('B', (next_register(index >> 2, (index >> 1) & 1, index & 1)
+                                for index in range(1 << (REGISTER_BITS + 2))))
+OUTPUT_WIDTH = sum(width for _, width in OUTPUT_PORTS)
+OUTPUT_LUT = array('H', (_pack_outputs(STATE_DECODE.get(state, DEFAULT_DECODE))
+                         for state in range(1 << STATE_BITS)))
+
+def decode_outputs(state):
+    """Output port values of a state as a dict"""
+    word = OUTPUT_LUT[state]
+    values = {}
+    shift = OUTPUT_WIDTH
+    for name, width in OUTPUT_PORTS:
+        shift -= width
+        values[name] = (word >> shift) & ((1 << width) - 1)
+    return values
+
+def simulate(stimulus, register=0):
+    """Scalar model: yield (state, started, outputs) after each (reset, start) cycle"""
+    for reset, start in stimulus:
+        register = NEXT_REGISTER_LUT[(register << 2) | (reset << 1) | start]
+        state = register & (STARTED_BIT - 1)
+        yield state, register >> STATE_BITS, decode_outputs(state)
+
+# Bit-sliced batch model ----------------------------------------------------
+
+def _column_cover(lut, bit, num_vars):
+    """Minimized cover of one output bit of a lookup table"""
+    return minimize([index for index, word in enumerate(lut) if (word >> bit) & 1], num_vars=num_vars)
+
+def _evaluate_cover(cover, planes, inverted, num_vars, ones):
+    result = 0
+    for value, mask in cover:
+        term = ones
+        for index in range(num_vars):
+            position = num_vars - 1 - index
+            if not (mask >> position) & 1:
+                term &= planes[index] if (value >> position) & 1 else inverted[index]
+        result |= term
+    return result
+
+class BatchSimulator:
+    """Steps many independent reset/start streams of the model in parallel
+
+    Lane i of every signal is bit i of one integer.  Next-state and output
+    logic are the lookup tables above, compiled to sum-of-products covers.
+    """
+
+    # Lookup-table inputs, most significant first
+    _NEXT_INPUTS = REGISTER_BITS + 2
+
+    def __init__(self, lanes):
+        self.lanes = lanes
+        self.ones = (1 << lanes) - 1
+        # register[0] is the started latch, register[1:] are state[3:0]
+        self.register = [0] * REGISTER_BITS
+        self.cycles = 0
+        self._next_covers = [_column_cover(NEXT_REGISTER_LUT, bit, self._NEXT_INPUTS)
+                             for bit in range(REGISTER_BITS - 1, -1, -1)]
+        self._output_covers = [_column_cover(OUTPUT_LUT, bit, STATE_BITS)
+                               for bit in range(OUTPUT_WIDTH - 1, -1, -1)]
+
+    def reset(self):
+        self.register = [0] * REGISTER_BITS
+        self.cycles = 0
+
+    def step(self, reset_word, start_word):
+        """Advance every lane by one clock edge; bit i of each word drives lane i"""
+        planes = self.register + [reset_word, start_word]
+        inverted = [self.ones & ~plane for plane in planes]
+        self.register = [_evaluate_cover(cover, planes, inverted, self._NEXT_INPUTS, self.ones)
+                         for cover in self._next_covers]
+        self.cycles += 1
+
+    def run(self, stimulus):
+        """Step through an iterable of (reset_word, start_word) pairs"""
+        for reset_word, start_word in stimulus:
+            self.step(reset_word, start_word)
+
+    def state_planes(self):
+        """state[3:0] as bit planes, MSB first"""
+        return self.register[1:]
+
+    def outputs(self):
+        """Output ports as {name: [bit planes, MSB first]}"""
+        planes = self.state_planes()
+        inverted = [self.ones & ~plane for plane in planes]
+        bits = [_evaluate_cover(cover, planes, inverted, STATE_BITS, self.ones) for cover in self._output_covers]
+        ports = {}
+        for name, width in OUTPUT_PORTS:
+            ports[name], bits = bits[:width], bits[width:]
+        return ports
+
+    def lane_state(self, lane):
+        """(state, started) of one lane"""
+        state = 0
+        for plane in self.state_planes():
+            state = (state << 1) | ((plane >> lane) & 1)
+        return state, (self.register[0] >> lane) & 1
+
+    def lanes_in_state(self, state):
+        """Bit mask of the lanes currently in a state"""
+        mask = self.ones
+        for index, plane in enumerate(self.state_planes()):
+            mask &= plane if (state >> (STATE_BITS - 1 - index)) & 1 else self.ones & ~plane
+        return mask
+
+def _bernoulli_word(rng, lanes, probability, precision=16):
+    """Random word whose bits are independently 1 with the given probability"""
+    digits = int(probability * (1 << precision))
+    word = 0
+    # Fold in random words from the least significant binary digit upwards
+    for i in range(precision):
+        r = rng.getrandbits(lanes)
+        word = (word | r) if (digits >> i) & 1 else (word & r)
+    return word
+
+def random_stimulus(lanes, cycles, reset_rate=1 / 64, start_rate=1 / 8, seed=0):
+    """Yield (reset_word, start_word) for randomized reset/start streams
+
+    Every lane is held in reset on the first cycle.
+    """
+    rng = random.Random(seed)
+    ones = (1 << lanes) - 1
+    for cycle in range(cycles):
+        reset_word = ones if cycle == 0 else _bernoulli_word(rng, lanes, reset_rate)
+        yield reset_word, _bernoulli_word(rng, lanes, start_rate)
+
+def _lane_stream(stimulus, lane):
+    return [((r >> lane) & 1, (s >> lane) & 1) for r, s in stimulus]
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk randomized simulation of missionary_cannibal_complete")
+    parser.add_argument('--lanes', type=int, default=4096, help="independent stimulus streams")
+    parser.add_argument('--cycles', type=int, default=2000)
+    parser.add_argument('--reset-rate', type=float, default=1 / 64)
+    parser.add_argument('--start-rate', type=float, default=1 / 8)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    print("COMPILED MODEL: missionary_cannibal_complete")
+    print("=" * 60)
+    simulator = BatchSimulator(args.lanes)
+    literals = sum(cube_literal_count(cube, BatchSimulator._NEXT_INPUTS) for cover in simulator._next_covers for cube in cover)
+    print(f"Next-state logic: {sum(len(c) for c in simulator._next_covers)} product terms, {literals} literals")
+
+    # Cross-check a few lanes against the scalar lookup-table model
+    check_cycles = min(args.cycles, 300)
+    stimulus = list(random_stimulus(args.lanes, check_cycles, args.reset_rate, args.start_rate, args.seed))
+    simulator.run(stimulus)
+    mismatches = 0
+    for lane in range(0, args.lanes, max(1, args.lanes // 16)):
+        *_, (state, started, _) = simulate(_lane_stream(stimulus, lane))
+        if simulator.lane_state(lane) != (state, started):
+            mismatches += 1
+    print(f"Batch vs scalar model after {check_cycles} cycles: "
+          f"{'MATCH' if mismatches == 0 else f'{mismatches} lanes differ'}")
+
+    # Randomized regression
+    simulator.reset()
+    began = time.perf_counter()
+    completed = invalid = 0
+    for reset_word, start_word in random_stimulus(args.lanes, args.cycles, args.reset_rate, args.start_rate, args.seed + 1):
+        simulator.step(reset_word, start_word)
+        completed |= simulator.lanes_in_state(FINAL_STATE)
+        invalid |= simulator.outputs()['valid_state'][0] ^ simulator.ones
+    elapsed = time.perf_counter() - began
+    lane_cycles = args.lanes * args.cycles
+    print(f"\nSimulated {args.lanes} lanes x {args.cycles} cycles = {lane_cycles:,} lane-cycles "
+          f"in {elapsed:.2f}s ({lane_cycles / elapsed / 1e6:.1f}M cycles/s)")
+    print(f"Lanes that reached S12 (solution complete): {completed.bit_count()} of {args.lanes}")
+    print(f"Lanes that ever left the valid states: {invalid.bit_count()}")
+    print(f"Final state histogram: " +
+          ', '.join(f"S{s}: {simulator.lanes_in_state(s).bit_count()}" for s in range(1 << STATE_BITS)
+                    if simulator.lanes_in_state(s)))
+
+if __name__ == "__main__":
+    main()
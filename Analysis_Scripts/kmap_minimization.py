@@ -3,7 +3,9 @@
 # Detailed K-map analysis for manual minimization
 # Missionary-Cannibal Logic Design Project
 
-def print_detailed_kmap(minterms, output_name):
+from truth_table import TruthTable, as_truth_table
+
+def print_detailed_kmap(minterms, output_name, dont_cares=()):
     """Create detailed K-map with minterm numbers for manual analysis"""
     print(f"\n{'='*60}")
     print(f"DETAILED K-MAP ANALYSIS: {output_name}")
@@ -15,6 +17,8 @@ def print_detailed_kmap(minterms, output_name):
     print("Variables: M1 M0 C1 C0 D")
     print("Arrangement: M1M0 (rows) × C1C0D (columns)\n")
     
+    table = as_truth_table(minterms, 5, dont_cares)
+    
     # Initialize K-map with minterm numbers
     kmap_values = [[0 for _ in range(8)] for _ in range(4)]
     kmap_minterms = [[0 for _ in range(8)] for _ in range(4)]
@@ -30,11 +34,11 @@ def print_detailed_kmap(minterms, output_name):
         row = (m1 << 1) | m0  # M1M0
         col = (c1 << 2) | (c0 << 1) | d  # C1C0D
         
-        kmap_values[row][col] = 1 if minterm in minterms else 0
+        kmap_values[row][col] = table.value(minterm)
         kmap_minterms[row][col] = minterm
     
     # Print K-map with values
-    print("K-Map with Values (1 = minterm included, 0 = not included):")
+    print("K-Map with Values (1 = minterm included, 0 = not included, X = don't care):")
     print("      C1C0D:  000 001 010 011 100 101 110 111")
     print("M1M0")
     for i, row_label in enumerate(['00', '01', '10', '11']):
@@ -75,9 +79,12 @@ def identify_groupings(kmap_values, output_name):
     print("-" * 40)
     
     # Count 1's in the K-map
-    total_ones = sum(sum(row) for row in kmap_values)
+    total_ones = sum(row.count(1) for row in kmap_values)
+    total_dont_cares = sum(row.count('X') for row in kmap_values)
     print(f"Total 1's in K-map: {total_ones} out of 32")
     print(f"Percentage coverage: {total_ones/32*100:.1f}%")
+    if total_dont_cares:
+        print(f"Don't cares available for grouping: {total_dont_cares}")
     
     # Suggest grouping strategy
     if total_ones > 16:
@@ -98,13 +105,13 @@ def identify_groupings(kmap_values, output_name):
     
     # Check rows
     for i, row in enumerate(kmap_values):
-        ones_count = sum(row)
+        ones_count = row.count(1)
         if ones_count >= 6:  # Most of row is 1
             print(f"- Row {i} has {ones_count}/8 ones - consider row-based grouping")
     
     # Check columns
     for j in range(8):
-        col_ones = sum(kmap_values[i][j] for i in range(4))
+        col_ones = sum(1 for i in range(4) if kmap_values[i][j] == 1)
         if col_ones >= 3:  # Most of column is 1
             print(f"- Column {j} has {col_ones}/4 ones - consider column-based grouping")
 
@@ -119,6 +126,7 @@ def suggest_minimization_steps(output_name):
     print("   - Finally groups of 2")
     print("\n2. ENSURE ALL 1's ARE COVERED:")
     print("   - Each 1 must be in at least one group")
+    print("   - X cells (don't cares) may join a group when it makes the group larger")
     print("   - Overlapping groups are allowed and often beneficial")
     print("\n3. WRITE BOOLEAN EXPRESSIONS:")
     print("   - Each group becomes a product term")
@@ -141,7 +149,8 @@ def main():
     }
     
     for output_name, minterms in functions.items():
-        kmap_values, kmap_minterms = print_detailed_kmap(minterms, output_name)
+        table = TruthTable.from_minterms(5, minterms)
+        kmap_values, kmap_minterms = print_detailed_kmap(table, output_name)
         identify_groupings(kmap_values, output_name)
         suggest_minimization_steps(output_name)
         print("\n" + "="*80 + "\n")
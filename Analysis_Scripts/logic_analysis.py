@@ -6,6 +6,8 @@
 import itertools
 from collections import defaultdict
 
+from truth_table import TruthTable, as_truth_table
+
 def generate_truth_table():
     """Generate complete truth table from the original Verilog implementation"""
     
@@ -15,6 +17,12 @@ def generate_truth_table():
     cannibal_next_1_minterms = [0,1,2,3,4,6,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,25,26,28,30]
     cannibal_next_0_minterms = [0,1,3,4,6,7,8,9,11,12,13,14,15,16,17,18,19,20,22,23,24,25,27,28,30,31]
     
+    # Packed tables give O(1) membership per cell
+    missionary_next_0 = TruthTable.from_minterms(5, missionary_next_0_minterms)
+    missionary_next_1 = TruthTable.from_minterms(5, missionary_next_1_minterms)
+    cannibal_next_1 = TruthTable.from_minterms(5, cannibal_next_1_minterms)
+    cannibal_next_0 = TruthTable.from_minterms(5, cannibal_next_0_minterms)
+    
     print("TRUTH TABLE FOR MISSIONARY-CANNIBAL PROBLEM")
     print("=" * 80)
     print(f"{'Minterm':<8} {'M1':<3} {'M0':<3} {'C1':<3} {'C0':<3} {'Dir':<3} | {'M_next[1]':<8} {'M_next[0]':<8} {'C_next[1]':<8} {'C_next[0]':<8}")
@@ -31,10 +39,10 @@ def generate_truth_table():
         direction = minterm & 1
         
         # Calculate outputs based on minterm membership
-        mn1 = 1 if minterm in missionary_next_1_minterms else 0
-        mn0 = 1 if minterm in missionary_next_0_minterms else 0
-        cn1 = 1 if minterm in cannibal_next_1_minterms else 0
-        cn0 = 1 if minterm in cannibal_next_0_minterms else 0
+        mn1 = 1 if minterm in missionary_next_1 else 0
+        mn0 = 1 if minterm in missionary_next_0 else 0
+        cn1 = 1 if minterm in cannibal_next_1 else 0
+        cn0 = 1 if minterm in cannibal_next_0 else 0
         
         truth_table.append((minterm, m1, m0, c1, c0, direction, mn1, mn0, cn1, cn0))
         
@@ -42,14 +50,16 @@ def generate_truth_table():
     
     return truth_table
 
-def create_kmap_display(minterms, output_name):
-    """Create a visual K-map display for 5-variable function"""
+def create_kmap_display(minterms, output_name, dont_cares=()):
+    """Create a visual K-map display for 5-variable function (X = don't care)"""
     print(f"\nK-MAP FOR {output_name}")
     print("=" * 50)
     print("5-variable K-map: M1 M0 C1 C0 Dir")
     print("Arranged as: M1M0\\C1C0Dir")
     print()
     
+    table = as_truth_table(minterms, 5, dont_cares)
+    
     # Create 5-variable K-map structure
     # We'll use a 4x8 arrangement: M1M0 (rows) x C1C0Dir (columns)
     kmap = [[0 for _ in range(8)] for _ in range(4)]
@@ -65,7 +75,7 @@ def create_kmap_display(minterms, output_name):
         row = (m1 << 1) | m0  # M1M0
         col = (c1 << 2) | (c0 << 1) | direction  # C1C0Dir
         
-        kmap[row][col] = 1 if minterm in minterms else 0
+        kmap[row][col] = table.value(minterm)
     
     # Display the K-map
     print("     C1C0Dir: 000 001 010 011 100 101 110 111")
@@ -77,8 +87,10 @@ def create_kmap_display(minterms, output_name):
         print()
     
     # List the minterms
-    print(f"\nMinterms for {output_name}: {sorted(minterms)}")
-    print(f"Total minterms: {len(minterms)} out of 32")
+    print(f"\nMinterms for {output_name}: {table.minterms()}")
+    print(f"Total minterms: {table.count()} out of 32")
+    if table.dc_bits:
+        print(f"Don't cares for {output_name}: {table.dont_cares()}")
     
     return kmap
 
@@ -108,13 +120,13 @@ def find_prime_implicants(minterms):
     
     return groups
 
-def analyze_boolean_function(minterms, output_name):
+def analyze_boolean_function(minterms, output_name, dont_cares=()):
     """Analyze and suggest Boolean function simplification"""
     print(f"\nBOOLEAN FUNCTION ANALYSIS FOR {output_name}")
     print("=" * 60)
     
     # Create K-map
-    kmap = create_kmap_display(minterms, output_name)
+    kmap = create_kmap_display(minterms, output_name, dont_cares)
     
     # Find prime implicants
     groups = find_prime_implicants(minterms)
@@ -160,10 +172,10 @@ def main():
     
     # Analyze each output
     functions = [
-        (missionary_next_1_minterms, "MISSIONARY_NEXT[1]"),
-        (missionary_next_0_minterms, "MISSIONARY_NEXT[0]"),
-        (cannibal_next_1_minterms, "CANNIBAL_NEXT[1]"),
-        (cannibal_next_0_minterms, "CANNIBAL_NEXT[0]")
+        (TruthTable.from_minterms(5, missionary_next_1_minterms), "MISSIONARY_NEXT[1]"),
+        (TruthTable.from_minterms(5, missionary_next_0_minterms), "MISSIONARY_NEXT[0]"),
+        (TruthTable.from_minterms(5, cannibal_next_1_minterms), "CANNIBAL_NEXT[1]"),
+        (TruthTable.from_minterms(5, cannibal_next_0_minterms), "CANNIBAL_NEXT[0]")
     ]
     
     for minterms, name in functions:
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+
+# Multi-level gate netlist shared by the timing, factoring and mapping scripts
+# Nodes are appended after their fan-ins, so node order is always a valid
+# topological order and every pass is a single linear sweep.  Gates are
+# structurally hashed: building the same AND/OR/NOT twice returns the
+# existing node, so product terms and inverters shared between outputs are
+# built once.
+
+from truth_table import TruthTable, variable_bits
+
+INPUT, CONST0, CONST1, NOT, AND, OR = 'INPUT', 'CONST0', 'CONST1', 'NOT', 'AND', 'OR'
+GATE_KINDS = (NOT, AND, OR)
+
+class LogicNetwork:
+    """Directed acyclic network of NOT and n-input AND/OR gates"""
+
+    def __init__(self):
+        self.kinds = []
+        self.fanins = []
+        self.names = []
+        self.inputs = []
+        self.outputs = {}
+        self._hash = {}
+
+    def __len__(self):
+        return len(self.kinds)
+
+    def _add(self, kind, fanins, name=None):
+        self.kinds.append(kind)
+        self.fanins.append(tuple(fanins))
+        self.names.append(name)
+        return len(self.kinds) - 1
+
+    def add_input(self, name):
+        node = self._add(INPUT, (), name)
+        self.inputs.append(node)
+        return node
+
+    def constant(self, value):
+        key = (CONST1 if value else CONST0, ())
+        if key not in self._hash:
+            self._hash[key] = self._add(key[0], ())
+        return self._hash[key]
+
+    def add_gate(self, kind, fanins):
+        """Node for kind(fanins), reusing an identical gate and folding trivial cases"""
+        if kind == NOT:
+            (source,) = fanins
+            if self.kinds[source] == NOT:
+                return self.fanins[source][0]
+            if self.kinds[source] in (CONST0, CONST1):
+                return self.constant(self.kinds[source] == CONST0)
+            key = (NOT, (source,))
+        else:
+            identity, absorbing = (CONST1, CONST0) if kind == AND else (CONST0, CONST1)
+            unique = []
+            for source in fanins:
+                if self.kinds[source] == absorbing:
+                    return source
+                if self.kinds[source] != identity and source not in unique:
+                    unique.append(source)
+            if not unique:
+                return self.constant(identity == CONST1)
+            if len(unique) == 1:
+                return unique[0]
+            key = (kind, tuple(sorted(unique)))
+        if key not in self._hash:
+            self._hash[key] = self._add(kind, key[1])
+        return self._hash[key]
+
+    def add_tree(self, kind, fanins, max_fanin=2):
+        """Balanced tree of gates with at most max_fanin inputs each"""
+        fanins = list(dict.fromkeys(fanins))
+        if len(fanins) <= max_fanin:
+            return self.add_gate(kind, fanins)
+        level = fanins
+        while len(level) > 1:
+            level = [self.add_gate(kind, level[i:i + max_fanin]) for i in range(0, len(level), max_fanin)]
+        return level[0]
+
+    def add_output(self, name, node):
+        self.outputs[name] = node
+
+    # Structure -----------------------------------------------------------------
+
+    def gates(self):
+        """Node ids of the logic gates in topological order"""
+        return [node for node, kind in enumerate(self.kinds) if kind in GATE_KINDS]
+
+    def live_nodes(self):
+        """Nodes in the transitive fan-in of some output"""
+        live = bytearray(len(self))
+        for node in self.outputs.values():
+            live[node] = 1
+        for node in range(len(self) - 1, -1, -1):
+            if live[node]:
+                for source in self.fanins[node]:
+                    live[source] = 1
+        return live
+
+    def gate_count(self, kind=None):
+        """Number of live gates, optionally of one kind"""
+        live = self.live_nodes()
+        return sum(1 for node in self.gates() if live[node] and (kind is None or self.kinds[node] == kind))
+
+    def gate_inputs(self):
+        """Total fan-in of the live gates (a literal-count style area measure)"""
+        live = self.live_nodes()
+        return sum(len(self.fanins[node]) for node in self.gates() if live[node])
+
+    def fanout_counts(self):
+        """Number of live gate inputs and outputs each node drives"""
+        live = self.live_nodes()
+        counts = [0] * len(self)
+        for node in range(len(self)):
+            if live[node]:
+                for source in self.fanins[node]:
+                    counts[source] += 1
+        for node in self.outputs.values():
+            counts[node] += 1
+        return counts
+
+    def levels(self):
+        """Logic level of every node (inputs and constants are level 0)"""
+        level = [0] * len(self)
+        for node, sources in enumerate(self.fanins):
+            if sources:
+                level[node] = 1 + max(level[source] for source in sources)
+        return level
+
+    def depth(self, output=None):
+        """Gate levels on the longest path to one output or to any output"""
+        level = self.levels()
+        if output is not None:
+            return level[self.outputs[output]]
+        return max((level[node] for node in self.outputs.values()), default=0)
+
+    def node_label(self, node):
+        kind = self.kinds[node]
+        if kind == INPUT:
+            return self.names[node]
+        if kind in (CONST0, CONST1):
+            return kind[-1]
+        return f"{kind}{len(self.fanins[node]) if kind != NOT else ''}#{node}"
+
+    # Simulation ------------------------------------------------------------------
+
+    def truth_tables(self):
+        """{output: TruthTable} by word-parallel simulation over all input combinations"""
+        num_vars = len(self.inputs)
+        full = (1 << (1 << num_vars)) - 1
+        values = [0] * len(self)
+        for index, node in enumerate(self.inputs):
+            values[node] = variable_bits(num_vars, index)
+        for node, kind in enumerate(self.kinds):
+            sources = self.fanins[node]
+            if kind == CONST1:
+                values[node] = full
+            elif kind == NOT:
+                values[node] = full & ~values[sources[0]]
+            elif kind == AND:
+                value = full
+                for source in sources:
+                    value &= values[source]
+                values[node] = value
+            elif kind == OR:
+                value = 0
+                for source in sources:
+                    value |= values[source]
+                values[node] = value
+        return {name: TruthTable(num_vars, values[node]) for name, node in self.outputs.items()}
+
+def _literal_nodes(network, input_nodes, value, mask, num_vars):
+    literals = []
+    for index in range(num_vars):
+        position = num_vars - 1 - index
+        if not (mask >> position) & 1:
+            node = input_nodes[index]
+            literals.append(node if (value >> position) & 1 else network.add_gate(NOT, [node]))
+    return literals
+
+def from_covers(covers, num_vars=5, var_names=['M1', 'M0', 'C1', 'C0', 'D'], max_fanin=2):
+    """Two-level network of {output: cover}, AND/OR trees limited to max_fanin inputs"""
+    network = LogicNetwork()
+    input_nodes = [network.add_input(name) for name in var_names[:num_vars]]
+    for name, cover in covers.items():
+        terms = [network.add_tree(AND, _literal_nodes(network, input_nodes, value, mask, num_vars), max_fanin)
+                 for value, mask in cover]
+        network.add_output(name, network.add_tree(OR, terms, max_fanin) if terms else network.constant(0))
+    return network
+
+def from_minterms(functions, num_vars=5, var_names=['M1', 'M0', 'C1', 'C0', 'D'], max_fanin=2):
+    """Canonical sum-of-minterms network of {output: minterm list}"""
+    return from_covers({name: [(m, 0) for m in minterms] for name, minterms in functions.items()},
+                       num_vars, var_names, max_fanin)
@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+
+# Cut-enumeration k-LUT technology mapper
+# Every node of a logic_network gets its k-feasible cuts (sets of at most k
+# nodes that separate it from the inputs), merged bottom-up from its
+# fan-ins; by default every cut is kept, which makes the depth mapping
+# optimal, and priority-cut pruning is available for larger networks.
+# While cuts are enumerated each node is labelled with the cut of least
+# LUT level; area recovery then re-chooses cuts by area flow and by exact
+# area, never letting a node arrive later than the depth mapping requires.  Inverters are absorbed
+# into the LUTs, as on an FPGA.
+
+import argparse
+from collections import namedtuple
+
+from boolean_minimizer import NEXT_STATE_FUNCTIONS, minimize, illegal_puzzle_inputs
+from logic_network import from_covers, from_minterms, INPUT, CONST0, CONST1, NOT, AND
+from truth_table import variable_bits
+
+# Priority cuts kept per node; 0 keeps every cut, the only setting under
+# which the mapping is guaranteed depth-optimal for the subject graph
+MAX_CUTS = 0
+
+LutMapping = namedtuple('LutMapping', ['k', 'cuts', 'depth', 'luts'])
+
+def _is_leaf(network, node):
+    return network.kinds[node] in (INPUT, CONST0, CONST1)
+
+def enumerate_cuts(network, k, max_cuts=MAX_CUTS, rank=None, label=None):
+    """Priority cuts of every node as lists of sorted tuples, trivial cut last
+
+    rank(node, cut) orders the non-trivial cuts; only the best max_cuts
+    (all of them if max_cuts is 0) are kept for merging at the fan-outs.  label(node, cuts) is called as soon
+    as a node's cuts are final, so ranks can depend on fan-in labels.
+    """
+    cuts = [None] * len(network)
+    for node in range(len(network)):
+        if _is_leaf(network, node):
+            cuts[node] = [(node,)]
+            continue
+        merged = {()}
+        for source in network.fanins[node]:
+            merged = {tuple(sorted(set(a) | set(b))) for a in merged for b in cuts[source]}
+            merged = {cut for cut in merged if len(cut) <= k}
+        # Drop cuts that contain a smaller cut of the same node
+        candidates = sorted(merged, key=len)
+        kept = []
+        for cut in candidates:
+            leaves = set(cut)
+            if not any(leaves.issuperset(other) for other in kept):
+                kept.append(cut)
+        if rank is not None:
+            kept.sort(key=lambda cut: rank(node, cut))
+        cuts[node] = (kept[:max_cuts] if max_cuts else kept) + [(node,)]
+        if label is not None:
+            label(node, cuts[node][:-1])
+    return cuts
+
+class _Mapper:
+    def __init__(self, network, k, max_cuts):
+        self.network = network
+        self.k = k
+        self.fanout = [max(1, count) for count in network.fanout_counts()]
+        self.arrival = [0] * len(network)
+        self.flow = [0.0] * len(network)
+        self.choice = [None] * len(network)
+        self.cuts = enumerate_cuts(network, k, max_cuts, rank=self._depth_rank, label=self._depth_label)
+
+    # Costs ------------------------------------------------------------------------
+
+    def _cut_arrival(self, cut):
+        return 1 + max((self.arrival[leaf] for leaf in cut), default=0)
+
+    def _cut_flow(self, cut):
+        return 1 + sum(self.flow[leaf] / self.fanout[leaf] for leaf in cut)
+
+    def _depth_rank(self, node, cut):
+        # Called while cuts are enumerated, so leaf labels are already final
+        return (self._cut_arrival(cut), self._cut_flow(cut), len(cut))
+
+    def _depth_label(self, node, cuts):
+        """Depth pass: the least-level cut (ranked first), recorded during enumeration"""
+        self._record(node, cuts[0])
+
+    def _candidates(self, node):
+        return self.cuts[node][:-1]
+
+    def _record(self, node, cut):
+        self.choice[node] = cut
+        self.arrival[node] = self._cut_arrival(cut)
+        self.flow[node] = self._cut_flow(cut)
+
+    # Passes ---------------------------------------------------------------------------
+
+    def mapped(self):
+        """Nodes implemented as LUTs by the current choices"""
+        used = set()
+        stack = [node for node in self.network.outputs.values() if not _is_leaf(self.network, node)]
+        while stack:
+            node = stack.pop()
+            if node in used:
+                continue
+            used.add(node)
+            stack += [leaf for leaf in self.choice[node] if not _is_leaf(self.network, leaf)]
+        return used
+
+    def required_times(self, target):
+        required = [float('inf')] * len(self.network)
+        for node in self.network.outputs.values():
+            required[node] = target
+        used = self.mapped()
+        for node in range(len(self.network) - 1, -1, -1):
+            if node in used:
+                for leaf in self.choice[node]:
+                    required[leaf] = min(required[leaf], required[node] - 1)
+        return required
+
+    def area_flow_pass(self, target):
+        required = self.required_times(target)
+        for node in range(len(self.network)):
+            if _is_leaf(self.network, node):
+                continue
+            feasible = [cut for cut in self._candidates(node) if self._cut_arrival(cut) <= required[node]]
+            # The previous choice stays feasible, so the list is never empty for mapped nodes
+            self._record(node, min(feasible or self._candidates(node),
+                                   key=lambda cut: (self._cut_flow(cut), self._cut_arrival(cut))))
+
+    def _reference(self, cut, references, sign):
+        """Add (sign=1) or remove (sign=-1) a cut's leaves; LUTs that come or go with it"""
+        area = 0
+        for leaf in cut:
+            if _is_leaf(self.network, leaf):
+                continue
+            references[leaf] += sign
+            if references[leaf] == (1 if sign > 0 else 0):
+                area += 1 + self._reference(self.choice[leaf], references, sign)
+        return area
+
+    def exact_area_pass(self, target):
+        required = self.required_times(target)
+        used = self.mapped()
+        references = [0] * len(self.network)
+        for node in self.network.outputs.values():
+            references[node] += 1
+        for node in used:
+            for leaf in self.choice[node]:
+                references[leaf] += 1
+        for node in range(len(self.network)):
+            if _is_leaf(self.network, node):
+                continue
+            if references[node] == 0:
+                # Not in the mapping: keep a good cut for fan-outs that may start using it
+                feasible = [cut for cut in self._candidates(node) if self._cut_arrival(cut) <= required[node]]
+                self._record(node, min(feasible or self._candidates(node), key=self._cut_flow))
+                continue
+            self._reference(self.choice[node], references, -1)
+            best = None
+            for cut in self._candidates(node):
+                if self._cut_arrival(cut) > required[node]:
+                    continue
+                area = self._reference(cut, references, 1)
+                self._reference(cut, references, -1)
+                if best is None or (area, self._cut_arrival(cut)) < best[0]:
+                    best = ((area, self._cut_arrival(cut)), cut)
+            self._record(node, best[1])
+            self._reference(best[1], references, 1)
+
+def map_luts(network, k=6, max_cuts=MAX_CUTS, area_passes=2):
+    """k-LUT mapping of least depth followed by area recovery
+
+    The depth is optimal for the subject graph when max_cuts is 0; with
+    priority cuts a node's least-depth cut may be pruned away.
+    """
+    if not 2 <= k <= 8:
+        raise ValueError("LUT size must be between 2 and 8 inputs")
+    mapper = _Mapper(network, k, max_cuts)
+    depth = max((mapper.arrival[node] for node in network.outputs.values()), default=0)
+    for _ in range(area_passes):
+        mapper.area_flow_pass(depth)
+    mapper.exact_area_pass(depth)
+    luts = {node: mapper.choice[node] for node in sorted(mapper.mapped())}
+    depth = max((mapper.arrival[node] for node in network.outputs.values()), default=0)
+    return LutMapping(k, mapper.cuts, depth, luts)
+
+def lut_function(network, node, cut):
+    """Packed truth table of a LUT over its cut leaves (first leaf most significant)"""
+    num_vars = len(cut)
+    full = (1 << (1 << num_vars)) - 1
+    values = {leaf: variable_bits(num_vars, index) for index, leaf in enumerate(cut)}
+
+    def value(current):
+        if current in values:
+            return values[current]
+        kind, sources = network.kinds[current], network.fanins[current]
+        if kind == CONST0:
+            result = 0
+        elif kind == CONST1:
+            result = full
+        elif kind == NOT:
+            result = full & ~value(sources[0])
+        elif kind == AND:
+            result = full
+            for source in sources:
+                result &= value(source)
+        else:
+            result = 0
+            for source in sources:
+                result |= value(source)
+        values[current] = result
+        return result
+
+    return value(node)
+
+def verify_mapping(network, mapping):
+    """True if the network of LUTs computes the same outputs as the subject network"""
+    num_vars = len(network.inputs)
+    full = (1 << (1 << num_vars)) - 1
+    values = {node: variable_bits(num_vars, index) for index, node in enumerate(network.inputs)}
+    for node, kind in enumerate(network.kinds):
+        if kind in (CONST0, CONST1):
+            values[node] = full if kind == CONST1 else 0
+    for node, cut in mapping.luts.items():
+        table = lut_function(network, node, cut)
+        result = 0
+        for minterm in range(1 << len(cut)):
+            if (table >> minterm) & 1:
+                term = full
+                for index, leaf in enumerate(cut):
+                    bit = (minterm >> (len(cut) - 1 - index)) & 1
+                    term &= values[leaf] if bit else full & ~values[leaf]
+                result |= term
+        values[node] = result
+    expected = network.truth_tables()
+    return all(values[node] == expected[name].on_bits for name, node in network.outputs.items())
+
+def main():
+    parser = argparse.ArgumentParser(description="Map the next-state logic onto k-input FPGA LUTs")
+    parser.add_argument('-k', type=int, nargs='+', default=[4, 5, 6], help="LUT sizes to map to")
+    parser.add_argument('--dont-cares', action='store_true', help="minimize with unsafe puzzle inputs as don't cares")
+    parser.add_argument('--puzzle', type=int, nargs=3, metavar=('M', 'C', 'K'),
+                        help="use the next-state functions of a generalized puzzle instead")
+    parser.add_argument('--max-cuts', type=int, default=MAX_CUTS, help="priority cuts kept per node (default 0: all, depth-optimal)")
+    args = parser.parse_args()
+
+    from factoring import optimize
+    if args.puzzle:
+        from puzzle_solver import Puzzle
+        puzzle = Puzzle(*args.puzzle)
+        solution = puzzle.solve()
+        if solution is None:
+            raise SystemExit("Puzzle instance has no solution")
+        functions, dont_cares, num_vars, var_names = puzzle.next_state_functions(solution)
+    else:
+        functions, num_vars, var_names = NEXT_STATE_FUNCTIONS, 5, ['M1', 'M0', 'C1', 'C0', 'D']
+        dont_cares = illegal_puzzle_inputs() if args.dont_cares else ()
+
+    covers = {name: minimize(minterms, num_vars=num_vars, dont_cares=dont_cares)
+              for name, minterms in functions.items()}
+    networks = [('Original (Σm)', from_minterms(functions, num_vars, var_names)),
+                ('Minimized SOP', from_covers(covers, num_vars, var_names)),
+                ('Factored', optimize(covers, num_vars, var_names)[2])]
+
+    print("FPGA LUT MAPPING")
+    print("=" * 60)
+    print(f"{len(functions)} outputs over {num_vars} inputs")
+    if args.max_cuts:
+        print(f"Priority cuts: {args.max_cuts} per node (levels may exceed the optimum)")
+    header = ''.join(f"{f'k={k} LUTs':>11}{'levels':>8}" for k in args.k)
+    print(f"\n{'Network':<16} {'Gates':>6}{header}")
+    print("-" * (23 + 19 * len(args.k)))
+    failures = []
+    for label, network in networks:
+        row = f"{label:<16} {network.gate_count():>6}"
+        for k in args.k:
+            mapping = map_luts(network, k, args.max_cuts)
+            if not verify_mapping(network, mapping):
+                failures.append(f"{label} k={k}")
+            row += f"{len(mapping.luts):>11}{mapping.depth:>8}"
+        print(row)
+    print(f"\nLUT networks checked by simulation: {'PASS' if not failures else 'FAIL ' + ', '.join(failures)}")
+
+if __name__ == "__main__":
+    main()
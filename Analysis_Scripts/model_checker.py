@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+
+# Symbolic model checking of the puzzle state machines
+# A machine is a set of next-state functions (Σm lists or minimized covers)
+# over state bits and free inputs.  Sets of states are BDDs over the
+# current-state variables; the transition relation pairs them with
+# interleaved next-state variables, and reachability is a fixpoint of
+# relational-product image steps.  Safety (no reachable state is unsafe)
+# gets a shortest counterexample from the BFS rings; liveness (every run
+# reaches the goal) is a backward fixpoint over the preimage.
+
+import argparse
+from collections import namedtuple
+
+from bdd import BDD, FALSE, TRUE
+from boolean_minimizer import NEXT_STATE_FUNCTIONS, minimize, illegal_puzzle_inputs
+from hdl_model import NEXT_REGISTER_LUT, OUTPUT_LUT, REGISTER_BITS, FINAL_STATE, STATE_BITS
+
+CheckResult = namedtuple('CheckResult', ['holds', 'trace'])
+
+def _cover_to_bdd(manager, cover, positions):
+    """BDD of (value, mask) cubes whose variable i is manager input positions[i]"""
+    width = len(positions)
+    # Build each product bottom-up so every AND only adds one level
+    order = sorted(range(width), key=lambda i: -manager.level_of(manager.variable(positions[i])))
+    result = FALSE
+    for value, mask in cover:
+        term = TRUE
+        for index in order:
+            position = width - 1 - index
+            if not (mask >> position) & 1:
+                term = manager.apply_and(manager.literal(positions[index], (value >> position) & 1), term)
+        result = manager.apply_or(result, term)
+    return result
+
+class TransitionSystem:
+    """Synchronous machine: every state bit is a Boolean function of the state and free inputs
+
+    next_covers[i] is a cover over (state bits, inputs), most significant
+    first, giving state bit i after a clock edge.
+    """
+
+    def __init__(self, state_names, input_names, next_covers, initial):
+        self.state_names = list(state_names)
+        self.input_names = list(input_names)
+        n, u = len(state_names), len(input_names)
+        self.width = n
+        # Current and next copies of each state bit sit next to each other in the order
+        self.bdd = BDD(2 * n + u)
+        self.current = [2 * i for i in range(n)]
+        self.next = [2 * i + 1 for i in range(n)]
+        self.inputs = [2 * n + j for j in range(u)]
+        positions = self.current + self.inputs
+        self.functions = [_cover_to_bdd(self.bdd, cover, positions) for cover in next_covers]
+        relation = TRUE
+        for index in range(n - 1, -1, -1):
+            bit = self.bdd.variable(self.next[index])
+            equal = self.bdd.ite(bit, self.functions[index], self.bdd.apply_not(self.functions[index]))
+            relation = self.bdd.apply_and(equal, relation)
+        self.relation = relation
+        self.initial = self.state(initial)
+        self._to_current = dict(zip(self.next, self.current))
+        self._substitution = dict(zip(self.current, self.functions))
+
+    # Sets of states ---------------------------------------------------------------
+
+    def state(self, minterm):
+        """BDD of a single state (bit 0 of the name list is the most significant)"""
+        return _cover_to_bdd(self.bdd, [(minterm, 0)], self.current)
+
+    def states(self, cover):
+        """BDD of a set of states given as (value, mask) cubes over the state bits"""
+        return _cover_to_bdd(self.bdd, cover, self.current)
+
+    def count(self, states):
+        """Number of states in a set"""
+        return self.bdd.sat_count(states) >> (self.width + len(self.inputs))
+
+    def pick(self, states):
+        """One state of a non-empty set, as a minterm over the state bits"""
+        value, _ = self.bdd.any_sat(states)
+        total = self.bdd.num_vars
+        minterm = 0
+        for index in self.current:
+            minterm = (minterm << 1) | ((value >> (total - 1 - index)) & 1)
+        return minterm
+
+    # Image computation ---------------------------------------------------------------
+
+    def image(self, states):
+        """Successors of a set of states under any input"""
+        successors = self.bdd.and_exists(states, self.relation, self.current + self.inputs)
+        return self.bdd.rename(successors, self._to_current)
+
+    def preimage_exists(self, states):
+        """States with some input leading into the set"""
+        return self.bdd.exists(self.bdd.compose(states, self._substitution), self.inputs)
+
+    def preimage_forall(self, states):
+        """States whose every input leads into the set"""
+        return self.bdd.forall(self.bdd.compose(states, self._substitution), self.inputs)
+
+    def reachable(self, stop=FALSE):
+        """(reachable set, BFS rings of newly reached states); states in stop are not expanded"""
+        reached = frontier = self.initial
+        rings = [frontier]
+        while True:
+            frontier = self.bdd.apply_and(frontier, self.bdd.apply_not(stop))
+            frontier = self.bdd.apply_and(self.image(frontier), self.bdd.apply_not(reached))
+            if frontier == FALSE:
+                return reached, rings
+            reached = self.bdd.apply_or(reached, frontier)
+            rings.append(frontier)
+
+    def trace_to(self, target, rings):
+        """Shortest run from the initial state into target, as a list of state minterms"""
+        for depth, ring in enumerate(rings):
+            hit = self.bdd.apply_and(ring, target)
+            if hit != FALSE:
+                break
+        else:
+            return None
+        trace = [self.pick(hit)]
+        for ring in reversed(rings[:depth]):
+            predecessors = self.bdd.apply_and(self.preimage_exists(self.state(trace[-1])), ring)
+            trace.append(self.pick(predecessors))
+        return trace[::-1]
+
+    # Properties ------------------------------------------------------------------------
+
+    def check_invariant(self, bad, reach=None, rings=None):
+        """AG not bad: no reachable state is in the bad set"""
+        if reach is None:
+            reach, rings = self.reachable()
+        violating = self.bdd.apply_and(reach, bad)
+        if violating == FALSE:
+            return CheckResult(True, None)
+        return CheckResult(False, self.trace_to(violating, rings))
+
+    def eventually(self, goal):
+        """AF goal: states from which every run, under every input, reaches the goal"""
+        result = goal
+        while True:
+            grown = self.bdd.apply_or(result, self.preimage_forall(result))
+            if grown == result:
+                return result
+            result = grown
+
+    def can_reach(self, goal):
+        """EF goal: states from which some input sequence reaches the goal"""
+        result = goal
+        while True:
+            grown = self.bdd.apply_or(result, self.preimage_exists(result))
+            if grown == result:
+                return result
+            result = grown
+
+    def check_always_reaches(self, goal):
+        """AF goal from the initial state; a deterministic failure gets its looping run"""
+        if self.bdd.apply_and(self.initial, self.bdd.apply_not(self.eventually(goal))) == FALSE:
+            return CheckResult(True, None)
+        if self.inputs:
+            return CheckResult(False, None)
+        run, seen = [], set()
+        state = self.pick(self.initial)
+        while state not in seen:
+            seen.add(state)
+            run.append(state)
+            state = self.pick(self.image(self.state(state)))
+        return CheckResult(False, run + [state])
+
+# Bit-vector helpers for the safety predicate ------------------------------------------------
+
+def _constant(value, width):
+    return [TRUE if (value >> (width - 1 - i)) & 1 else FALSE for i in range(width)]
+
+def _extend(bits, width):
+    return [FALSE] * (width - len(bits)) + bits
+
+def _less(manager, a, b):
+    """a < b for unsigned bit vectors, most significant bit first"""
+    less, equal = FALSE, TRUE
+    for x, y in zip(a, b):
+        less = manager.apply_or(less, manager.apply_and(equal, manager.apply_and(manager.apply_not(x), y)))
+        equal = manager.apply_and(equal, manager.apply_not(manager.apply_xor(x, y)))
+    return less
+
+def _subtract(manager, a, b):
+    """a - b modulo 2^width, most significant bit first"""
+    result, borrow = [], FALSE
+    for x, y in zip(reversed(a), reversed(b)):
+        result.append(manager.apply_xor(manager.apply_xor(x, y), borrow))
+        # Borrow out when x < y + borrow
+        borrow = manager.ite(x, manager.apply_and(y, borrow), manager.apply_or(y, borrow))
+    return result[::-1]
+
+class PuzzleModel:
+    """Combinational puzzle solver closed into a loop: the boat side toggles every step"""
+
+    def __init__(self, functions, missionaries, cannibals, m_bits, c_bits, start_boat=0, covers=None):
+        self.missionaries, self.cannibals = missionaries, cannibals
+        self.m_bits, self.c_bits = m_bits, c_bits
+        num_vars = m_bits + c_bits + 1
+        names = [f"M{i}" for i in range(m_bits - 1, -1, -1)] + [f"C{i}" for i in range(c_bits - 1, -1, -1)] + ['D']
+        next_covers = []
+        for name in list(functions):
+            next_covers.append(covers[name] if covers is not None else [(m, 0) for m in functions[name]])
+        # The boat changes bank every step: D' = not D
+        next_covers.append([(0, ((1 << num_vars) - 1) & ~1)])
+        initial = self.encode(missionaries, cannibals, start_boat)
+        self.system = TransitionSystem(names, [], next_covers, initial)
+        self.goal = self.system.state(self.encode(0, 0, 1 - start_boat))
+
+    def encode(self, m, c, boat):
+        return (m << (self.c_bits + 1)) | (c << 1) | boat
+
+    def decode(self, minterm):
+        return minterm >> (self.c_bits + 1), (minterm >> 1) & ((1 << self.c_bits) - 1), minterm & 1
+
+    def unsafe(self):
+        """States where cannibals outnumber missionaries on a bank, or counts are out of range"""
+        manager, system = self.system.bdd, self.system
+        width = max(self.m_bits, self.c_bits) + 1
+        variables = [manager.variable(index) for index in system.current]
+        m = _extend(variables[:self.m_bits], width)
+        c = _extend(variables[self.m_bits:self.m_bits + self.c_bits], width)
+        zero = _constant(0, width)
+        m_right = _subtract(manager, _constant(self.missionaries, width), m)
+        c_right = _subtract(manager, _constant(self.cannibals, width), c)
+        out_of_range = manager.apply_or(_less(manager, _constant(self.missionaries, width), m),
+                                        _less(manager, _constant(self.cannibals, width), c))
+        left = manager.apply_and(_less(manager, zero, m), _less(manager, m, c))
+        right = manager.apply_and(_less(manager, zero, m_right), _less(manager, m_right, c_right))
+        return manager.apply_or(out_of_range, manager.apply_or(left, right))
+
+def hdl_register_model():
+    """started + state[3:0] register of missionary_cannibal_complete with free reset/start inputs"""
+    num_vars = REGISTER_BITS + 2
+    next_covers = []
+    for bit in range(REGISTER_BITS - 1, -1, -1):
+        next_covers.append([(index, 0) for index, word in enumerate(NEXT_REGISTER_LUT) if (word >> bit) & 1])
+    names = ['started'] + [f"state[{i}]" for i in range(STATE_BITS - 1, -1, -1)]
+    system = TransitionSystem(names, ['reset', 'start'], next_covers, 0)
+    # valid_state is the last output bit; it is 0 for the unused codes
+    invalid = [(state, (1 << REGISTER_BITS) - 1 & ~((1 << STATE_BITS) - 1))
+               for state in range(1 << STATE_BITS) if not OUTPUT_LUT[state] & 1]
+    goal = system.states([(FINAL_STATE, 1 << STATE_BITS)])
+    return system, system.states(invalid), goal
+
+def _describe(holds):
+    return "PROVED" if holds else "FAILS"
+
+def check_puzzle(model, label):
+    system = model.system
+    # The solver halts at the goal, so what its logic does afterwards is a don't care
+    reach, rings = system.reachable(stop=model.goal)
+    print(f"\n{label}")
+    print("-" * 60)
+    print(f"State bits: {system.width}, transition relation: {system.bdd.node_count([system.relation])} BDD nodes")
+    print(f"Reachable states: {system.count(reach)} in {len(rings) - 1} steps")
+    safety = system.check_invariant(model.unsafe(), reach, rings)
+    print(f"Safety (never outnumbered, counts in range): {_describe(safety.holds)}")
+    if not safety.holds:
+        print("  Counterexample: " + ' -> '.join(str(model.decode(s)) for s in safety.trace))
+    liveness = system.check_always_reaches(model.goal)
+    print(f"Liveness (goal {model.decode(system.pick(model.goal))} always reached): {_describe(liveness.holds)}")
+    if not liveness.holds:
+        print("  Run that never reaches it: " + ' -> '.join(str(model.decode(s)) for s in liveness.trace))
+    return safety.holds and liveness.holds
+
+def check_hdl():
+    system, invalid, goal = hdl_register_model()
+    reach, rings = system.reachable()
+    print("\nmissionary_cannibal_complete register (reset/start free)")
+    print("-" * 60)
+    print(f"Reachable (started, state) pairs: {system.count(reach)} in {len(rings) - 1} steps")
+    safety = system.check_invariant(invalid, reach, rings)
+    print(f"valid_state always 1: {_describe(safety.holds)}")
+    if not safety.holds:
+        print("  Counterexample: " + ' -> '.join(f"S{s & 15}" for s in safety.trace))
+    always = system.check_always_reaches(goal)
+    print(f"solution_complete reached on every input sequence: {_describe(always.holds)}"
+          f"{' (reset or start can be held forever)' if not always.holds else ''}")
+    possible = system.bdd.apply_and(reach, system.bdd.apply_not(system.can_reach(goal))) == FALSE
+    print(f"solution_complete reachable from every reachable state: {_describe(possible)}")
+    return safety.holds and possible
+
+def main():
+    parser = argparse.ArgumentParser(description="Prove safety and goal reachability of the puzzle state machines")
+    parser.add_argument('--puzzle', type=int, nargs=3, metavar=('M', 'C', 'K'),
+                        help="check the next-state functions of a generalized puzzle")
+    parser.add_argument('--minimized', action='store_true',
+                        help="check minimized covers (with don't cares) instead of the Σm lists")
+    args = parser.parse_args()
+
+    print("SYMBOLIC MODEL CHECKING")
+    print("=" * 60)
+    if args.puzzle:
+        from puzzle_solver import Puzzle
+        missionaries, cannibals, capacity = args.puzzle
+        puzzle = Puzzle(missionaries, cannibals, capacity)
+        solution = puzzle.solve()
+        if solution is None:
+            raise SystemExit("Puzzle instance has no solution")
+        spec = puzzle.next_state_functions(solution)
+        m_bits = max(1, missionaries.bit_length())
+        c_bits = max(1, cannibals.bit_length())
+        covers = None
+        if args.minimized:
+            covers = {name: minimize(minterms, num_vars=spec.num_vars, dont_cares=spec.dont_cares)
+                      for name, minterms in spec.functions.items()}
+        model = PuzzleModel(spec.functions, missionaries, cannibals, m_bits, c_bits, 0, covers)
+        source = "minimized covers" if args.minimized else "Σm lists"
+        check_puzzle(model, f"Generalized solver M={missionaries}, C={cannibals}, boat={capacity} ({source})")
+        return
+
+    # The hand-written functions start with D = 1 (boat on the left) and finish at (0, 0, 0)
+    model = PuzzleModel(NEXT_STATE_FUNCTIONS, 3, 3, 2, 2, start_boat=1)
+    check_puzzle(model, "NEXT_STATE_FUNCTIONS (Σm lists)")
+    covers = {name: minimize(minterms, dont_cares=illegal_puzzle_inputs())
+              for name, minterms in NEXT_STATE_FUNCTIONS.items()}
+    model = PuzzleModel(NEXT_STATE_FUNCTIONS, 3, 3, 2, 2, start_boat=1, covers=covers)
+    check_puzzle(model, "Minimized covers with unsafe inputs as don't cares")
+    check_hdl()
+
+if __name__ == "__main__":
+    main()
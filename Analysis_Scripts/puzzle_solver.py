@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+
+# State-space generator and solver for the generalized puzzle
+# M missionaries and C cannibals cross with a boat holding up to k people.
+# A state (m, c, boat) counts the people still on the left bank and packs
+# into one integer, ((m * (C + 1)) + c) * 2 + boat, with boat 0 = left.
+# The search keeps one byte per packed state (which side reached it and by
+# which move) instead of dicts of tuples, so instances with millions of
+# states fit in a few megabytes, and paths are rebuilt by undoing moves.
+
+import argparse
+import time
+from array import array
+from collections import namedtuple
+
+from boolean_minimizer import minimize, cover_to_expression
+
+PuzzleSolution = namedtuple('PuzzleSolution', ['path', 'states_visited', 'elapsed'])
+PuzzleFunctions = namedtuple('PuzzleFunctions', ['functions', 'dont_cares', 'num_vars', 'var_names'])
+
+# Marks in the visited table: 0 = unseen, otherwise side bit | move number
+_BACKWARD = 0x80
+_ROOT = 0x7F
+
+class Puzzle:
+    """Missionaries-and-cannibals instance with integer-packed states"""
+
+    def __init__(self, missionaries=3, cannibals=3, capacity=2):
+        if capacity < 1:
+            raise ValueError("Boat capacity must be at least 1")
+        self.missionaries = missionaries
+        self.cannibals = cannibals
+        self.capacity = capacity
+        # Boat loads (missionaries, cannibals): nobody in the boat may be outnumbered
+        self.moves = [(dm, dc) for dm in range(capacity + 1) for dc in range(capacity + 1 - dm)
+                      if 0 < dm + dc and (dm == 0 or dm >= dc)]
+        if len(self.moves) >= _ROOT:
+            raise ValueError(f"Boat capacity {capacity} gives too many loads for the visited table")
+        self.num_states = (missionaries + 1) * (cannibals + 1) * 2
+
+    def pack(self, m, c, boat):
+        return ((m * (self.cannibals + 1)) + c) * 2 + boat
+
+    def unpack(self, state):
+        boat = state & 1
+        m, c = divmod(state >> 1, self.cannibals + 1)
+        return m, c, boat
+
+    def is_legal(self, m, c):
+        """Missionaries are never outnumbered on a bank where any are present"""
+        if not (0 <= m <= self.missionaries and 0 <= c <= self.cannibals):
+            return False
+        m_right, c_right = self.missionaries - m, self.cannibals - c
+        return (m == 0 or m >= c) and (m_right == 0 or m_right >= c_right)
+
+    def start(self):
+        return self.pack(self.missionaries, self.cannibals, 0)
+
+    def goal(self):
+        return self.pack(0, 0, 1)
+
+    def _apply(self, m, c, boat, move):
+        """Left-bank counts after the boat crosses from its bank with a load"""
+        dm, dc = self.moves[move]
+        return (m - dm, c - dc) if boat == 0 else (m + dm, c + dc)
+
+    def neighbors(self, state):
+        """Yield (move number, next state) for every legal crossing"""
+        m, c, boat = self.unpack(state)
+        for move in range(len(self.moves)):
+            m2, c2 = self._apply(m, c, boat, move)
+            if self.is_legal(m2, c2):
+                yield move, self.pack(m2, c2, 1 - boat)
+
+    def _parent(self, state, move):
+        """Undo a crossing: the state the boat left from"""
+        m, c, boat = self.unpack(state)
+        m2, c2 = self._apply(m, c, boat, move)
+        return self.pack(m2, c2, 1 - boat)
+
+    def count_legal_states(self):
+        """Number of legal (m, c, boat) states, counted per missionary count"""
+        total = 0
+        for m in range(self.missionaries + 1):
+            low = 0 if m == self.missionaries else max(0, self.cannibals - (self.missionaries - m))
+            high = self.cannibals if m == 0 else min(self.cannibals, m)
+            total += max(0, high - low + 1)
+        return total * 2
+
+    def state_graph(self):
+        """Legal move relation in compressed sparse row form
+
+        Returns (offsets, targets) arrays: the neighbors of packed state s
+        are targets[offsets[s]:offsets[s + 1]].
+        """
+        offsets = array('q', [0]) * (self.num_states + 1)
+        targets = array('q')
+        for state in range(self.num_states):
+            m, c, _ = self.unpack(state)
+            if self.is_legal(m, c):
+                targets.extend(next_state for _, next_state in self.neighbors(state))
+            offsets[state + 1] = len(targets)
+        return offsets, targets
+
+    def solve(self):
+        """Shortest crossing sequence by bidirectional BFS, or None if unsolvable"""
+        began = time.perf_counter()
+        start, goal = self.start(), self.goal()
+        # With more cannibals than missionaries one of the banks starts or ends unsafe
+        if not (self.is_legal(*self.unpack(start)[:2]) and self.is_legal(*self.unpack(goal)[:2])):
+            return None
+        marks = bytearray(self.num_states)
+        marks[start] = _ROOT
+        marks[goal] = _ROOT | _BACKWARD
+        frontiers = {0: array('q', [start]), _BACKWARD: array('q', [goal])}
+        visited = 2
+        meeting = None if start != goal else (start, start)
+
+        # A load moves (dm, dc) people, shifting the packed index by a fixed step
+        row = self.cannibals + 1
+        loads = [(move, dm, dc, (dm * row + dc) * 2) for move, (dm, dc) in enumerate(self.moves)]
+        total_m, total_c = self.missionaries, self.cannibals
+
+        while meeting is None and frontiers[0] and frontiers[_BACKWARD]:
+            # Grow the smaller side one full level
+            side = 0 if len(frontiers[0]) <= len(frontiers[_BACKWARD]) else _BACKWARD
+            next_frontier = array('q')
+            for state in frontiers[side]:
+                boat = state & 1
+                m, c = divmod(state >> 1, row)
+                for move, dm, dc, step in loads:
+                    if boat == 0:
+                        m2, c2, neighbor = m - dm, c - dc, state - step + 1
+                    else:
+                        m2, c2, neighbor = m + dm, c + dc, state + step - 1
+                    if not (0 <= m2 <= total_m and 0 <= c2 <= total_c):
+                        continue
+                    if (m2 and m2 < c2) or (m2 != total_m and total_m - m2 < total_c - c2):
+                        continue
+                    mark = marks[neighbor]
+                    if mark == 0:
+                        marks[neighbor] = side | (move + 1)
+                        next_frontier.append(neighbor)
+                        visited += 1
+                    elif (mark & _BACKWARD) != side:
+                        meeting = (state, neighbor) if side == 0 else (neighbor, state)
+                        break
+                if meeting is not None:
+                    break
+            frontiers[side] = next_frontier
+
+        if meeting is None:
+            return None
+        # Forward half: walk from the meeting edge back to the start
+        forward = []
+        state = meeting[0]
+        while True:
+            forward.append(state)
+            mark = marks[state] & _ROOT
+            if mark == _ROOT:
+                break
+            state = self._parent(state, mark - 1)
+        path = forward[::-1]
+        state = meeting[1]
+        if state != path[-1]:
+            while True:
+                path.append(state)
+                mark = marks[state] & _ROOT
+                if mark == _ROOT:
+                    break
+                state = self._parent(state, mark - 1)
+        return PuzzleSolution([self.unpack(s) for s in path], visited, time.perf_counter() - began)
+
+    # Outputs for the other scripts ------------------------------------------
+
+    def state_machine(self, solution, states=None):
+        """Transition and output tables of a counter that steps through a solution
+
+        Same layout as generate_kmaps.STATE_TRANSITIONS / STATE_OUTPUTS:
+        step i goes to step i + 1, the last step restarts at 0, and unused
+        codes up to `states` (default: next power of two) go to 0.
+        Outputs are (missionaries on left, cannibals on left, finished).
+        """
+        steps = len(solution.path)
+        if states is None:
+            states = 1 << max(1, (steps - 1).bit_length())
+        transitions = {i: (i + 1) % steps for i in range(steps)}
+        transitions.update({i: 0 for i in range(steps, states)})
+        outputs = {i: (m, c, 1 if i == steps - 1 else 0) for i, (m, c, _) in enumerate(solution.path)}
+        return transitions, outputs
+
+    def next_state_functions(self, solution):
+        """Minterm sets of a combinational solver that maps each state on a solution to the next
+
+        Inputs are the left-bank missionary and cannibal counts (MSB first)
+        followed by the boat side D.  Every input not on the solution path
+        is a don't care; the goal state holds.
+        """
+        m_bits = max(1, self.missionaries.bit_length())
+        c_bits = max(1, self.cannibals.bit_length())
+        num_vars = m_bits + c_bits + 1
+        var_names = ([f"M{i}" for i in range(m_bits - 1, -1, -1)] +
+                     [f"C{i}" for i in range(c_bits - 1, -1, -1)] + ['D'])
+
+        def encode(m, c, boat):
+            return (m << (c_bits + 1)) | (c << 1) | boat
+
+        functions = {f"MISSIONARY_NEXT[{i}]": [] for i in range(m_bits - 1, -1, -1)}
+        functions.update({f"CANNIBAL_NEXT[{i}]": [] for i in range(c_bits - 1, -1, -1)})
+        path = solution.path
+        care = set()
+        for current, following in zip(path, path[1:] + path[-1:]):
+            minterm = encode(*current)
+            care.add(minterm)
+            m_next, c_next, _ = following
+            for i in range(m_bits):
+                if (m_next >> i) & 1:
+                    functions[f"MISSIONARY_NEXT[{i}]"].append(minterm)
+            for i in range(c_bits):
+                if (c_next >> i) & 1:
+                    functions[f"CANNIBAL_NEXT[{i}]"].append(minterm)
+        dont_cares = [m for m in range(1 << num_vars) if m not in care]
+        return PuzzleFunctions({name: sorted(ms) for name, ms in functions.items()}, dont_cares, num_vars, var_names)
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate and solve a missionaries-and-cannibals instance")
+    parser.add_argument('-m', '--missionaries', type=int, default=3)
+    parser.add_argument('-c', '--cannibals', type=int, default=3)
+    parser.add_argument('-k', '--capacity', type=int, default=2, help="boat capacity")
+    parser.add_argument('--max-steps', type=int, default=40, help="longest solution to print in full")
+    args = parser.parse_args()
+
+    puzzle = Puzzle(args.missionaries, args.cannibals, args.capacity)
+    print(f"MISSIONARIES AND CANNIBALS: M={args.missionaries}, C={args.cannibals}, boat={args.capacity}")
+    print("=" * 60)
+    print(f"Packed state space: {puzzle.num_states:,} states ({puzzle.num_states:,} bytes of visited marks)")
+    print(f"Legal states: {puzzle.count_legal_states():,}")
+    print(f"Boat loads: {len(puzzle.moves)}")
+
+    solution = puzzle.solve()
+    if solution is None:
+        print("\nNo solution exists for this instance")
+        return
+    crossings = len(solution.path) - 1
+    print(f"\nShortest solution: {crossings} crossings "
+          f"({solution.states_visited:,} states visited in {solution.elapsed:.3f}s)")
+    if len(solution.path) <= args.max_steps:
+        print("\nStep | Left bank (M, C) | Boat")
+        print("-----|------------------|------")
+        for step, (m, c, boat) in enumerate(solution.path):
+            print(f"S{step:<3} | ({m}, {c}){'':<11}| {'left' if boat == 0 else 'right'}")
+
+    transitions, outputs = puzzle.state_machine(solution)
+    print(f"\nState machine: {len(solution.path)} states, {len(transitions)} codes "
+          f"({len(transitions) - len(solution.path)} unused)")
+
+    functions = puzzle.next_state_functions(solution)
+    if functions.num_vars <= 10:
+        print(f"\nNext-state functions over {' '.join(functions.var_names)} "
+              f"({len(functions.dont_cares)} don't cares):")
+        for name, minterms in functions.functions.items():
+            cover = minimize(minterms, num_vars=functions.num_vars, dont_cares=functions.dont_cares)
+            print(f"  {name} = Σm{minterms}")
+            print(f"  {'':<{len(name)}} = {cover_to_expression(cover, functions.num_vars, functions.var_names)}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+
+# Persistent content-addressed cache for minimization results
+# An entry's name is the SHA-256 of a canonical description of the work:
+# the kind of result, the number of inputs, the sorted ON and don't-care
+# sets (a minterm in both counts as a don't care) and the engine options.
+# Values are pickled and zlib-compressed into one file per entry, written
+# to a temporary name and moved into place with os.replace, so readers
+# never see a partial entry.  Hits refresh the file's mtime; when the
+# directory grows past its size bound the least recently used entries are
+# removed under an exclusive lock, so concurrent runs can share a cache.
+
+import argparse
+import hashlib
+import os
+import pickle
+import zlib
+
+try:
+    import fcntl
+except ImportError:
+    # No advisory locks (Windows): eviction still works, just unserialized
+    fcntl = None
+
+CACHE_DIR = os.path.join(os.path.dirname(__file__), '.result_cache')
+CACHE_VERSION = 2
+MAX_CACHE_BYTES = 64 * 1024 * 1024
+# Eviction trims the cache to this fraction of the bound, so it runs rarely
+EVICT_TO = 0.8
+
+_MAGIC = b'RC%d\n' % CACHE_VERSION
+_SUFFIX = '.bin'
+
+def function_key(kind, num_vars, minterms, dont_cares=(), **options):
+    """Canonical hex key of a result over a Boolean function"""
+    dc_set = set(dont_cares)
+    on = sorted(set(minterms) - dc_set)
+    text = repr((CACHE_VERSION, kind, num_vars, on, sorted(dc_set), sorted(options.items())))
+    return hashlib.sha256(text.encode()).hexdigest()
+
+class ResultCache:
+    """Directory of compressed results with size-bounded LRU eviction"""
+
+    def __init__(self, directory=CACHE_DIR, max_bytes=MAX_CACHE_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = self.misses = self.stores = self.evictions = 0
+        self._size = None
+
+    def _path(self, key):
+        return os.path.join(self.directory, key[:2], key + _SUFFIX)
+
+    def _entries(self):
+        """(path, size, mtime) of every entry"""
+        entries = []
+        if not os.path.isdir(self.directory):
+            return entries
+        for shard in os.scandir(self.directory):
+            if not shard.is_dir():
+                continue
+            for entry in os.scandir(shard.path):
+                if entry.name.endswith(_SUFFIX):
+                    try:
+                        stat = entry.stat()
+                    except FileNotFoundError:
+                        continue
+                    entries.append((entry.path, stat.st_size, stat.st_mtime_ns))
+        return entries
+
+    def get(self, key, default=None):
+        """Stored value, or default when the entry is missing or unreadable"""
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+        except FileNotFoundError:
+            self.misses += 1
+            return default
+        try:
+            if not data.startswith(_MAGIC):
+                raise ValueError("bad header")
+            value = pickle.loads(zlib.decompress(data[len(_MAGIC):]))
+        except Exception:
+            # Written by another version or damaged: drop it and recompute
+            self._remove(path)
+            self.misses += 1
+            return default
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        data = _MAGIC + zlib.compress(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+        temporary = path + f'.{os.getpid()}.tmp'
+        with open(temporary, 'wb') as f:
+            f.write(data)
+        os.replace(temporary, path)
+        self.stores += 1
+        if self._size is None:
+            self._size = sum(size for _, size, _ in self._entries())
+        else:
+            self._size += len(data)
+        if self._size > self.max_bytes:
+            self.evict()
+
+    def memoize(self, kind, num_vars, minterms, dont_cares, compute, keep=None, **options):
+        """Cached compute() for a result over the given function
+
+        A computed value is stored only if keep(value) is true (always
+        without keep), so incomplete results are recomputed next time.
+        """
+        key = function_key(kind, num_vars, minterms, dont_cares, **options)
+        missing = object()
+        value = self.get(key, missing)
+        if value is missing:
+            value = compute()
+            if keep is None or keep(value):
+                self.put(key, value)
+        return value
+
+    def _remove(self, path):
+        try:
+            os.remove(path)
+            return True
+        except FileNotFoundError:
+            return False
+
+    def _lock(self):
+        os.makedirs(self.directory, exist_ok=True)
+        handle = open(os.path.join(self.directory, '.lock'), 'w')
+        if fcntl is not None:
+            fcntl.flock(handle, fcntl.LOCK_EX)
+        return handle
+
+    def evict(self, max_bytes=None):
+        """Remove least recently used entries until the cache is under max_bytes
+
+        Without an explicit bound, an over-full cache is trimmed to EVICT_TO
+        of its own bound.
+        """
+        with self._lock():
+            entries = sorted(self._entries(), key=lambda entry: entry[2])
+            total = sum(size for _, size, _ in entries)
+            if max_bytes is not None:
+                target = max_bytes
+            else:
+                target = self.max_bytes * EVICT_TO if total > self.max_bytes else total
+            for path, size, _ in entries:
+                if total <= target:
+                    break
+                if self._remove(path):
+                    self.evictions += 1
+                total -= size
+            self._size = total
+        return total
+
+    def clear(self):
+        return self.evict(0)
+
+    def usage(self):
+        """(entries, bytes) currently on disk"""
+        entries = self._entries()
+        return len(entries), sum(size for _, size, _ in entries)
+
+    def summary(self):
+        return (f"{self.hits} hits, {self.misses} misses, {self.stores} stored, "
+                f"{self.evictions} evicted")
+
+def enable(directory=CACHE_DIR, max_bytes=MAX_CACHE_BYTES):
+    """Route boolean_minimizer's minimize() and prime implicants through a cache"""
+    import boolean_minimizer
+    boolean_minimizer.RESULT_CACHE = ResultCache(directory, max_bytes)
+    return boolean_minimizer.RESULT_CACHE
+
+def main():
+    parser = argparse.ArgumentParser(description="Inspect or trim the minimization result cache")
+    parser.add_argument('--dir', default=CACHE_DIR)
+    parser.add_argument('--clear', action='store_true', help="remove every entry")
+    parser.add_argument('--max-mb', type=float, help="evict least recently used entries down to this size")
+    args = parser.parse_args()
+
+    cache = ResultCache(args.dir)
+    if args.clear:
+        cache.clear()
+    elif args.max_mb is not None:
+        cache.evict(int(args.max_mb * 1024 * 1024))
+    entries, size = cache.usage()
+    print("RESULT CACHE")
+    print("=" * 60)
+    print(f"Directory: {os.path.abspath(args.dir)}")
+    print(f"Entries: {entries}, {size / 1024:.1f} KiB of {MAX_CACHE_BYTES // (1024 * 1024)} MiB")
+    if cache.evictions:
+        print(f"Evicted: {cache.evictions}")
+
+if __name__ == "__main__":
+    main()
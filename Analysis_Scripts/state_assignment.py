@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+
+# State-assignment search for the missionary-cannibal state machine
+# Every candidate encoding is scored by minimizing its next-state and output
+# logic with the shared engine.  Small search spaces are enumerated
+# exhaustively, one encoding per symmetry class; larger ones (12 states in
+# 4 bits already has ~3.6e10 classes) use simulated annealing.  Candidates are
+# spread over a process pool and each worker caches minimized functions.
+
+import argparse
+import math
+import random
+import time
+from collections import Counter, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import islice
+
+from boolean_minimizer import minimize, cover_statistics, cover_to_expression, cube_literal_count
+from generate_kmaps import STATE_TRANSITIONS, STATE_OUTPUTS, reachable_states
+from truth_table import TruthTable
+
+OUTPUT_NAMES = ['M1', 'M0', 'C1', 'C0', 'F']
+
+# Largest number of symmetry classes enumerated before switching to annealing
+EXHAUSTIVE_LIMIT = 200_000
+# Encodings handed to a worker per task
+BATCH_SIZE = 500
+
+AssignmentResult = namedtuple('AssignmentResult',
+                              ['encoding', 'cost', 'method', 'candidates', 'statistics', 'elapsed'])
+
+def machine_states(transitions=STATE_TRANSITIONS):
+    """States of the machine reachable from reset, in order"""
+    return sorted(reachable_states(transitions))
+
+def _output_word(state, outputs):
+    m, c, f = outputs[state]
+    return (m << 3) | (c << 1) | f
+
+def encoding_functions(encoding, bits, transitions=STATE_TRANSITIONS, outputs=STATE_OUTPUTS):
+    """Next-state and output truth tables of an encoding
+
+    encoding[i] is the code of the i-th state of machine_states(); codes
+    no state uses are don't cares in every function.
+    """
+    states = machine_states(transitions)
+    code_of = dict(zip(states, encoding))
+    dc_bits = (1 << (1 << bits)) - 1
+    for code in encoding:
+        dc_bits &= ~(1 << code)
+
+    functions = []
+    for bit in range(bits - 1, -1, -1):
+        on_bits = 0
+        for state in states:
+            if (code_of[transitions[state]] >> bit) & 1:
+                on_bits |= 1 << code_of[state]
+        functions.append((f"Q{bit}+", TruthTable(bits, on_bits, dc_bits)))
+    for bit, name in enumerate(OUTPUT_NAMES):
+        position = len(OUTPUT_NAMES) - 1 - bit
+        on_bits = 0
+        for state in states:
+            if (_output_word(state, outputs) >> position) & 1:
+                on_bits |= 1 << code_of[state]
+        functions.append((name, TruthTable(bits, on_bits, dc_bits)))
+    return functions
+
+@lru_cache(maxsize=1 << 16)
+def _function_cost(num_vars, on_bits, dc_bits):
+    """Gate inputs, literals, terms and depth of one minimized function"""
+    cover = minimize(TruthTable(num_vars, on_bits, dc_bits), num_vars=num_vars)
+    stats = cover_statistics(cover, num_vars)
+    gate_inputs = sum(n for n in (cube_literal_count(cube, num_vars) for cube in cover) if n > 1)
+    if stats['or_gates']:
+        gate_inputs += stats['terms']
+    return gate_inputs, stats['literals'], stats['terms'], stats['depth']
+
+def encoding_cost(encoding, bits, transitions=STATE_TRANSITIONS, outputs=STATE_OUTPUTS):
+    """Summed gate inputs, literals and terms plus worst-case depth of an encoding"""
+    gate_inputs = literals = terms = depth = 0
+    for _, table in encoding_functions(encoding, bits, transitions, outputs):
+        g, l, t, d = _function_cost(bits, table.on_bits, table.dc_bits)
+        gate_inputs += g
+        literals += l
+        terms += t
+        depth = max(depth, d)
+    return {'gate_inputs': gate_inputs, 'literals': literals, 'terms': terms, 'depth': depth}
+
+def score(cost, objective='area'):
+    """Sort key of a cost: 'area' minimizes gate inputs first, 'depth' logic depth first"""
+    if objective == 'area':
+        return (cost['gate_inputs'], cost['depth'], cost['literals'])
+    if objective == 'depth':
+        return (cost['depth'], cost['gate_inputs'], cost['literals'])
+    raise ValueError(f"Unknown objective: {objective}")
+
+# Exhaustive enumeration -------------------------------------------------------
+
+def canonical_encodings(num_states, bits):
+    """Yield one encoding per class under bit permutation
+
+    Permuting bit positions only renames variables, so the code columns
+    (the bit of every state at one position) must be in non-decreasing
+    order, which is checked as the codes are placed.  Complementing a bit
+    is not a symmetry: it complements that bit's next-state function,
+    whose cover can cost more or less.
+    """
+    if num_states > (1 << bits):
+        return
+    encoding = []
+    used = set()
+    # tied[p]: columns p and p+1 are equal over the states placed so far
+    tied = [True] * (bits - 1)
+
+    def place(state):
+        if state == num_states:
+            yield tuple(encoding)
+            return
+        for code in range(1 << bits):
+            if code in used:
+                continue
+            # Columns are compared with the first state as most significant
+            # row, so a tied pair needs bit p <= bit p+1 in the new row
+            if any(tied[p] and (code >> p) & 1 > (code >> (p + 1)) & 1 for p in range(bits - 1)):
+                continue
+            saved = list(tied)
+            for p in range(bits - 1):
+                if tied[p] and (code >> p) & 1 != (code >> (p + 1)) & 1:
+                    tied[p] = False
+            encoding.append(code)
+            used.add(code)
+            yield from place(state + 1)
+            encoding.pop()
+            used.discard(code)
+            tied[:] = saved
+    yield from place(0)
+
+def estimated_classes(num_states, bits):
+    """Rough count of encodings left after symmetry breaking"""
+    if num_states > (1 << bits):
+        return 0
+    return math.perm(1 << bits, num_states) // math.factorial(bits)
+
+def _evaluate_batch(args):
+    """Worker: best encoding and cost histogram of a batch of encodings"""
+    encodings, bits, objective = args
+    best = None
+    histogram = Counter()
+    for encoding in encodings:
+        cost = encoding_cost(encoding, bits)
+        histogram[(cost['gate_inputs'], cost['depth'])] += 1
+        if best is None or score(cost, objective) < score(best[1], objective):
+            best = (encoding, cost)
+    return best, histogram
+
+def _batches(encodings, bits, objective):
+    while True:
+        batch = list(islice(encodings, BATCH_SIZE))
+        if not batch:
+            return
+        yield batch, bits, objective
+
+def exhaustive_search(bits, objective='area', workers=None):
+    """Score every canonical encoding on a process pool"""
+    states = machine_states()
+    best = None
+    histogram = Counter()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for batch_best, batch_histogram in executor.map(_evaluate_batch,
+                                                         _batches(canonical_encodings(len(states), bits), bits, objective)):
+            histogram.update(batch_histogram)
+            if batch_best and (best is None or score(batch_best[1], objective) < score(best[1], objective)):
+                best = batch_best
+    return best, histogram
+
+# Simulated annealing ------------------------------------------------------------
+
+def _energy(cost, objective):
+    """Scalar annealing energy; depth steps outweigh any gate-input change when optimizing depth"""
+    if objective == 'depth':
+        return 1000 * cost['depth'] + cost['gate_inputs']
+    return cost['gate_inputs'] + cost['depth']
+
+def _anneal(args):
+    """Worker: one annealing chain, returns its best encoding and cost histogram"""
+    seed, bits, objective, steps, start_temperature = args
+    rng = random.Random(seed)
+    num_states = len(machine_states())
+    codes = list(range(1 << bits))
+    rng.shuffle(codes)
+    current = codes[:num_states]
+    spare = codes[num_states:]
+    current_cost = encoding_cost(tuple(current), bits)
+    best = (tuple(current), current_cost)
+    histogram = Counter()
+
+    for step in range(steps):
+        temperature = start_temperature * (1 - step / steps) + 1e-3
+        candidate = list(current)
+        candidate_spare = list(spare)
+        i = rng.randrange(num_states)
+        if candidate_spare and rng.random() < 0.3:
+            # Move a state to an unused code
+            j = rng.randrange(len(candidate_spare))
+            candidate[i], candidate_spare[j] = candidate_spare[j], candidate[i]
+        else:
+            j = rng.randrange(num_states)
+            candidate[i], candidate[j] = candidate[j], candidate[i]
+        cost = encoding_cost(tuple(candidate), bits)
+        histogram[(cost['gate_inputs'], cost['depth'])] += 1
+        delta = _energy(cost, objective) - _energy(current_cost, objective)
+        if delta <= 0 or rng.random() < math.exp(-delta / temperature):
+            current, spare, current_cost = candidate, candidate_spare, cost
+            if score(cost, objective) < score(best[1], objective):
+                best = (tuple(candidate), cost)
+    return best, histogram
+
+def annealing_search(bits, objective='area', workers=None, chains=4, steps=1500, seed=0, start_temperature=4.0):
+    """Run independent annealing chains in parallel and keep the best result"""
+    best = None
+    histogram = Counter()
+    tasks = [(seed + chain, bits, objective, steps, start_temperature) for chain in range(chains)]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for chain_best, chain_histogram in executor.map(_anneal, tasks):
+            histogram.update(chain_histogram)
+            if best is None or score(chain_best[1], objective) < score(best[1], objective):
+                best = chain_best
+    return best, histogram
+
+# Driver -------------------------------------------------------------------------
+
+def _statistics(histogram):
+    total = sum(histogram.values())
+    gate_inputs = [g for (g, _), n in histogram.items() for _ in range(n)]
+    depths = Counter()
+    for (_, d), n in histogram.items():
+        depths[d] += n
+    return {
+        'evaluated': total,
+        'min_gate_inputs': min(gate_inputs),
+        'max_gate_inputs': max(gate_inputs),
+        'mean_gate_inputs': sum(gate_inputs) / total,
+        'depths': dict(sorted(depths.items())),
+    }
+
+def optimize_state_assignment(bits=4, objective='area', workers=None, exhaustive_limit=EXHAUSTIVE_LIMIT,
+                              chains=4, steps=1500, seed=0):
+    """Search state encodings and return the cheapest as an AssignmentResult
+
+    Uses exhaustive enumeration when the symmetry-reduced space has at most
+    exhaustive_limit classes, simulated annealing otherwise.
+    """
+    states = machine_states()
+    if len(states) > (1 << bits):
+        raise ValueError(f"{len(states)} states do not fit in {bits} bits")
+    start = time.perf_counter()
+    classes = estimated_classes(len(states), bits)
+    if classes <= exhaustive_limit:
+        method = 'exhaustive'
+        (encoding, cost), histogram = exhaustive_search(bits, objective, workers)
+    else:
+        method = 'annealing'
+        (encoding, cost), histogram = annealing_search(bits, objective, workers, chains, steps, seed)
+    return AssignmentResult(dict(zip(states, encoding)), cost, method, classes,
+                            _statistics(histogram), time.perf_counter() - start)
+
+def format_cost(cost):
+    return (f"{cost['gate_inputs']} gate inputs, {cost['literals']} literals, "
+            f"{cost['terms']} terms, depth {cost['depth']}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Search state encodings for the missionary-cannibal state machine")
+    parser.add_argument('--bits', type=int, default=4, help="code width (default 4)")
+    parser.add_argument('--objective', choices=['area', 'depth'], default='area')
+    parser.add_argument('--workers', type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument('--chains', type=int, default=4, help="annealing chains")
+    parser.add_argument('--steps', type=int, default=1500, help="annealing steps per chain")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    states = machine_states()
+    print("STATE ASSIGNMENT OPTIMIZATION")
+    print("=" * 60)
+    print(f"States: {len(states)}, code width: {args.bits} bits, objective: {args.objective}")
+
+    if args.bits >= 4:
+        baseline = encoding_cost(tuple(states), args.bits)
+        print(f"\nBinary counter encoding (S0=0 ... S11=11): {format_cost(baseline)}")
+
+    try:
+        result = optimize_state_assignment(args.bits, args.objective, args.workers,
+                                           chains=args.chains, steps=args.steps, seed=args.seed)
+    except ValueError as error:
+        parser.error(str(error))
+    print(f"\nSearch: {result.method} over ~{result.candidates:,} symmetry classes "
+          f"({result.statistics['evaluated']:,} candidates scored in {result.elapsed:.1f}s)")
+    print(f"Best encoding: {format_cost(result.cost)}")
+    if args.bits >= 4:
+        saved = baseline['gate_inputs'] - result.cost['gate_inputs']
+        print(f"Gate inputs saved vs binary counter: {saved} "
+              f"({saved / baseline['gate_inputs'] * 100:.1f}%)")
+
+    print("\nState | Code")
+    print("------|" + "-" * (args.bits + 2))
+    for state, code in result.encoding.items():
+        print(f"S{state:<4} | {code:0{args.bits}b}")
+
+    stats = result.statistics
+    print("\nPer-candidate cost statistics:")
+    print(f"  Gate inputs: min {stats['min_gate_inputs']}, mean {stats['mean_gate_inputs']:.1f}, "
+          f"max {stats['max_gate_inputs']}")
+    print("  Depth distribution: " + ', '.join(f"{d}: {n}" for d, n in stats['depths'].items()))
+
+    print("\nMinimized logic for the best encoding:")
+    encoding = tuple(result.encoding[s] for s in states)
+    var_names = [f"Q{b}" for b in range(args.bits - 1, -1, -1)]
+    for name, table in encoding_functions(encoding, args.bits):
+        cover = minimize(table, num_vars=args.bits)
+        print(f"  {name:<4}= {cover_to_expression(cover, args.bits, var_names)}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+
+# Switching-activity analysis for dynamic power estimation
+# One streaming pass over a VCD counts toggles, time spent at 0/1/x and
+# glitches for every signal bit.  Counters live in flat arrays indexed by
+# bit, so the pass does no per-change allocation.  Results export as SAIF
+# and drive a transition-density estimate of the relative dynamic power of
+# the original and minimized next-state logic.
+
+import argparse
+import os
+import time as clock
+from array import array
+
+from boolean_minimizer import NEXT_STATE_FUNCTIONS, minimize, cube_literal_count
+from vcd_reader import VCDFile
+
+# Bit states in the value table
+_ZERO, _ONE, _UNKNOWN = 0, 1, 2
+_BIT_STATE = {'0': _ZERO, '1': _ONE}
+
+# Bits of M1 M0 C1 C0 D in the dumps; '-' marks an input the dump lacks
+DEFAULT_INPUT_BITS = ['dut.missionary_out[1]', 'dut.missionary_out[0]',
+                      'dut.cannibal_out[1]', 'dut.cannibal_out[0]', '-']
+
+class SwitchingActivity:
+    """Per-bit toggle, duty and glitch counters of one VCD dump"""
+
+    def __init__(self, vcd, glitch_window=0):
+        self.vcd = vcd
+        self.glitch_window = glitch_window
+        # Every identifier code owns a run of bit slots, bit 0 first
+        self.base = {}
+        self.width = {}
+        slots = 0
+        for code, names in vcd.codes.items():
+            signal = vcd.signals[names[0]]
+            width = 1 if signal.kind == 'real' else signal.width
+            self.base[code] = slots
+            self.width[code] = width
+            slots += width
+        self.slots = slots
+        self.toggles = array('Q', bytes(8 * slots))
+        self.unknown_transitions = array('Q', bytes(8 * slots))
+        self.glitches = array('Q', bytes(8 * slots))
+        self.time_in = [array('Q', bytes(8 * slots)) for _ in range(3)]
+        self.last_change = array('Q', bytes(8 * slots))
+        self.last_toggle = array('q', [-1]) * slots
+        self.state = bytearray([_UNKNOWN]) * slots
+        self.duration = 0
+
+    def _bits(self, raw, width):
+        """Bit states of a raw value, bit 0 first, extended as VCD specifies"""
+        if raw[0] in 'rR':
+            return [_UNKNOWN]
+        if raw[0] in 'bB':
+            raw = raw[1:]
+        if len(raw) < width:
+            pad = '0' if raw[0] == '1' else raw[0]
+            raw = pad * (width - len(raw)) + raw
+        return [_BIT_STATE.get(c, _UNKNOWN) for c in reversed(raw[-width:])]
+
+    def run(self):
+        """Stream the whole dump once and fill the counters"""
+        state, last_change, last_toggle = self.state, self.last_change, self.last_toggle
+        toggles, glitches, unknown = self.toggles, self.glitches, self.unknown_transitions
+        time_in = self.time_in
+        window = self.glitch_window
+        time = 0
+        for time, code, raw in self.vcd.changes():
+            base = self.base[code]
+            for offset, new in enumerate(self._bits(raw, self.width[code])):
+                slot = base + offset
+                old = state[slot]
+                if old == new:
+                    continue
+                time_in[old][slot] += time - last_change[slot]
+                last_change[slot] = time
+                state[slot] = new
+                if old == _UNKNOWN or new == _UNKNOWN:
+                    unknown[slot] += 1
+                    continue
+                toggles[slot] += 1
+                # A pulse no wider than the window is a glitch
+                if last_toggle[slot] >= 0 and time - last_toggle[slot] <= window:
+                    glitches[slot] += 1
+                last_toggle[slot] = time
+        # Close the final interval of every bit
+        for slot in range(self.slots):
+            time_in[state[slot]][slot] += time - last_change[slot]
+        self.duration = time
+        return self
+
+    def bit_names(self):
+        """Yield (name, bit, slot) for every signal bit, aliases included"""
+        for name, signal in self.vcd.signals.items():
+            base, width = self.base[signal.code], self.width[signal.code]
+            for bit in range(width):
+                yield name, (bit if width > 1 else None), base + bit
+
+    def static_probability(self, slot):
+        """Fraction of the known time the bit spent at 1"""
+        known = self.time_in[_ZERO][slot] + self.time_in[_ONE][slot]
+        return self.time_in[_ONE][slot] / known if known else 0.5
+
+    def toggle_density(self, slot):
+        """0/1 toggles per time unit"""
+        return self.toggles[slot] / self.duration if self.duration else 0.0
+
+    def slot_of(self, reference):
+        """Slot of a 'name' or 'name[bit]' reference"""
+        name, _, bit = reference.partition('[')
+        signal = self.vcd.find(name)
+        index = int(bit.rstrip(']')) if bit else 0
+        if not 0 <= index < signal.width:
+            raise KeyError(f"Signal '{signal.name}' has no bit {index}")
+        return self.base[signal.code] + index
+
+    def write_saif(self, path, design=''):
+        """Export the counters as a SAIF 2.0 backward file"""
+        tree = {}
+        for name, bit, slot in self.bit_names():
+            *scopes, leaf = name.split('.')
+            node = tree
+            for scope in scopes:
+                node = node.setdefault(scope, {})
+            node.setdefault(None, []).append((leaf if bit is None else f"{leaf}\\[{bit}\\]", slot))
+
+        magnitude, unit = self.vcd.timescale
+        lines = ['(SAIFILE', '(SAIFVERSION "2.0")', '(DIRECTION "backward")', f'(DESIGN "{design}")',
+                 f'(DATE "{clock.strftime("%a %b %d %H:%M:%S %Y")}")', '(VENDOR "Missionary-Cannibal Logic Design Project")',
+                 '(PROGRAM_NAME "switching_activity.py")', '(DIVIDER . )',
+                 f'(TIMESCALE {magnitude} {unit})', f'(DURATION {self.duration})']
+
+        def emit(node, name, depth):
+            indent = '  ' * depth
+            lines.append(f'{indent}(INSTANCE {name}')
+            nets = node.get(None, [])
+            if nets:
+                lines.append(f'{indent}  (NET')
+                for net, slot in nets:
+                    lines.append(f'{indent}    ({net}')
+                    lines.append(f'{indent}      (T0 {self.time_in[_ZERO][slot]}) (T1 {self.time_in[_ONE][slot]}) '
+                                 f'(TX {self.time_in[_UNKNOWN][slot]})')
+                    lines.append(f'{indent}      (TC {self.toggles[slot]}) (IG {self.glitches[slot]})')
+                    lines.append(f'{indent}    )')
+                lines.append(f'{indent}  )')
+            for child, subtree in node.items():
+                if child is not None:
+                    emit(subtree, child, depth + 1)
+            lines.append(f'{indent})')
+
+        for top, subtree in tree.items():
+            if top is not None:
+                emit(subtree, top, 0)
+        lines.append(')')
+        with open(path, 'w') as f:
+            f.write('\n'.join(lines) + '\n')
+
+# Power estimate ----------------------------------------------------------------
+
+def transition_density_power(cover, num_vars, probabilities, densities):
+    """Switched-capacitance estimate of a two-level cover by transition density
+
+    Each net contributes its transition density (Najm: the sum of input
+    densities weighted by the probability that the net is sensitive to
+    them) times the number of gate inputs it drives.  Inputs are assumed
+    spatially independent; the value is relative, in toggles per time unit
+    times gate-input loads.
+    """
+    terms = []
+    input_load = [0] * num_vars
+    inverted_load = [0] * num_vars
+    for value, mask in cover:
+        literals = []
+        for index in range(num_vars):
+            position = num_vars - 1 - index
+            if not (mask >> position) & 1:
+                positive = (value >> position) & 1
+                p = probabilities[index] if positive else 1 - probabilities[index]
+                literals.append((p, densities[index]))
+                if positive:
+                    input_load[index] += 1
+                else:
+                    inverted_load[index] += 1
+        terms.append(literals)
+
+    power = 0.0
+    for index in range(num_vars):
+        power += densities[index] * input_load[index]
+        if inverted_load[index]:
+            # The inverter itself is a load on the input, its output drives the terms
+            power += densities[index] * (1 + inverted_load[index])
+
+    or_inputs = []
+    for literals in terms:
+        probability = 1.0
+        for p, _ in literals:
+            probability *= p
+        density = 0.0
+        for i, (p_i, d_i) in enumerate(literals):
+            sensitivity = 1.0
+            for j, (p_j, _) in enumerate(literals):
+                if j != i:
+                    sensitivity *= p_j
+            density += sensitivity * d_i
+        or_inputs.append((probability, density))
+
+    if len(or_inputs) > 1:
+        output = 0.0
+        for k, (_, d_k) in enumerate(or_inputs):
+            power += d_k  # AND output drives one OR input
+            sensitivity = 1.0
+            for m, (p_m, _) in enumerate(or_inputs):
+                if m != k:
+                    sensitivity *= 1 - p_m
+            output += sensitivity * d_k
+        power += output
+    elif or_inputs:
+        power += or_inputs[0][1]
+    return power
+
+def compare_logic_power(activity, input_bits=DEFAULT_INPUT_BITS, num_vars=5):
+    """Relative dynamic power of canonical versus minimized next-state logic"""
+    probabilities, densities = [], []
+    for reference in input_bits:
+        if reference == '-':
+            probabilities.append(None)
+            densities.append(None)
+            continue
+        slot = activity.slot_of(reference)
+        probabilities.append(activity.static_probability(slot))
+        densities.append(activity.toggle_density(slot))
+    known = [d for d in densities if d is not None]
+    fallback = sum(known) / len(known) if known else 1.0
+    probabilities = [0.5 if p is None else p for p in probabilities]
+    densities = [fallback if d is None else d for d in densities]
+
+    results = {}
+    for name, minterms in NEXT_STATE_FUNCTIONS.items():
+        original = [(m, 0) for m in minterms]
+        optimized = minimize(minterms, num_vars=num_vars)
+        results[name] = (transition_density_power(original, num_vars, probabilities, densities),
+                         transition_density_power(optimized, num_vars, probabilities, densities),
+                         sum(cube_literal_count(c, num_vars) for c in original),
+                         sum(cube_literal_count(c, num_vars) for c in optimized))
+    return results, probabilities, densities
+
+def _ratio(optimized, original):
+    """Optimized/original load, n/a when the inputs never toggle"""
+    return f"{optimized / original:.2f}" if original else "n/a"
+
+def main():
+    default_vcd = os.path.join(os.path.dirname(__file__), '..', 'Simulation_Results', 'complete_system.vcd')
+    parser = argparse.ArgumentParser(description="Switching activity and relative dynamic power from a VCD dump")
+    parser.add_argument('vcd', nargs='?', default=default_vcd)
+    parser.add_argument('--saif', help="write a SAIF file")
+    parser.add_argument('--glitch-window', type=int, default=0,
+                        help="pulses no wider than this many time units count as glitches (default 0)")
+    parser.add_argument('--inputs', nargs=5, metavar='BIT',
+                        help="signal bits driving M1 M0 C1 C0 D ('-' if absent; "
+                             "default: the next-state testbench ports)")
+    parser.add_argument('--top', type=int, default=15, help="most active bits to list")
+    args = parser.parse_args()
+
+    with VCDFile(args.vcd) as vcd:
+        began = clock.perf_counter()
+        activity = SwitchingActivity(vcd, args.glitch_window).run()
+        elapsed = clock.perf_counter() - began
+        print("SWITCHING ACTIVITY ANALYSIS")
+        print("=" * 60)
+        print(f"Dump: {args.vcd}")
+        print(f"Duration: {activity.duration} x {vcd.timescale[0]}{vcd.timescale[1]}, "
+              f"{activity.slots} signal bits, analyzed in {elapsed:.3f}s")
+
+        rows = sorted(activity.bit_names(), key=lambda row: -activity.toggles[row[2]])
+        print(f"\n{'Signal bit':<44} {'Toggles':>8} {'P(1)':>6} {'Glitches':>9}")
+        print("-" * 70)
+        shown = set()
+        for name, bit, slot in rows:
+            if slot in shown or len(shown) >= args.top:
+                continue
+            shown.add(slot)
+            label = name if bit is None else f"{name}[{bit}]"
+            print(f"{label:<44} {activity.toggles[slot]:>8} {activity.static_probability(slot):>6.3f} "
+                  f"{activity.glitches[slot]:>9}")
+
+        if args.saif:
+            activity.write_saif(args.saif, design=next(iter(vcd.signals)).split('.')[0])
+            print(f"\nSAIF written to {args.saif}")
+
+        try:
+            results, probabilities, densities = compare_logic_power(activity, args.inputs or DEFAULT_INPUT_BITS)
+        except KeyError as error:
+            if args.inputs:
+                parser.error(f"--inputs: {error.args[0]}")
+            print(f"\nPower comparison skipped: {error.args[0]} (name the input bits with --inputs)")
+            return
+        print("\nRELATIVE DYNAMIC POWER OF NEXT-STATE LOGIC (transition density)")
+        print("-" * 60)
+        print("Inputs: " + ', '.join(f"{v}: p={p:.2f} d={d * 1e6:.2f}/Mu" for v, p, d in
+                                     zip(['M1', 'M0', 'C1', 'C0', 'D'], probabilities, densities)))
+        print(f"{'Output':<20} {'Original':>10} {'Optimized':>10} {'Ratio':>7}")
+        total_original = total_optimized = 0.0
+        for name, (original, optimized, _, _) in results.items():
+            total_original += original
+            total_optimized += optimized
+            print(f"{name:<20} {original * 1e6:>10.2f} {optimized * 1e6:>10.2f} {_ratio(optimized, original):>7}")
+        print(f"{'Total':<20} {total_original * 1e6:>10.2f} {total_optimized * 1e6:>10.2f} "
+              f"{_ratio(total_optimized, total_original):>7}")
+        print("(switched load in gate-input toggles per million time units)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+
+# Static timing analysis of the next-state logic
+# Minimized covers become a levelized gate network (logic_network.py) with
+# per-gate delays from a configurable library.  Arrival times propagate
+# forward and required times backward in one sweep each over the node
+# order, giving slack at every node, the critical path and Fmax against the
+# clock in Timing_Reports/timing_constraints.sdc.
+
+import argparse
+import json
+import os
+import re
+from collections import namedtuple
+
+from boolean_minimizer import NEXT_STATE_FUNCTIONS, minimize, illegal_puzzle_inputs
+from logic_network import from_covers, from_minterms, INPUT
+
+SDC_PATH = os.path.join(os.path.dirname(__file__), '..', 'Timing_Reports', 'timing_constraints.sdc')
+
+# Delays in ns: intrinsic delay, extra delay per input beyond the first, and
+# extra delay per fan-out load driven
+DEFAULT_LIBRARY = {
+    'NOT': {'intrinsic': 0.05, 'per_input': 0.0},
+    'AND': {'intrinsic': 0.12, 'per_input': 0.04},
+    'OR': {'intrinsic': 0.14, 'per_input': 0.04},
+    'per_fanout': 0.02,
+    'max_fanin': 2,
+}
+
+TimingConstraints = namedtuple('TimingConstraints', ['clock_period', 'setup_uncertainty',
+                                                     'input_delays', 'output_delays'])
+TimingReport = namedtuple('TimingReport', ['arrival', 'required', 'output_slack', 'worst_slack',
+                                           'critical_path', 'min_period'])
+
+_PORTS = re.compile(r'\[get_ports\s+\{?([^}\]]*)\}?\]')
+
+def parse_sdc(path=SDC_PATH):
+    """Clock period, setup uncertainty and max I/O delays (per port) of an SDC file"""
+    period, uncertainty = None, 0.0
+    input_delays, output_delays = {}, {}
+    with open(path) as f:
+        for line in f:
+            line = line.split('#', 1)[0].strip()
+            if not line:
+                continue
+            words = line.split()
+            if words[0] == 'create_clock':
+                period = float(words[words.index('-period') + 1])
+            elif words[0] == 'set_clock_uncertainty' and '-hold' not in words:
+                uncertainty = float(line.rsplit(None, 1)[-1])
+            elif words[0] in ('set_input_delay', 'set_output_delay') and '-max' in words:
+                delay = float(words[words.index('-max') + 1])
+                ports = _PORTS.search(line)
+                target = input_delays if words[0] == 'set_input_delay' else output_delays
+                for port in (ports.group(1).split() if ports else ['*']):
+                    target[port] = delay
+    if period is None:
+        raise ValueError(f"{path}: no create_clock")
+    return TimingConstraints(period, uncertainty, input_delays, output_delays)
+
+def load_library(path=None):
+    """Gate library: the defaults, overridden by a JSON file if given"""
+    library = json.loads(json.dumps(DEFAULT_LIBRARY))
+    if path:
+        with open(path) as f:
+            for key, value in json.load(f).items():
+                if isinstance(value, dict):
+                    library.setdefault(key, {}).update(value)
+                else:
+                    library[key] = value
+    return library
+
+def gate_delays(network, library):
+    """Delay of every node: 0 for inputs and constants"""
+    fanout = network.fanout_counts()
+    delays = [0.0] * len(network)
+    for node in network.gates():
+        cell = library[network.kinds[node]]
+        delays[node] = (cell['intrinsic'] + cell['per_input'] * (len(network.fanins[node]) - 1)
+                        + library['per_fanout'] * fanout[node])
+    return delays
+
+def analyze_timing(network, library, clock_period, uncertainty=0.0, input_delay=0.0, output_delay=0.0):
+    """Arrival/required-time propagation, linear in the network size
+
+    Inputs arrive input_delay after the launching edge; outputs are
+    required output_delay plus the uncertainty before the next edge.
+    """
+    delays = gate_delays(network, library)
+    arrival = [0.0] * len(network)
+    for node in range(len(network)):
+        sources = network.fanins[node]
+        if network.kinds[node] == INPUT:
+            arrival[node] = input_delay
+        elif sources:
+            arrival[node] = max(arrival[source] for source in sources) + delays[node]
+
+    budget = clock_period - uncertainty - output_delay
+    required = [float('inf')] * len(network)
+    for node in network.outputs.values():
+        required[node] = min(required[node], budget)
+    for node in range(len(network) - 1, -1, -1):
+        if required[node] != float('inf'):
+            for source in network.fanins[node]:
+                required[source] = min(required[source], required[node] - delays[node])
+
+    output_slack = {name: budget - arrival[node] for name, node in network.outputs.items()}
+    worst_output = min(output_slack, key=output_slack.get)
+    # Walk back from the worst output through the latest-arriving fan-in
+    path = [network.outputs[worst_output]]
+    while network.fanins[path[-1]]:
+        path.append(max(network.fanins[path[-1]], key=lambda source: arrival[source]))
+    path.reverse()
+    latest = max(arrival[node] for node in network.outputs.values())
+    return TimingReport(arrival, required, output_slack, output_slack[worst_output],
+                        (worst_output, path), latest + output_delay + uncertainty)
+
+def _network_row(label, network, report):
+    fmax = 1000.0 / report.min_period if report.min_period > 0 else float('inf')
+    print(f"{label:<12} {network.gate_count():>6} {network.gate_inputs():>7} {network.depth():>7} "
+          f"{max(report.arrival[n] for n in network.outputs.values()):>9.2f} {report.worst_slack:>8.2f} "
+          f"{fmax:>9.0f}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Static timing of original versus minimized next-state logic")
+    parser.add_argument('--sdc', default=SDC_PATH)
+    parser.add_argument('--library', help="JSON gate library overriding the default delays")
+    parser.add_argument('--max-fanin', type=int, help="widest gate in the library (default from library)")
+    parser.add_argument('--dont-cares', action='store_true', help="minimize with unsafe puzzle inputs as don't cares")
+    args = parser.parse_args()
+
+    constraints = parse_sdc(args.sdc)
+    library = load_library(args.library)
+    max_fanin = args.max_fanin or library['max_fanin']
+    # The logic's inputs and outputs are budgeted like the worst constrained ports
+    input_delay = max(constraints.input_delays.values(), default=0.0)
+    output_delay = max(constraints.output_delays.values(), default=0.0)
+
+    dont_cares = illegal_puzzle_inputs() if args.dont_cares else ()
+    covers = {name: minimize(minterms, num_vars=5, dont_cares=dont_cares)
+              for name, minterms in NEXT_STATE_FUNCTIONS.items()}
+    networks = [('Original', from_minterms(NEXT_STATE_FUNCTIONS, max_fanin=max_fanin)),
+                ('Optimized', from_covers(covers, max_fanin=max_fanin))]
+    reports = [analyze_timing(network, library, constraints.clock_period, constraints.setup_uncertainty,
+                              input_delay, output_delay) for _, network in networks]
+
+    print("STATIC TIMING ANALYSIS")
+    print("=" * 60)
+    print(f"Clock: {constraints.clock_period} ns ({1000 / constraints.clock_period:.0f} MHz), "
+          f"setup uncertainty {constraints.setup_uncertainty} ns")
+    print(f"Input delay {input_delay} ns, output delay {output_delay} ns, "
+          f"budget {constraints.clock_period - constraints.setup_uncertainty - input_delay - output_delay:.2f} ns")
+    print(f"Gates limited to {max_fanin} inputs")
+
+    print(f"\n{'Output':<20} {'Levels':>13} {'Arrival (ns)':>17} {'Slack (ns)':>17}")
+    print(f"{'':<20} {'orig':>6} {'opt':>6} {'orig':>8} {'opt':>8} {'orig':>8} {'opt':>8}")
+    print("-" * 72)
+    for name in NEXT_STATE_FUNCTIONS:
+        (_, original), (_, optimized) = networks
+        a, b = reports
+        print(f"{name:<20} {original.depth(name):>6} {optimized.depth(name):>6} "
+              f"{a.arrival[original.outputs[name]]:>8.2f} {b.arrival[optimized.outputs[name]]:>8.2f} "
+              f"{a.output_slack[name]:>8.2f} {b.output_slack[name]:>8.2f}")
+
+    print(f"\n{'Network':<12} {'Gates':>6} {'Inputs':>7} {'Levels':>7} {'Arrival':>9} {'Slack':>8} {'Fmax MHz':>9}")
+    print("-" * 62)
+    for (label, network), report in zip(networks, reports):
+        _network_row(label, network, report)
+
+    for (label, network), report in zip(networks, reports):
+        output, path = report.critical_path
+        print(f"\nCritical path ({label}, {output}):")
+        for node in path:
+            print(f"  {network.node_label(node):<12} arrives {report.arrival[node]:>6.2f} ns, "
+                  f"slack {report.required[node] - report.arrival[node]:>6.2f} ns")
+        status = "MET" if report.worst_slack >= 0 else "VIOLATED"
+        print(f"  Timing {status} with worst slack {report.worst_slack:.2f} ns")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+
+# Bit-packed truth tables shared by the analysis scripts
+# Each function is stored as one Python integer per set: bit m of the ON-set
+# is 1 when minterm m is 1, with a separate integer for the don't-care set.
+# Membership is a single bit test and AND/OR/NOT/popcount work on the whole
+# table at once (2^n / 64 machine words), so a 20-input function takes 128 KB.
+
+from functools import lru_cache
+
+@lru_cache(maxsize=None)
+def _repeat(width, period, total):
+    """Bitset of `width` ones repeated every `period` bits, `total` bits long"""
+    pattern = (1 << width) - 1
+    length = period
+    while length < total:
+        pattern |= pattern << length
+        length *= 2
+    return pattern & ((1 << total) - 1)
+
+@lru_cache(maxsize=None)
+def variable_bits(num_vars, index):
+    """Packed truth table of input variable `index` (0 = most significant input)"""
+    position = num_vars - 1 - index
+    block = 1 << position
+    return _repeat(block, 2 * block, 1 << num_vars) << block
+
+def _iter_bits(bits):
+    """Yield the indices of the set bits of an integer in increasing order"""
+    while bits:
+        low = bits & -bits
+        yield low.bit_length() - 1
+        bits ^= low
+
+class TruthTable:
+    """Single-output Boolean function stored as packed ON-set and don't-care bitsets"""
+
+    def __init__(self, num_vars, on_bits=0, dc_bits=0):
+        self.num_vars = num_vars
+        self.full = (1 << (1 << num_vars)) - 1
+        self.dc_bits = dc_bits & self.full
+        self.on_bits = on_bits & self.full & ~self.dc_bits
+
+    @classmethod
+    def from_minterms(cls, num_vars, minterms, dont_cares=()):
+        """Build a table from minterm and don't-care lists"""
+        on_bits = 0
+        for m in minterms:
+            on_bits |= 1 << m
+        dc_bits = 0
+        for m in dont_cares:
+            dc_bits |= 1 << m
+        return cls(num_vars, on_bits, dc_bits)
+
+    @classmethod
+    def from_cubes(cls, num_vars, cubes, dc_cubes=()):
+        """Build a table from (value, mask) cubes by word-parallel AND/OR"""
+        return cls(num_vars, cubes_to_bits(num_vars, cubes), cubes_to_bits(num_vars, dc_cubes))
+
+    @classmethod
+    def variable(cls, num_vars, index):
+        """Truth table of a single input variable"""
+        return cls(num_vars, variable_bits(num_vars, index))
+
+    def __contains__(self, minterm):
+        return (self.on_bits >> minterm) & 1 == 1
+
+    def __iter__(self):
+        return _iter_bits(self.on_bits)
+
+    def __len__(self):
+        return self.on_bits.bit_count()
+
+    def __eq__(self, other):
+        return (isinstance(other, TruthTable) and self.num_vars == other.num_vars and
+                self.on_bits == other.on_bits and self.dc_bits == other.dc_bits)
+
+    def __hash__(self):
+        return hash((self.num_vars, self.on_bits, self.dc_bits))
+
+    def __repr__(self):
+        return f"TruthTable(num_vars={self.num_vars}, ones={len(self)}, dont_cares={self.dc_bits.bit_count()})"
+
+    def _check(self, other):
+        if self.num_vars != other.num_vars:
+            raise ValueError(f"Truth tables have different sizes: {self.num_vars} and {other.num_vars} inputs")
+
+    def __and__(self, other):
+        self._check(other)
+        return TruthTable(self.num_vars, self.on_bits & other.on_bits, self.dc_bits | other.dc_bits)
+
+    def __or__(self, other):
+        self._check(other)
+        return TruthTable(self.num_vars, self.on_bits | other.on_bits, self.dc_bits | other.dc_bits)
+
+    def __xor__(self, other):
+        self._check(other)
+        return TruthTable(self.num_vars, self.on_bits ^ other.on_bits, self.dc_bits | other.dc_bits)
+
+    def __invert__(self):
+        return TruthTable(self.num_vars, self.full & ~self.on_bits, self.dc_bits)
+
+    def value(self, minterm):
+        """Value of the function at a minterm: 1, 0 or 'X' for don't care"""
+        if (self.dc_bits >> minterm) & 1:
+            return 'X'
+        return (self.on_bits >> minterm) & 1
+
+    def count(self):
+        """Number of ON-set minterms"""
+        return self.on_bits.bit_count()
+
+    def minterms(self):
+        """Sorted list of ON-set minterms"""
+        return list(_iter_bits(self.on_bits))
+
+    def dont_cares(self):
+        """Sorted list of don't-care minterms"""
+        return list(_iter_bits(self.dc_bits))
+
+    def off_bits(self):
+        """Packed OFF-set: neither ON nor don't care"""
+        return self.full & ~(self.on_bits | self.dc_bits)
+
+    def cofactor(self, index, value):
+        """Cofactor with input `index` fixed to `value`, as an (n-1)-input table"""
+        return TruthTable(self.num_vars - 1,
+                          _compress(self.on_bits, self.num_vars, index, value),
+                          _compress(self.dc_bits, self.num_vars, index, value))
+
+def _compress(bits, num_vars, index, value):
+    """Keep the half of a packed table where input `index` equals `value`"""
+    position = num_vars - 1 - index
+    block = 1 << position
+    total = 1 << num_vars
+    if value:
+        bits >>= block
+    bits &= _repeat(block, 2 * block, total)
+    # Close the gaps between kept blocks, doubling the block width each step
+    shift = block
+    while shift < total // 2:
+        bits = (bits | (bits >> shift)) & _repeat(2 * shift, 4 * shift, total)
+        shift *= 2
+    return bits
+
+def cube_bits(num_vars, cube):
+    """Packed truth table of a single (value, mask) cube"""
+    value, mask = cube
+    bits = (1 << (1 << num_vars)) - 1
+    for index in range(num_vars):
+        position = num_vars - 1 - index
+        if (mask >> position) & 1:
+            continue
+        variable = variable_bits(num_vars, index)
+        bits &= variable if (value >> position) & 1 else ~variable
+    return bits
+
+def cubes_to_bits(num_vars, cubes):
+    """Packed truth table of a sum of (value, mask) cubes"""
+    bits = 0
+    for cube in cubes:
+        bits |= cube_bits(num_vars, cube)
+    return bits
+
+def as_truth_table(function, num_vars, dont_cares=()):
+    """Accept a TruthTable or a minterm list (plus extra don't cares) and return a TruthTable"""
+    if isinstance(function, TruthTable):
+        if not dont_cares:
+            return function
+        extra = TruthTable.from_minterms(num_vars, (), dont_cares)
+        return TruthTable(num_vars, function.on_bits, function.dc_bits | extra.dc_bits)
+    return TruthTable.from_minterms(num_vars, function, dont_cares)
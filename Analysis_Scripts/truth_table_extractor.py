@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+
+# Truth-table extraction from simulation
+# Samples input -> next-state pairs at clock edges, from a VCD dump or from
+# the compiled model, and builds packed truth tables incrementally.  Input
+# combinations that never occur become don't cares, so the tables go
+# straight to the minimizer without hand-transcribed Σm lists.
+
+import argparse
+import random
+
+from boolean_minimizer import NEXT_STATE_FUNCTIONS, minimize, cover_to_expression
+from hdl_model import simulate
+from truth_table import TruthTable
+from vcd_reader import VCDFile, parse_value
+
+# Signal specs are "name" or "name:width" (width keeps the low bits)
+DEFAULT_INPUTS = ['missionary_curr:2', 'cannibal_curr:2', 'direction:1']
+DEFAULT_OUTPUTS = ['missionary_next:2', 'cannibal_next:2']
+# Signals of the model samples do not exist in the dumps; sample the state register instead
+DEFAULT_VCD_INPUTS = ['dut.current_state']
+DEFAULT_VCD_OUTPUTS = ['dut.next_state']
+
+def parse_spec(spec):
+    """(name, width or None) of a "name[:width]" signal spec"""
+    name, _, width = spec.partition(':')
+    return name, int(width) if width else None
+
+def _short_name(name):
+    return name.rsplit('.', 1)[-1]
+
+class TruthTableBuilder:
+    """Accumulates samples into one packed truth table per output bit
+
+    Inputs are concatenated in the given order, first signal most
+    significant.  An input seen with two different output values is a
+    conflict: it is reported and left as a don't care.
+    """
+
+    def __init__(self, inputs, outputs):
+        self.inputs = inputs
+        self.outputs = outputs
+        self.num_vars = sum(width for _, width in inputs)
+        if self.num_vars > 24:
+            raise ValueError(f"{self.num_vars} input bits is too many for a packed truth table")
+        self.output_bits = []
+        for name, width in outputs:
+            base = _short_name(name).upper()
+            for bit in range(width - 1, -1, -1):
+                self.output_bits.append(f"{base}[{bit}]" if width > 1 else base)
+        self.seen = 0
+        self.on = [0] * len(self.output_bits)
+        self.conflicts = 0
+        self.samples = 0
+        self.skipped = 0
+
+    def _pack(self, sample, fields):
+        word = 0
+        for name, width in fields:
+            value = sample.get(name)
+            if value is None:
+                return None
+            word = (word << width) | (value & ((1 << width) - 1))
+        return word
+
+    def add(self, sample):
+        """Record one {signal: value} sample, returns False if it had x/z values"""
+        minterm = self._pack(sample, self.inputs)
+        result = self._pack(sample, self.outputs)
+        if minterm is None or result is None:
+            self.skipped += 1
+            return False
+        self.samples += 1
+        bit = 1 << minterm
+        width = len(self.output_bits)
+        for index in range(width):
+            value = (result >> (width - 1 - index)) & 1
+            if self.seen & bit and ((self.on[index] >> minterm) & 1) != value:
+                self.conflicts |= bit
+            if value:
+                self.on[index] |= bit
+        self.seen |= bit
+        return True
+
+    def tables(self):
+        """{output bit name: TruthTable} with unseen and conflicting inputs as don't cares"""
+        full = (1 << (1 << self.num_vars)) - 1
+        dont_cares = (full & ~self.seen) | self.conflicts
+        return {name: TruthTable(self.num_vars, on, dont_cares) for name, on in zip(self.output_bits, self.on)}
+
+    def coverage(self):
+        """Number of distinct input combinations sampled"""
+        return self.seen.bit_count()
+
+def vcd_samples(vcd, clock, names, edge='posedge'):
+    """Yield {name: value} for the given signals just before every clock edge
+
+    Values are taken from the end of the previous timestamp, so changes
+    that share the edge's timestamp (the registers' new values) are not
+    sampled.
+    """
+    clock_code = vcd.find(clock).code
+    fields = [(name, vcd.find(name).code) for name in names]
+    wanted = {code for _, code in fields} | {clock_code}
+    current = {code: None for code in wanted}
+    settled = dict(current)
+    time = None
+    for t, code, raw in vcd.changes(codes=wanted):
+        if t != time:
+            settled = dict(current)
+            time = t
+        value = parse_value(raw)
+        if code == clock_code:
+            old = settled[clock_code]
+            if (edge == 'posedge' and old == 0 and value == 1) or (edge == 'negedge' and old == 1 and value == 0):
+                yield {name: settled[code] for name, code in fields}
+        current[code] = value
+
+def model_samples(cycles=20000, reset_rate=1 / 64, start_rate=1 / 8, seed=0):
+    """Yield puzzle-position samples from the compiled model of missionary_cannibal_complete
+
+    Every crossing gives (missionary_curr, cannibal_curr, direction) ->
+    (missionary_next, cannibal_next) from the left-bank counts and boat
+    side before and after the edge.  Cycles where the position does not
+    change (holding, IDLE -> S1) and resets are skipped.
+    """
+    rng = random.Random(seed)
+    stimulus = [(1 if cycle == 0 or rng.random() < reset_rate else 0, 1 if rng.random() < start_rate else 0)
+                for cycle in range(cycles)]
+    previous = None
+    for (reset, _), (_, _, outputs) in zip(stimulus, simulate(stimulus)):
+        position = (outputs['missionaries_left'], outputs['cannibals_left'], outputs['boat_side'])
+        if previous is not None and not reset and position != previous:
+            yield {'missionary_curr': previous[0], 'cannibal_curr': previous[1], 'direction': previous[2],
+                   'missionary_next': position[0], 'cannibal_next': position[1]}
+        previous = position
+
+def extract(samples, inputs, outputs):
+    """Build a TruthTableBuilder from an iterable of samples in one pass"""
+    builder = TruthTableBuilder(inputs, outputs)
+    for sample in samples:
+        builder.add(sample)
+    return builder
+
+def _resolve(vcd, specs):
+    """Fill missing widths from the VCD header and resolve names to full paths"""
+    resolved = []
+    for name, width in specs:
+        signal = vcd.find(name)
+        resolved.append((signal.name, width if width is not None else signal.width))
+    return resolved
+
+def main():
+    parser = argparse.ArgumentParser(description="Extract next-state truth tables from a VCD dump or the compiled model")
+    parser.add_argument('--vcd', help="dump to sample (default: the compiled model)")
+    parser.add_argument('--clock', default='clock', help="clock signal in the dump")
+    parser.add_argument('--edge', choices=['posedge', 'negedge'], default='posedge')
+    parser.add_argument('--inputs', nargs='+', help=f"input signals as name[:width] (default {' '.join(DEFAULT_INPUTS)}, "
+                                                    f"or {' '.join(DEFAULT_VCD_INPUTS)} with --vcd)")
+    parser.add_argument('--outputs', nargs='+', help=f"output signals as name[:width] (default {' '.join(DEFAULT_OUTPUTS)}, "
+                                                     f"or {' '.join(DEFAULT_VCD_OUTPUTS)} with --vcd)")
+    parser.add_argument('--cycles', type=int, default=20000, help="model cycles to simulate")
+    args = parser.parse_args()
+
+    default_inputs, default_outputs = (DEFAULT_VCD_INPUTS, DEFAULT_VCD_OUTPUTS) if args.vcd else (DEFAULT_INPUTS, DEFAULT_OUTPUTS)
+    inputs = [parse_spec(s) for s in (args.inputs or default_inputs)]
+    outputs = [parse_spec(s) for s in (args.outputs or default_outputs)]
+
+    print("TRUTH TABLE EXTRACTION")
+    print("=" * 60)
+    if args.vcd:
+        with VCDFile(args.vcd) as vcd:
+            try:
+                inputs, outputs = _resolve(vcd, inputs), _resolve(vcd, outputs)
+                vcd.find(args.clock)
+            except KeyError as error:
+                parser.error(f"{error.args[0]} (choose signals with --inputs/--outputs/--clock)")
+            names = [name for name, _ in inputs + outputs]
+            builder = extract(vcd_samples(vcd, args.clock, names, args.edge), inputs, outputs)
+        print(f"Source: {args.vcd} ({args.edge} of {args.clock})")
+    else:
+        builder = extract(model_samples(args.cycles), inputs, outputs)
+        print(f"Source: compiled model, {args.cycles} random cycles")
+
+    var_names = []
+    for name, width in inputs:
+        base = _short_name(name)
+        var_names += [f"{base}[{bit}]" for bit in range(width - 1, -1, -1)] if width > 1 else [base]
+    print(f"Inputs: {' '.join(var_names)}")
+    print(f"Samples: {builder.samples} ({builder.skipped} skipped with x/z values)")
+    print(f"Input combinations seen: {builder.coverage()} of {1 << builder.num_vars}")
+    if builder.conflicts:
+        print(f"Conflicting samples (kept as don't cares): {TruthTable(builder.num_vars, builder.conflicts).minterms()}")
+
+    for name, table in builder.tables().items():
+        cover = minimize(table, num_vars=builder.num_vars)
+        print(f"\n{name}:")
+        print(f"  Σm{table.minterms()}")
+        print(f"  {len(table.dont_cares())} don't cares")
+        print(f"  Minimized: {cover_to_expression(cover, builder.num_vars, var_names)}")
+        if name in NEXT_STATE_FUNCTIONS and builder.num_vars == 5:
+            # Compare only where the hand-written list and the samples both define a value
+            listed = TruthTable.from_minterms(5, NEXT_STATE_FUNCTIONS[name])
+            care = builder.seen & ~builder.conflicts
+            disagree = ((listed.on_bits ^ table.on_bits) & care).bit_count()
+            print(f"  Hand-written Σm list differs on {disagree} of {care.bit_count()} sampled inputs")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+
+# Streaming regression diff of two VCD dumps
+# Both dumps are walked in lockstep one timestamp at a time, so memory stays
+# proportional to the number of signals, not the dump length.  Signals are
+# matched by hierarchical name (identifier codes differ between runs),
+# compared at the end of every timestamp, and the walk stops at the first
+# divergence.
+
+import argparse
+import sys
+from collections import namedtuple
+from fnmatch import fnmatchcase
+
+from vcd_reader import VCDFile, parse_value
+
+DiffResult = namedtuple('DiffResult', ['equal', 'time', 'signal', 'value_a', 'value_b',
+                                       'compared', 'only_in_a', 'only_in_b', 'timestamps'])
+
+def _normalize(name, strip_top):
+    """Hierarchical name used for matching, optionally without the testbench scope"""
+    return name.split('.', 1)[1] if strip_top and '.' in name else name
+
+def _grouped(changes, scale):
+    """Group a change stream into (time in ps, [(code, raw), ...]) per timestamp"""
+    time, group = None, []
+    for t, code, raw in changes:
+        if t != time and group:
+            yield time * scale, group
+            group = []
+        time = t
+        group.append((code, raw))
+    if group:
+        yield time * scale, group
+
+def _tolerance_for(name, tolerances):
+    for pattern, tolerance in tolerances:
+        if fnmatchcase(name, pattern):
+            return tolerance
+    return 0
+
+def _values_match(a, b, tolerance):
+    if a == b:
+        return True
+    if tolerance and a is not None and b is not None:
+        return abs(a - b) <= tolerance
+    return False
+
+def diff_vcd(path_a, path_b, ignore=(), tolerances=(), strip_top=False):
+    """Compare two dumps and return a DiffResult for the first divergence
+
+    ignore is a list of glob patterns of signal names to skip; tolerances
+    is a list of (glob pattern, allowed absolute difference) pairs, first
+    match wins.  Times are compared in picoseconds, so dumps with
+    different timescales line up.  Dumps that share no compared signal
+    are not equal (compared is 0), since nothing was checked.
+    """
+    with VCDFile(path_a) as a, VCDFile(path_b) as b:
+        names_a = {_normalize(n, strip_top): s for n, s in a.signals.items()}
+        names_b = {_normalize(n, strip_top): s for n, s in b.signals.items()}
+        compared = sorted(n for n in names_a.keys() & names_b.keys()
+                          if not any(fnmatchcase(n, pattern) for pattern in ignore))
+        only_a = sorted(names_a.keys() - names_b.keys())
+        only_b = sorted(names_b.keys() - names_a.keys())
+        if not compared:
+            return DiffResult(False, None, None, None, None, 0, only_a, only_b, 0)
+
+        # Identifier code -> compared names, per dump
+        watch_a, watch_b = {}, {}
+        for name in compared:
+            watch_a.setdefault(names_a[name].code, []).append(name)
+            watch_b.setdefault(names_b[name].code, []).append(name)
+        tolerance = {name: _tolerance_for(name, tolerances) for name in compared}
+        values_a = {name: None for name in compared}
+        values_b = {name: None for name in compared}
+
+        stream_a = _grouped(a.changes(codes=watch_a.keys()), a.timescale_ps())
+        stream_b = _grouped(b.changes(codes=watch_b.keys()), b.timescale_ps())
+        try:
+            next_a, next_b = next(stream_a, None), next(stream_b, None)
+            timestamps = 0
+            while next_a is not None or next_b is not None:
+                time = min(group[0] for group in (next_a, next_b) if group is not None)
+                touched = set()
+                if next_a is not None and next_a[0] == time:
+                    for code, raw in next_a[1]:
+                        for name in watch_a[code]:
+                            values_a[name] = parse_value(raw)
+                            touched.add(name)
+                    next_a = next(stream_a, None)
+                if next_b is not None and next_b[0] == time:
+                    for code, raw in next_b[1]:
+                        for name in watch_b[code]:
+                            values_b[name] = parse_value(raw)
+                            touched.add(name)
+                    next_b = next(stream_b, None)
+                timestamps += 1
+                # Only signals that changed in either dump can have started to differ
+                for name in sorted(touched):
+                    if not _values_match(values_a[name], values_b[name], tolerance[name]):
+                        return DiffResult(False, time, name, values_a[name], values_b[name],
+                                          len(compared), only_a, only_b, timestamps)
+            return DiffResult(True, None, None, None, None, len(compared), only_a, only_b, timestamps)
+        finally:
+            # Release the generators' views of the mapped files before they close
+            stream_a.close()
+            stream_b.close()
+
+def _format_value(value):
+    return 'x' if value is None else str(value)
+
+def _parse_tolerance(text):
+    pattern, _, amount = text.rpartition('=')
+    if not pattern:
+        raise argparse.ArgumentTypeError(f"Tolerance must be PATTERN=AMOUNT, got '{text}'")
+    return pattern, float(amount)
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare two VCD dumps and stop at the first divergence")
+    parser.add_argument('reference', help="golden dump, e.g. Simulation_Results/complete_system.vcd")
+    parser.add_argument('candidate', help="new dump to check")
+    parser.add_argument('--ignore', nargs='*', default=[], metavar='GLOB', help="signal names to skip")
+    parser.add_argument('--tolerance', nargs='*', default=[], type=_parse_tolerance, metavar='GLOB=AMOUNT',
+                        help="allowed absolute value difference per signal")
+    parser.add_argument('--strip-top', action='store_true', help="match names without the top-level testbench scope")
+    args = parser.parse_args()
+
+    result = diff_vcd(args.reference, args.candidate, args.ignore, args.tolerance, args.strip_top)
+    print("VCD REGRESSION DIFF")
+    print("=" * 60)
+    print(f"Reference: {args.reference}")
+    print(f"Candidate: {args.candidate}")
+    print(f"Signals compared: {result.compared}")
+    if result.only_in_a:
+        print(f"Only in reference ({len(result.only_in_a)}): {', '.join(result.only_in_a)}")
+    if result.only_in_b:
+        print(f"Only in candidate ({len(result.only_in_b)}): {', '.join(result.only_in_b)}")
+    if not result.compared:
+        # Usually a different testbench scope; a gate that checked nothing must not pass
+        print("\nResult: NOTHING COMPARED (no shared signal names; check the scope or --strip-top)")
+        return 2
+    if result.equal:
+        print(f"\nResult: MATCH ({result.timestamps} timestamps)")
+        return 0
+    print(f"\nResult: DIVERGENCE at {result.time} ps (timestamp {result.timestamps})")
+    print(f"  Signal:    {result.signal}")
+    print(f"  Reference: {_format_value(result.value_a)}")
+    print(f"  Candidate: {_format_value(result.value_b)}")
+    return 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,328 @@
+#!/usr/bin/env python3
+
+# Streaming, memory-mapped VCD reader
+# The header ($scope/$var) is parsed once; value changes are then streamed
+# straight out of the mapped file by a generator, so a dump is never loaded
+# into memory.  Random-access queries use a sparse index of checkpoints
+# (file offset plus a snapshot of every signal) and only rescan from the
+# nearest checkpoint.  A columnar cache (per-signal time/value arrays from
+# the array module) can be saved next to the dump so repeat loads skip
+# parsing entirely.
+
+import argparse
+import difflib
+import mmap
+import os
+import pickle
+import re
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import namedtuple
+
+Signal = namedtuple('Signal', ['name', 'code', 'width', 'kind'])
+
+# Checkpoint spacing in bytes of value-change data
+CHECKPOINT_BYTES = 1 << 20
+CACHE_SUFFIX = '.vcdcache'
+CACHE_VERSION = 1
+
+_TOKEN = re.compile(rb'\S+')
+_TIMESCALE = re.compile(r'(\d+)\s*([a-z]+)')
+_UNIT_PS = {'s': 10**12, 'ms': 10**9, 'us': 10**6, 'ns': 10**3, 'ps': 1, 'fs': 10**-3}
+
+def parse_value(raw):
+    """Integer value of a raw VCD value string, None if any bit is x/z, float for reals"""
+    if raw[0] in 'rR':
+        return float(raw[1:])
+    if raw[0] in 'bB':
+        raw = raw[1:]
+    if raw.strip('01'):
+        return None
+    return int(raw, 2)
+
+class VCDFile:
+    """Memory-mapped VCD dump with streamed value changes and indexed queries"""
+
+    def __init__(self, path, checkpoint_bytes=CHECKPOINT_BYTES):
+        self.path = path
+        self.checkpoint_bytes = checkpoint_bytes
+        self._file = open(path, 'rb')
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.signals = {}
+        self.codes = {}
+        self.timescale = (1, 'ps')
+        self.body_offset = self._parse_header()
+        self._checkpoints = None
+        self._checkpoint_times = None
+        self._columns = None
+        self.end_time = None
+
+    def close(self):
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # Header -----------------------------------------------------------------
+
+    def _parse_header(self):
+        scopes = []
+        tokens = _TOKEN.finditer(self._map)
+        for match in tokens:
+            keyword = match.group()
+            if keyword == b'$scope':
+                _, name = next(tokens), next(tokens).group().decode()
+                scopes.append(name)
+            elif keyword == b'$upscope':
+                scopes.pop()
+            elif keyword == b'$var':
+                kind, width, code, reference = (next(tokens).group().decode() for _ in range(4))
+                name = '.'.join(scopes + [reference])
+                self.signals[name] = Signal(name, code, int(width), kind)
+                self.codes.setdefault(code, []).append(name)
+            elif keyword == b'$timescale':
+                text = []
+                for token in tokens:
+                    if token.group() == b'$end':
+                        break
+                    text.append(token.group().decode())
+                magnitude, unit = _TIMESCALE.match(''.join(text)).groups()
+                self.timescale = (int(magnitude), unit)
+                continue
+            elif keyword == b'$enddefinitions':
+                return next(tokens).end()
+            else:
+                continue
+            # Skip to the $end closing this declaration
+            for token in tokens:
+                if token.group() == b'$end':
+                    break
+        raise ValueError(f"{self.path}: no $enddefinitions in header")
+
+    def timescale_ps(self):
+        """Length of one time unit in picoseconds"""
+        magnitude, unit = self.timescale
+        return magnitude * _UNIT_PS[unit]
+
+    def find(self, name):
+        """Signal by full hierarchical name or by a dotted suffix naming one signal"""
+        if name in self.signals:
+            return self.signals[name]
+        matches = [s for full, s in self.signals.items() if full.endswith('.' + name)]
+        # Ports seen from several scopes share one identifier code
+        if matches and len({s.code for s in matches}) == 1:
+            return min(matches, key=lambda s: len(s.name))
+        if not matches:
+            raise KeyError(f"No signal '{name}' in {self.path}")
+        raise KeyError(f"Signal '{name}' is ambiguous: {', '.join(s.name for s in matches)}")
+
+    # Streaming --------------------------------------------------------------
+
+    def _scan(self, offset):
+        """Yield (time, code, raw value) per change and (time, None, offset) per timestamp"""
+        time = 0
+        tokens = _TOKEN.finditer(self._map, offset)
+        for match in tokens:
+            token = match.group()
+            first = token[0]
+            if first == 35:  # '#'
+                time = int(token[1:])
+                yield time, None, match.start()
+            elif first in (98, 66, 114, 82):  # b B r R: vector or real, code follows
+                yield time, next(tokens).group().decode(), token.decode()
+            elif first == 36:  # '$'
+                if token == b'$comment':
+                    for skipped in tokens:
+                        if skipped.group() == b'$end':
+                            break
+                # $dumpvars/$dumpall/$dumpon/$dumpoff/$end only bracket changes
+            else:
+                yield time, token[1:].decode(), chr(first)
+
+    def changes(self, offset=None, codes=None):
+        """Yield (time, code, raw value) for every value change from a file offset
+
+        offset must be the start of the body or of a '#time' token (as
+        stored in checkpoints).  codes optionally restricts the output.
+        """
+        for time, code, raw in self._scan(self.body_offset if offset is None else offset):
+            if code is not None and (codes is None or code in codes):
+                yield time, code, raw
+
+    # Sparse index -------------------------------------------------------------
+
+    def build_index(self):
+        """One pass recording a checkpoint roughly every checkpoint_bytes
+
+        A checkpoint is (time, offset of that '#time' token, values of all
+        codes before the changes at that time).
+        """
+        values = {code: 'x' for code in self.codes}
+        checkpoints = [(0, self.body_offset, dict(values))]
+        last_offset = self.body_offset
+        time = 0
+        for time, code, raw in self._scan(self.body_offset):
+            if code is not None:
+                values[code] = raw
+            elif raw - last_offset >= self.checkpoint_bytes:
+                checkpoints.append((time, raw, dict(values)))
+                last_offset = raw
+        self._checkpoints = checkpoints
+        self._checkpoint_times = [c[0] for c in checkpoints]
+        self.end_time = time
+        return len(checkpoints)
+
+    def _checkpoint_before(self, time):
+        if self._checkpoints is None:
+            self.build_index()
+        # A snapshot excludes the changes at its own time, which the rescan replays
+        index = max(0, bisect_right(self._checkpoint_times, time) - 1)
+        return self._checkpoints[index]
+
+    def value_at(self, name, time):
+        """Value of a signal after all changes at or before `time` (int, float or None for x)"""
+        signal = self.find(name)
+        if self._columns is not None:
+            times, values = self._columns[signal.code]
+            index = bisect_right(times, time) - 1
+            return None if index < 0 else _column_value(values, index)
+        _, offset, snapshot = self._checkpoint_before(time)
+        raw = snapshot[signal.code]
+        for t, _, value in self.changes(offset, {signal.code}):
+            if t > time:
+                break
+            raw = value
+        return parse_value(raw)
+
+    def transitions(self, name, start, end):
+        """List of (time, value) changes of a signal with start <= time <= end"""
+        signal = self.find(name)
+        if self._columns is not None:
+            times, values = self._columns[signal.code]
+            first, last = bisect_left(times, start), bisect_right(times, end)
+            return [(times[i], _column_value(values, i)) for i in range(first, last)]
+        _, offset, _ = self._checkpoint_before(start)
+        result = []
+        for t, _, value in self.changes(offset, {signal.code}):
+            if t > end:
+                break
+            if t >= start:
+                result.append((t, parse_value(value)))
+        return result
+
+    # Columnar cache -----------------------------------------------------------
+
+    def cache_path(self):
+        directory, base = os.path.split(self.path)
+        return os.path.join(directory, '.' + base + CACHE_SUFFIX)
+
+    def _stamp(self):
+        stat = os.stat(self.path)
+        return (CACHE_VERSION, stat.st_size, stat.st_mtime_ns)
+
+    def build_columns(self):
+        """One pass collecting per-code time and value arrays
+
+        Values of signals up to 64 bits wide go into an unsigned array with
+        x/z recorded in a parallel bit mask; reals into a double array;
+        wider vectors keep their raw strings.
+        """
+        columns = {}
+        for code, names in self.codes.items():
+            signal = self.signals[names[0]]
+            if signal.kind == 'real':
+                columns[code] = (array('Q'), array('d'))
+            elif signal.width <= 64:
+                columns[code] = (array('Q'), (array('Q'), array('Q')))
+            else:
+                columns[code] = (array('Q'), [])
+        for time, code, raw in self.changes():
+            times, values = columns[code]
+            times.append(time)
+            if isinstance(values, tuple):
+                value = parse_value(raw)
+                values[0].append(0 if value is None else value)
+                values[1].append(1 if value is None else 0)
+            else:
+                values.append(parse_value(raw) if isinstance(values, array) else raw)
+        self._columns = columns
+        return columns
+
+    def load_columns(self, use_cache=True):
+        """Columnar view of the dump, from the cache file when it is current"""
+        path = self.cache_path()
+        if use_cache and os.path.exists(path):
+            with open(path, 'rb') as f:
+                stamp, columns = pickle.load(f)
+            if stamp == self._stamp():
+                self._columns = columns
+                return columns
+        columns = self.build_columns()
+        if use_cache:
+            temporary = path + '.tmp'
+            with open(temporary, 'wb') as f:
+                pickle.dump((self._stamp(), columns), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temporary, path)
+        return columns
+
+def _column_value(values, index):
+    if isinstance(values, tuple):
+        return None if values[1][index] else values[0][index]
+    if isinstance(values, array):
+        return values[index]
+    return parse_value(values[index])
+
+def _close_names(name, names, limit=5):
+    """Full names whose trailing scopes resemble name, for error hints"""
+    depth = name.count('.') + 1
+    suffixes = {}
+    for full in names:
+        suffixes.setdefault('.'.join(full.split('.')[-depth:]), []).append(full)
+    close = difflib.get_close_matches(name, suffixes, n=limit, cutoff=0.6)
+    return [full for suffix in close for full in suffixes[suffix]][:limit]
+
+def main():
+    parser = argparse.ArgumentParser(description="Inspect a VCD dump")
+    parser.add_argument('vcd', nargs='?', default=os.path.join(os.path.dirname(__file__), '..',
+                                                             'Simulation_Results', 'complete_system.vcd'))
+    parser.add_argument('--signal', help="signal to query (full name or unique suffix)")
+    parser.add_argument('--at', type=int, help="print the value of --signal at this time")
+    parser.add_argument('--range', type=int, nargs=2, metavar=('T0', 'T1'), help="print transitions of --signal in [T0, T1]")
+    parser.add_argument('--cache', action='store_true', help="use (and save) the columnar cache")
+    args = parser.parse_args()
+
+    with VCDFile(args.vcd) as vcd:
+        print(f"VCD: {args.vcd}")
+        print("=" * 60)
+        print(f"Timescale: {vcd.timescale[0]}{vcd.timescale[1]}, {len(vcd.signals)} signals, {len(vcd.codes)} identifier codes")
+        if args.cache:
+            vcd.load_columns()
+            print(f"Columnar cache: {vcd.cache_path()}")
+        if not args.signal:
+            for name, signal in vcd.signals.items():
+                print(f"  {signal.kind:<9} {signal.width:>3}  {name}")
+            return
+        try:
+            signal = vcd.find(args.signal)
+        except KeyError as error:
+            close = _close_names(args.signal, vcd.signals)
+            if close:
+                hint = f"close names: {', '.join(close)}"
+            else:
+                names = list(vcd.signals)
+                hint = f"available: {', '.join(names[:10])}" + (", ... (run without --signal for all)" if len(names) > 10 else '')
+            parser.error(f"{error.args[0]} ({hint})")
+        if args.at is not None:
+            print(f"{signal.name} at {args.at}: {vcd.value_at(signal.name, args.at)}")
+        start, end = args.range if args.range else (0, 2**63 - 1)
+        if args.range or args.at is None:
+            print(f"Transitions of {signal.name}:")
+            for time, value in vcd.transitions(signal.name, start, end):
+                print(f"  #{time:<10} {value}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,680 @@
+#!/usr/bin/env python3
+
+# Verilog front-end for the synthesizable subset used in HDL_Code
+# Parses module port/net declarations, `parameter`, continuous `assign`
+# with ==/!=, logical and bitwise operator trees, and combinational
+# `case` blocks, then turns every driven bit into a packed truth table
+# over the signals it depends on.  Sequential always blocks are skipped.
+# Parse results are cached on disk keyed by the SHA-256 of the source, so
+# repeated analysis runs skip re-parsing unchanged files.
+
+import argparse
+import hashlib
+import os
+import pickle
+import re
+import sys
+from collections import namedtuple
+
+from boolean_minimizer import NEXT_STATE_FUNCTIONS, minimize
+from hdl_model import STATE_DECODE, DEFAULT_DECODE, OUTPUT_PORTS, t_flip_flop_inputs
+from truth_table import TruthTable, variable_bits
+from verilog_generator import INPUT_PORTS, variable_names
+
+HDL_DIR = os.path.join(os.path.dirname(__file__), '..', 'HDL_Code')
+DEFAULT_SOURCES = [os.path.join(HDL_DIR, 'missionary_cannibal_complete.v'),
+                   os.path.join(HDL_DIR, 'missionary_cannibal_next_state.v'),
+                   os.path.join(os.path.dirname(__file__), '..', 'Timing_Reports', 'missionary_cannibal_complete.v')]
+CACHE_DIR = os.path.join(os.path.dirname(__file__), '.verilog_cache')
+PARSER_VERSION = 1
+MAX_SUPPORT = 20
+
+# ranges: {net: (msb, lsb)}; assigns: [(target, bit or None, expr)]
+Module = namedtuple('Module', ['name', 'ports', 'ranges', 'parameters', 'assigns', 'cases', 'skipped'])
+# items: [([label exprs], [(target, bit, expr)])]; default: [(target, bit, expr)] or None
+CaseBlock = namedtuple('CaseBlock', ['selector', 'items', 'default'])
+
+_TOKEN = re.compile(r"""
+    (?P<skip>\s+|//[^\n]*|/\*.*?\*/|`[^\n]*)
+  | (?P<number>\d*\s*'[sS]?[bBoOdDhH]\s*[0-9a-fA-FxXzZ_]+|\d[\d_]*)
+  | (?P<name>[A-Za-z_][A-Za-z0-9_$]*)
+  | (?P<op>==|!=|&&|\|\||<=|>=|[!~&|^()\[\]:;=,@*.#{}<>+\-?])
+""", re.X | re.S)
+_BASES = {'b': 2, 'o': 8, 'd': 10, 'h': 16}
+
+# Binary operators by increasing precedence (Verilog order)
+_PRECEDENCE = [('||', 'lor'), ('&&', 'land'), ('|', 'or'), ('^', 'xor'), ('&', 'and')]
+_EQUALITY = {'==': 'eq', '!=': 'ne'}
+
+def tokenize(text):
+    """List of (kind, text, line) tokens with comments and directives removed"""
+    tokens = []
+    line, position = 1, 0
+    while position < len(text):
+        match = _TOKEN.match(text, position)
+        if not match:
+            raise SyntaxError(f"line {line}: unexpected character {text[position]!r}")
+        if match.lastgroup != 'skip':
+            tokens.append((match.lastgroup, match.group().replace(' ', ''), line))
+        line += match.group().count('\n')
+        position = match.end()
+    return tokens
+
+def parse_number(text):
+    """(value, width or None) of a Verilog number literal"""
+    text = text.replace('_', '')
+    if "'" not in text:
+        return int(text), None
+    width, _, rest = text.partition("'")
+    rest = rest.lstrip('sS')
+    digits = rest[1:]
+    if digits.strip('0123456789abcdefABCDEF') != '':
+        raise ValueError(f"x/z digits are not synthesizable logic: {text}")
+    return int(digits, _BASES[rest[0].lower()]), int(width) if width else None
+
+class _Parser:
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.position = 0
+        self.parameters = {}
+        self.ranges = {}
+
+    # Token helpers ------------------------------------------------------------
+
+    def peek(self, offset=0):
+        index = self.position + offset
+        return self.tokens[index][1] if index < len(self.tokens) else None
+
+    def next(self):
+        if self.position >= len(self.tokens):
+            raise SyntaxError("unexpected end of file")
+        token = self.tokens[self.position]
+        self.position += 1
+        return token[1]
+
+    def expect(self, text):
+        line = self.tokens[min(self.position, len(self.tokens) - 1)][2]
+        token = self.next()
+        if token != text:
+            raise SyntaxError(f"line {line}: expected '{text}', found '{token}'")
+
+    def error(self, message):
+        line = self.tokens[min(self.position, len(self.tokens) - 1)][2]
+        return SyntaxError(f"line {line}: {message}")
+
+    # Declarations -------------------------------------------------------------
+
+    def module(self):
+        while self.peek() != 'module':
+            if self.peek() is None:
+                raise self.error("no module found")
+            self.next()
+        self.next()
+        name = self.next()
+        ports = []
+        if self.peek() == '(':
+            self.next()
+            while self.peek() != ')':
+                if self.peek() in ('input', 'output', 'inout'):
+                    ports += self.declaration(terminators=(',', ')'))
+                else:
+                    ports.append(self.next())
+                if self.peek() == ',':
+                    self.next()
+            self.next()
+        self.expect(';')
+        assigns, cases, skipped = [], [], 0
+        while self.peek() != 'endmodule':
+            keyword = self.peek()
+            if keyword in ('input', 'output', 'inout', 'wire', 'reg'):
+                self.declaration(terminators=(';',))
+                self.expect(';')
+            elif keyword in ('parameter', 'localparam'):
+                self.parameter()
+            elif keyword == 'assign':
+                self.next()
+                target, bit = self.lvalue()
+                self.expect('=')
+                assigns.append((target, bit, self.expression()))
+                self.expect(';')
+            elif keyword == 'always':
+                block = self.always()
+                if block is None:
+                    skipped += 1
+                else:
+                    cases += block
+            elif keyword == 'initial':
+                self.next()
+                self.skip_statement()
+                skipped += 1
+            elif keyword is None:
+                raise self.error("missing endmodule")
+            else:
+                raise self.error(f"unsupported construct '{keyword}'")
+        return Module(name, ports, dict(self.ranges), dict(self.parameters), assigns, cases, skipped)
+
+    def range(self):
+        """(msb, lsb) of an optional [msb:lsb], (0, 0) when absent"""
+        if self.peek() != '[':
+            return (0, 0)
+        self.next()
+        msb = self.constant()
+        self.expect(':')
+        lsb = self.constant()
+        self.expect(']')
+        return (msb, lsb)
+
+    def declaration(self, terminators):
+        """Names declared by 'input wire [3:0] a, b' up to a terminator"""
+        while self.peek() in ('input', 'output', 'inout', 'wire', 'reg', 'signed'):
+            self.next()
+        bits = self.range()
+        names = []
+        while True:
+            name = self.next()
+            self.ranges[name] = bits
+            names.append(name)
+            # In a port list a comma followed by a direction starts a new declaration
+            if self.peek() != ',' or self.peek(1) in ('input', 'output', 'inout'):
+                break
+            self.next()
+        if self.peek() not in terminators:
+            raise self.error(f"unexpected '{self.peek()}' in declaration")
+        return names
+
+    def parameter(self):
+        self.next()
+        self.range()
+        while True:
+            name = self.next()
+            self.expect('=')
+            self.parameters[name] = self.constant_number()
+            if self.peek() != ',':
+                break
+            self.next()
+        self.expect(';')
+
+    def constant_number(self):
+        token = self.next()
+        if token in self.parameters:
+            return self.parameters[token]
+        return parse_number(token)
+
+    def constant(self):
+        return self.constant_number()[0]
+
+    # Expressions ----------------------------------------------------------------
+
+    def expression(self, level=0):
+        if level == len(_PRECEDENCE):
+            return self.equality()
+        operator, kind = _PRECEDENCE[level]
+        operands = [self.expression(level + 1)]
+        while self.peek() == operator:
+            self.next()
+            operands.append(self.expression(level + 1))
+        return operands[0] if len(operands) == 1 else (kind, operands)
+
+    def equality(self):
+        left = self.unary()
+        while self.peek() in _EQUALITY:
+            left = (_EQUALITY[self.next()], [left, self.unary()])
+        return left
+
+    def unary(self):
+        if self.peek() == '!':
+            self.next()
+            return ('lnot', [self.unary()])
+        if self.peek() == '~':
+            self.next()
+            return ('not', [self.unary()])
+        return self.primary()
+
+    def primary(self):
+        token = self.next()
+        if token == '(':
+            expression = self.expression()
+            self.expect(')')
+            return expression
+        if token in self.parameters:
+            return ('const', self.parameters[token])
+        if token[0].isdigit() or token[0] == "'":
+            return ('const', parse_number(token))
+        if not (token[0].isalpha() or token[0] == '_'):
+            raise self.error(f"unexpected '{token}' in expression")
+        if self.peek() == '[':
+            self.next()
+            bit = self.constant()
+            if self.peek() == ':':
+                raise self.error("part selects are not supported")
+            self.expect(']')
+            return ('bit', token, bit)
+        return ('net', token)
+
+    def lvalue(self):
+        target = self.next()
+        bit = None
+        if self.peek() == '[':
+            self.next()
+            bit = self.constant()
+            self.expect(']')
+        return target, bit
+
+    # Always blocks --------------------------------------------------------------
+
+    def always(self):
+        """Case blocks of a combinational always, None for a sequential one"""
+        self.next()
+        self.expect('@')
+        sensitivity = []
+        if self.peek() == '*':
+            self.next()
+        else:
+            self.expect('(')
+            depth = 1
+            while depth:
+                token = self.next()
+                depth += (token == '(') - (token == ')')
+                sensitivity.append(token)
+        if 'posedge' in sensitivity or 'negedge' in sensitivity:
+            self.skip_statement()
+            return None
+        return self.statement()
+
+    def skip_statement(self):
+        depth = 0
+        while True:
+            token = self.next()
+            if token in ('begin', 'case'):
+                depth += 1
+            elif token in ('end', 'endcase'):
+                depth -= 1
+                if depth == 0:
+                    return
+            elif token == ';' and depth == 0:
+                return
+
+    def statement(self):
+        """Case blocks of a combinational statement"""
+        token = self.peek()
+        if token == 'begin':
+            self.next()
+            blocks = []
+            while self.peek() != 'end':
+                blocks += self.statement()
+            self.next()
+            return blocks
+        if token == 'case':
+            return [self.case()]
+        raise self.error(f"only case statements are supported in combinational blocks, found '{token}'")
+
+    def assignments(self):
+        """Blocking assignments of a case item body"""
+        if self.peek() == 'begin':
+            self.next()
+            body = []
+            while self.peek() != 'end':
+                body += self.assignments()
+            self.next()
+            return body
+        target, bit = self.lvalue()
+        if self.peek() not in ('=', '<='):
+            raise self.error(f"expected an assignment to '{target}'")
+        self.next()
+        expression = self.expression()
+        self.expect(';')
+        return [(target, bit, expression)]
+
+    def case(self):
+        self.next()
+        self.expect('(')
+        selector = self.expression()
+        self.expect(')')
+        items, default = [], None
+        while self.peek() != 'endcase':
+            if self.peek() == 'default':
+                self.next()
+                if self.peek() == ':':
+                    self.next()
+                default = self.assignments()
+                continue
+            labels = [self.expression()]
+            while self.peek() == ',':
+                self.next()
+                labels.append(self.expression())
+            self.expect(':')
+            items.append((labels, self.assignments()))
+        self.next()
+        return CaseBlock(selector, items, default)
+
+def parse(text):
+    """Module of a Verilog source string"""
+    return _Parser(tokenize(text)).module()
+
+def parse_file(path, cache_dir=CACHE_DIR, use_cache=True):
+    """Module of a Verilog file, from the parse cache when the file is unchanged"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    digest = hashlib.sha256(b'%d:' % PARSER_VERSION + data).hexdigest()
+    cache_path = os.path.join(cache_dir, digest + '.pickle')
+    if use_cache and os.path.exists(cache_path):
+        with open(cache_path, 'rb') as f:
+            fields = pickle.load(f)
+        # Stored as plain tuples so the cache loads whether this file runs as a script or a module
+        return Module(*fields[:5], [CaseBlock(*block) for block in fields[5]], fields[6])
+    module = parse(data.decode())
+    if use_cache:
+        os.makedirs(cache_dir, exist_ok=True)
+        temporary = cache_path + f'.{os.getpid()}.tmp'
+        fields = tuple(module[:5]) + ([tuple(block) for block in module.cases], module.skipped)
+        with open(temporary, 'wb') as f:
+            pickle.dump(fields, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary, cache_path)
+    return module
+
+# Logic extraction ---------------------------------------------------------------
+
+class LogicExtractor:
+    """Packed truth tables of the combinational logic of a parsed module
+
+    Nets driven by an assign or a case block are expanded in place, so
+    every function is expressed over undriven nets only (inputs and
+    registers).  Variables follow the declared port order, most
+    significant bit first, with internal nets after the ports in order of
+    first use, so minterm numbers line up with the hand-written lists.
+    """
+
+    def __init__(self, module):
+        self.module = module
+        # net -> {bit: ('assign', expr, expr bit) | ('case', block)}
+        self.drivers = {}
+        for target, bit, expression in module.assigns:
+            if bit is None:
+                for index in range(self.width(target)):
+                    self._drive(target, index, ('assign', expression, index))
+            else:
+                self._drive(target, bit - self.lsb(target), ('assign', expression, 0))
+        for block in module.cases:
+            targets = {(t, b) for _, body in block.items for t, b, _ in body}
+            targets |= {(t, b) for t, b, _ in block.default or []}
+            for target, bit in targets:
+                bits = range(self.width(target)) if bit is None else [bit - self.lsb(target)]
+                for index in bits:
+                    self._drive(target, index, ('case', block))
+
+    def _drive(self, net, bit, driver):
+        if bit in self.drivers.setdefault(net, {}):
+            raise ValueError(f"{net}[{bit}] has more than one driver")
+        self.drivers[net][bit] = driver
+
+    def width(self, net):
+        msb, lsb = self.module.ranges.get(net, (0, 0))
+        return abs(msb - lsb) + 1
+
+    def lsb(self, net):
+        return min(self.module.ranges.get(net, (0, 0)))
+
+    # Support ----------------------------------------------------------------------
+
+    def _nets(self, expression, found):
+        kind = expression[0]
+        if kind in ('net', 'bit'):
+            found.append(expression[1])
+        elif kind != 'const':
+            for operand in expression[1]:
+                self._nets(operand, found)
+
+    def support(self, net, bit, visiting=()):
+        """Undriven nets the given bit depends on, in order of first use"""
+        if (net, bit) in visiting:
+            raise ValueError(f"combinational loop through {net}[{bit}]")
+        driver = self.drivers[net][bit]
+        expressions = []
+        if driver[0] == 'assign':
+            expressions.append(driver[1])
+        else:
+            block = driver[1]
+            expressions.append(block.selector)
+            for labels, body in block.items:
+                expressions += labels + [e for t, _, e in body if t == net]
+            expressions += [e for t, _, e in block.default or [] if t == net]
+        found = []
+        for expression in expressions:
+            self._nets(expression, found)
+        result = []
+        for name in found:
+            if name in self.drivers:
+                for index in self.drivers[name]:
+                    result += self.support(name, index, visiting + ((net, bit),))
+            else:
+                result.append(name)
+        return list(dict.fromkeys(result))
+
+    def declared_order(self, nets):
+        """Nets sorted by port position, non-ports after them in the given order"""
+        ports = self.module.ports
+        rank = {net: ports.index(net) if net in ports else len(ports) + i for i, net in enumerate(nets)}
+        return sorted(nets, key=rank.get)
+
+    # Symbolic evaluation ------------------------------------------------------------
+
+    def _variables(self, inputs):
+        names, planes, index = [], {}, 0
+        num_vars = sum(self.width(net) for net in inputs)
+        for net in inputs:
+            width = self.width(net)
+            bits = []
+            for position in range(width - 1, -1, -1):
+                bits.append(variable_bits(num_vars, index))
+                names.append(f"{net}[{position + self.lsb(net)}]" if width > 1 else net)
+                index += 1
+            planes[net] = bits[::-1]  # LSB first
+        return num_vars, names, planes
+
+    def _net_bits(self, net, context):
+        planes, full, cache = context
+        if net in planes:
+            return planes[net]
+        if net not in cache:
+            bits = [0] * self.width(net)
+            for index, driver in self.drivers.get(net, {}).items():
+                if driver[0] == 'assign':
+                    value = self._evaluate(driver[1], context)
+                    bits[index] = value[driver[2]] if driver[2] < len(value) else 0
+                else:
+                    bits[index] = self._case_bit(driver[1], net, index, context)
+            cache[net] = bits
+        return cache[net]
+
+    def _evaluate(self, expression, context):
+        """Packed tables of the bits of an expression, LSB first"""
+        full = context[1]
+        kind = expression[0]
+        if kind == 'const':
+            value, width = expression[1]
+            width = width or max(1, value.bit_length())
+            return [full if (value >> i) & 1 else 0 for i in range(width)]
+        if kind == 'net':
+            return self._net_bits(expression[1], context)
+        if kind == 'bit':
+            bits = self._net_bits(expression[1], context)
+            return [bits[expression[2] - self.lsb(expression[1])]]
+        operands = [self._evaluate(operand, context) for operand in expression[1]]
+        if kind == 'lnot':
+            return [full & ~_any(operands[0])]
+        if kind == 'not':
+            return [full & ~bit for bit in operands[0]]
+        if kind in ('eq', 'ne'):
+            a, b = _extend(operands[0], operands[1])
+            equal = full
+            for x, y in zip(a, b):
+                equal &= full & ~(x ^ y)
+            return [equal if kind == 'eq' else full & ~equal]
+        if kind in ('land', 'lor'):
+            result = full if kind == 'land' else 0
+            for operand in operands:
+                result = (result & _any(operand)) if kind == 'land' else (result | _any(operand))
+            return [result]
+        result = operands[0]
+        for operand in operands[1:]:
+            a, b = _extend(result, operand)
+            if kind == 'and':
+                result = [x & y for x, y in zip(a, b)]
+            elif kind == 'or':
+                result = [x | y for x, y in zip(a, b)]
+            else:
+                result = [x ^ y for x, y in zip(a, b)]
+        return result
+
+    def _case_bit(self, block, net, index, context):
+        """One bit of a case-driven net: first matching item wins, else default"""
+        full = context[1]
+        selector = self._evaluate(block.selector, context)
+        result, unmatched = 0, full
+        for labels, body in block.items:
+            match = 0
+            for label in labels:
+                a, b = _extend(selector, self._evaluate(label, context))
+                equal = full
+                for x, y in zip(a, b):
+                    equal &= full & ~(x ^ y)
+                match |= equal
+            match &= unmatched
+            result |= match & self._assigned_bit(body, net, index, context)
+            unmatched &= ~match
+        if block.default is not None:
+            result |= unmatched & self._assigned_bit(block.default, net, index, context)
+        return result
+
+    def _assigned_bit(self, body, net, index, context):
+        for target, bit, expression in body:
+            if target != net:
+                continue
+            if bit is None:
+                value = self._evaluate(expression, context)
+                return value[index] if index < len(value) else 0
+            if bit - self.lsb(net) == index:
+                return self._evaluate(expression, context)[0]
+        return 0
+
+    def truth_table(self, net, bit=None):
+        """(TruthTable, variable names) of one driven bit (bit index as declared)"""
+        index = (bit if bit is not None else self.lsb(net)) - self.lsb(net)
+        inputs = self.declared_order(self.support(net, index))
+        num_vars, names, planes = self._variables(inputs)
+        if num_vars > MAX_SUPPORT:
+            raise ValueError(f"{net}[{index}] depends on {num_vars} input bits")
+        full = (1 << (1 << num_vars)) - 1
+        bits = self._net_bits(net, (planes, full, {}))
+        return TruthTable(num_vars, bits[index]), names
+
+    def functions(self):
+        """{output bit label: (TruthTable, variable names)} for every driven bit"""
+        result = {}
+        for net, bits in self.drivers.items():
+            for index in sorted(bits, reverse=True):
+                label = f"{net}[{index + self.lsb(net)}]" if self.width(net) > 1 else net
+                result[label] = self.truth_table(net, index + self.lsb(net))
+        return result
+
+def _any(bits):
+    result = 0
+    for bit in bits:
+        result |= bit
+    return result
+
+def _extend(a, b):
+    """Zero-extend two LSB-first bit lists to a common width"""
+    width = max(len(a), len(b))
+    return a + [0] * (width - len(a)), b + [0] * (width - len(b))
+
+# Drift check against the Python model -------------------------------------------------
+
+def reference_table(label, names):
+    """TruthTable of the same bit from the Python side, None if the support differs
+
+    Next-state outputs are checked against boolean_minimizer's
+    NEXT_STATE_FUNCTIONS, the decoded outputs and t_ff against hdl_model.
+    """
+    if label.upper() in NEXT_STATE_FUNCTIONS and names == variable_names(INPUT_PORTS):
+        return TruthTable.from_minterms(len(names), NEXT_STATE_FUNCTIONS[label.upper()])
+    net, _, bit = label.partition('[')
+    bit = int(bit.rstrip(']')) if bit else 0
+    state_bits = ['state[3]', 'state[2]', 'state[1]', 'state[0]']
+    ports = [name for name, _ in OUTPUT_PORTS]
+    if net == 't_ff' and sorted(names) == sorted(state_bits + ['started']):
+        model = lambda state, started: t_flip_flop_inputs(state, started)
+    elif net in ports and sorted(names) == sorted(state_bits):
+        model = lambda state, started: STATE_DECODE.get(state, DEFAULT_DECODE)[ports.index(net)]
+    else:
+        return None
+    num_vars = len(names)
+    on = 0
+    for minterm in range(1 << num_vars):
+        values = {name: (minterm >> (num_vars - 1 - i)) & 1 for i, name in enumerate(names)}
+        state = sum(values[name] << (3 - i) for i, name in enumerate(state_bits))
+        if (model(state, values.get('started', 0)) >> bit) & 1:
+            on |= 1 << minterm
+    return TruthTable(num_vars, on)
+
+def format_cover(cover, names):
+    """Sum of products with multi-character net names kept readable"""
+    if not cover:
+        return '0'
+    terms = []
+    for value, mask in cover:
+        literals = []
+        for index, name in enumerate(names):
+            position = len(names) - 1 - index
+            if not (mask >> position) & 1:
+                literals.append(name if (value >> position) & 1 else f"~{name}")
+        terms.append('&'.join(literals) or '1')
+    return ' | '.join(terms)
+
+def main():
+    parser = argparse.ArgumentParser(description="Extract combinational logic from Verilog sources as truth tables")
+    parser.add_argument('sources', nargs='*', default=DEFAULT_SOURCES)
+    parser.add_argument('--no-cache', action='store_true', help="always re-parse")
+    parser.add_argument('--minimize', action='store_true', help="print a minimized expression per bit")
+    args = parser.parse_args()
+
+    failed = False
+    for path in args.sources:
+        module = parse_file(path, use_cache=not args.no_cache)
+        extractor = LogicExtractor(module)
+        print(f"VERILOG LOGIC EXTRACTION: {os.path.relpath(path)}")
+        print("=" * 60)
+        print(f"Module {module.name}: {len(module.parameters)} parameters, {len(module.assigns)} assigns, "
+              f"{len(module.cases)} case blocks, {module.skipped} sequential blocks skipped")
+        drift, unchecked = [], 0
+        functions = extractor.functions()
+        for label, (table, names) in functions.items():
+            print(f"\n{label} = f({', '.join(names)})")
+            print(f"  Σm{table.minterms()}")
+            if args.minimize:
+                cover = minimize(table, num_vars=table.num_vars)
+                print(f"  Minimized: {format_cover(cover, names)}")
+            reference = reference_table(label, names)
+            if reference is None:
+                print("  Python model: not comparable (different inputs)")
+                unchecked += 1
+            elif reference == table:
+                print("  Python model: match")
+            else:
+                differ = (reference.on_bits ^ table.on_bits).bit_count()
+                print(f"  Python model: DIFFERS on {differ} minterms")
+                drift.append(label)
+        checked = len(functions) - unchecked
+        if drift:
+            summary = ', '.join(drift)
+        else:
+            summary = f"none in {checked} bits" if checked else "nothing compared"
+        if unchecked:
+            summary += f", not checked ({unchecked} bit{'s' if unchecked != 1 else ''})"
+        print(f"\nDrift against the Python model: {summary}\n")
+        failed = failed or bool(drift)
+    if failed:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+
+# Optimized Verilog and self-checking testbench generator
+# Minimizes each next-state function and emits a synthesizable module with
+# one `assign` per output bit, plus a testbench that applies all 2^n input
+# vectors and compares against the original Σm lists.  Files are only
+# rewritten when their generated text changes (i.e. when a minimized cover
+# changes), so file timestamps stay put and downstream simulation and
+# timing runs can be skipped when nothing changed.
+
+import argparse
+import hashlib
+import os
+
+from boolean_minimizer import (NEXT_STATE_FUNCTIONS, minimize, cover_statistics,
+                               cover_to_expression, illegal_puzzle_inputs)
+
+# Ports the M1 M0 C1 C0 D variables come from, most significant first
+INPUT_PORTS = [('missionary_curr', 2), ('cannibal_curr', 2), ('direction', 1)]
+OUTPUT_DIR = os.path.join(os.path.dirname(__file__), '..', 'HDL_Code')
+MODULE_NAME = 'missionary_cannibal_next_state'
+
+def variable_names(input_ports):
+    """Verilog bit references of the input variables, most significant first"""
+    names = []
+    for port, width in input_ports:
+        names += [f"{port}[{bit}]" for bit in range(width - 1, -1, -1)] if width > 1 else [port]
+    return names
+
+def output_ports(functions):
+    """(port, width) of the outputs named like 'MISSIONARY_NEXT[1]', in first-use order"""
+    widths = {}
+    for name in functions:
+        port, _, bit = name.partition('[')
+        bit = int(bit.rstrip(']')) if bit else 0
+        widths[port.lower()] = max(widths.get(port.lower(), 0), bit + 1)
+    return list(widths.items())
+
+def verilog_sop(cover, names):
+    """Verilog expression of a cover over the given bit references"""
+    if not cover:
+        return "1'b0"
+    terms = []
+    for value, mask in sorted(cover):
+        literals = []
+        for index, name in enumerate(names):
+            position = len(names) - 1 - index
+            if not (mask >> position) & 1:
+                literals.append(name if (value >> position) & 1 else f"~{name}")
+        if not literals:
+            return "1'b1"
+        terms.append(literals[0] if len(literals) == 1 else f"({' & '.join(literals)})")
+    return ' |\n        '.join(terms)
+
+def minimize_functions(functions, num_vars=5, dont_cares=()):
+    """{output: sorted cover} of every function"""
+    return {name: sorted(minimize(minterms, num_vars=num_vars, dont_cares=dont_cares))
+            for name, minterms in functions.items()}
+
+def cover_signature(covers, dont_cares=()):
+    """Short hash identifying a set of covers and the don't cares they assumed"""
+    text = repr(sorted(covers.items())) + repr(sorted(dont_cares))
+    return hashlib.sha256(text.encode()).hexdigest()[:16]
+
+def generate_module(covers, input_ports=INPUT_PORTS, module_name=MODULE_NAME, dont_cares=()):
+    """Source text of the optimized combinational module"""
+    names = variable_names(input_ports)
+    num_vars = len(names)
+    ports = [f"    input wire {'[%d:0] ' % (w - 1) if w > 1 else ''}{port}" for port, w in input_ports]
+    ports += [f"    output wire {'[%d:0] ' % (w - 1) if w > 1 else ''}{port}" for port, w in output_ports(covers)]
+    lines = [
+        "// Optimized next-state logic for the Missionaries and Cannibals puzzle",
+        "// Generated by Analysis_Scripts/verilog_generator.py - do not edit by hand",
+        f"// Cover signature: {cover_signature(covers, dont_cares)}",
+        "",
+        f"module {module_name} (",
+        ',\n'.join(ports),
+        ");",
+        "",
+    ]
+    short = ['M1', 'M0', 'C1', 'C0', 'D'] if num_vars == 5 else names
+    for name, cover in covers.items():
+        stats = cover_statistics(cover, num_vars)
+        port, _, bit = name.partition('[')
+        target = f"{port.lower()}[{bit}" if bit else port.lower()
+        lines.append(f"// {name} = {cover_to_expression(cover, num_vars, short)}")
+        lines.append(f"// {stats['terms']} terms, {stats['literals']} literals, depth {stats['depth']}")
+        lines.append(f"assign {target} =")
+        lines.append(f"        {verilog_sop(cover, names)};")
+        lines.append("")
+    lines.append("endmodule")
+    return '\n'.join(lines) + '\n'
+
+def generate_testbench(functions, covers, input_ports=INPUT_PORTS, module_name=MODULE_NAME, dont_cares=()):
+    """Source text of a testbench checking all input vectors against the original Σm"""
+    names = variable_names(input_ports)
+    num_vars = len(names)
+    vectors = 1 << num_vars
+    care = ((1 << vectors) - 1) & ~sum(1 << m for m in set(dont_cares))
+    outputs = output_ports(covers)
+    hex_digits = (vectors + 3) // 4
+    lines = [
+        f"// Exhaustive self-checking testbench for {module_name}",
+        "// Generated by Analysis_Scripts/verilog_generator.py - do not edit by hand",
+        f"// Cover signature: {cover_signature(covers, dont_cares)}",
+        "",
+        "`timescale 1ns/1ps",
+        "",
+        f"module tb_{module_name};",
+        "",
+    ]
+    for port, width in input_ports + outputs:
+        kind = 'reg' if (port, width) in input_ports else 'wire'
+        lines.append(f"{kind} {'[%d:0] ' % (width - 1) if width > 1 else ''}{port};")
+    lines += ["", "// Original minterm lists: bit i is the expected output for input vector i"]
+    checks = []
+    for name, minterms in functions.items():
+        constant = name.replace('[', '_').replace(']', '') + '_ON'
+        on = sum(1 << m for m in minterms)
+        lines.append(f"localparam [{vectors - 1}:0] {constant} = {vectors}'h{on:0{hex_digits}x};")
+        port, _, bit = name.partition('[')
+        checks.append((name, constant, f"{port.lower()}[{bit}" if bit else port.lower()))
+    lines.append(f"localparam [{vectors - 1}:0] CARE = {vectors}'h{care:0{hex_digits}x};  // 0 = don't care")
+    lines += ["", f"{module_name} dut ("]
+    lines.append(',\n'.join(f"    .{port}({port})" for port, _ in input_ports + outputs))
+    lines += [");", "", "integer vector;", "integer errors;", "", "initial begin", "    errors = 0;",
+              f"    for (vector = 0; vector < {vectors}; vector = vector + 1) begin",
+              f"        {{{', '.join(port for port, _ in input_ports)}}} = vector;",
+              "        #1;",
+              "        if (CARE[vector]) begin"]
+    for name, constant, target in checks:
+        lines += [f"            if ({target} !== {constant}[vector]) begin",
+                  f"                $display(\"FAIL {name}: vector %0d got %b expected %b\", vector, {target}, {constant}[vector]);",
+                  "                errors = errors + 1;",
+                  "            end"]
+    lines += ["        end", "    end",
+              "    if (errors == 0)",
+              f"        $display(\"PASS: all {care.bit_count()} care vectors match the original functions\");",
+              "    else",
+              "        $display(\"FAILED: %0d mismatches\", errors);",
+              "    $finish;", "end", "", "endmodule"]
+    return '\n'.join(lines) + '\n'
+
+def write_if_changed(path, text):
+    """Write text to path unless the file already holds it; True if written"""
+    if os.path.exists(path):
+        with open(path) as f:
+            if f.read() == text:
+                return False
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    temporary = path + '.tmp'
+    with open(temporary, 'w') as f:
+        f.write(text)
+    os.replace(temporary, path)
+    return True
+
+def check_covers(functions, covers, num_vars=5, dont_cares=()):
+    """Names of functions whose cover differs from the Σm list on a care minterm"""
+    care = set(range(1 << num_vars)) - set(dont_cares)
+    wrong = []
+    for name, minterms in functions.items():
+        covered = set()
+        for value, mask in covers[name]:
+            covered |= {m for m in range(1 << num_vars) if (m & ~mask) == (value & ~mask)}
+        if (covered & care) != (set(minterms) & care):
+            wrong.append(name)
+    return wrong
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate optimized Verilog and a self-checking testbench")
+    parser.add_argument('--output-dir', default=OUTPUT_DIR)
+    parser.add_argument('--module', default=MODULE_NAME)
+    parser.add_argument('--dont-cares', action='store_true',
+                        help="treat unsafe puzzle inputs as don't cares (the testbench skips them)")
+    args = parser.parse_args()
+
+    dont_cares = illegal_puzzle_inputs() if args.dont_cares else ()
+    covers = minimize_functions(NEXT_STATE_FUNCTIONS, dont_cares=dont_cares)
+    wrong = check_covers(NEXT_STATE_FUNCTIONS, covers, dont_cares=dont_cares)
+    if wrong:
+        raise SystemExit(f"Minimized covers disagree with the Σm lists: {', '.join(wrong)}")
+
+    module_path = os.path.join(args.output_dir, f"{args.module}.v")
+    testbench_path = os.path.join(args.output_dir, f"tb_{args.module}.v")
+    files = [(module_path, generate_module(covers, module_name=args.module, dont_cares=dont_cares)),
+             (testbench_path, generate_testbench(NEXT_STATE_FUNCTIONS, covers, module_name=args.module,
+                                                 dont_cares=dont_cares))]
+
+    print("VERILOG GENERATION")
+    print("=" * 60)
+    print(f"Cover signature: {cover_signature(covers, dont_cares)}"
+          f"{' (unsafe inputs as dont cares)' if dont_cares else ''}")
+    for name, cover in covers.items():
+        stats = cover_statistics(cover)
+        print(f"  {name}: {stats['terms']} terms, {stats['literals']} literals")
+    for path, text in files:
+        status = "written" if write_if_changed(path, text) else "unchanged, skipped"
+        print(f"{os.path.relpath(path)}: {status}")
+
+if __name__ == "__main__":
+    main()
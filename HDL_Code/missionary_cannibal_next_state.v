@@ -0,0 +1,53 @@
+// Optimized next-state logic for the Missionaries and Cannibals puzzle
+// Generated by Analysis_Scripts/verilog_generator.py - do not edit by hand
+// Cover signature: 23c716864f419881
+
+module missionary_cannibal_next_state (
+    input wire [1:0] missionary_curr,
+    input wire [1:0] cannibal_curr,
+    input wire direction,
+    output wire [1:0] missionary_next,
+    output wire [1:0] cannibal_next
+);
+
+// MISSIONARY_NEXT[1] = C1'C0' + M0'C1'D + C1C0D' + M1'M0 + M0C1 + M1D' + M1M0'C0
+// 7 terms, 17 literals, depth 6
+assign missionary_next[1] =
+        (~cannibal_curr[1] & ~cannibal_curr[0]) |
+        (~missionary_curr[0] & ~cannibal_curr[1] & direction) |
+        (cannibal_curr[1] & cannibal_curr[0] & ~direction) |
+        (~missionary_curr[1] & missionary_curr[0]) |
+        (missionary_curr[0] & cannibal_curr[1]) |
+        (missionary_curr[1] & ~direction) |
+        (missionary_curr[1] & ~missionary_curr[0] & cannibal_curr[0]);
+
+// MISSIONARY_NEXT[0] = C1'C0' + C1'D + C1C0D' + M0C1 + M1D' + M1C0
+// 6 terms, 13 literals, depth 6
+assign missionary_next[0] =
+        (~cannibal_curr[1] & ~cannibal_curr[0]) |
+        (~cannibal_curr[1] & direction) |
+        (cannibal_curr[1] & cannibal_curr[0] & ~direction) |
+        (missionary_curr[0] & cannibal_curr[1]) |
+        (missionary_curr[1] & ~direction) |
+        (missionary_curr[1] & cannibal_curr[0]);
+
+// CANNIBAL_NEXT[1] = M1'C1' + C1'C0'D + C0D' + C1D' + M1'M0 + M1M0'
+// 6 terms, 13 literals, depth 6
+assign cannibal_next[1] =
+        (~missionary_curr[1] & ~cannibal_curr[1]) |
+        (~cannibal_curr[1] & ~cannibal_curr[0] & direction) |
+        (cannibal_curr[0] & ~direction) |
+        (cannibal_curr[1] & ~direction) |
+        (~missionary_curr[1] & missionary_curr[0]) |
+        (missionary_curr[1] & ~missionary_curr[0]);
+
+// CANNIBAL_NEXT[0] = C1'C0' + C0D + C1D' + M1'M0C0' + M1M0'C1'
+// 5 terms, 12 literals, depth 6
+assign cannibal_next[0] =
+        (~cannibal_curr[1] & ~cannibal_curr[0]) |
+        (cannibal_curr[0] & direction) |
+        (cannibal_curr[1] & ~direction) |
+        (~missionary_curr[1] & missionary_curr[0] & ~cannibal_curr[0]) |
+        (missionary_curr[1] & ~missionary_curr[0] & ~cannibal_curr[1]);
+
+endmodule
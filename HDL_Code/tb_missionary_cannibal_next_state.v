@@ -0,0 +1,64 @@
+// Exhaustive self-checking testbench for missionary_cannibal_next_state
+// Generated by Analysis_Scripts/verilog_generator.py - do not edit by hand
+// Cover signature: 23c716864f419881
+
+`timescale 1ns/1ps
+
+module tb_missionary_cannibal_next_state;
+
+reg [1:0] missionary_curr;
+reg [1:0] cannibal_curr;
+reg direction;
+wire [1:0] missionary_next;
+wire [1:0] cannibal_next;
+
+// Original minterm lists: bit i is the expected output for input vector i
+localparam [31:0] MISSIONARY_NEXT_1_ON = 32'hf7dfff4b;
+localparam [31:0] MISSIONARY_NEXT_0_ON = 32'hffdffb4b;
+localparam [31:0] CANNIBAL_NEXT_1_ON = 32'h56ffff5f;
+localparam [31:0] CANNIBAL_NEXT_0_ON = 32'hdbdffbdb;
+localparam [31:0] CARE = 32'hffffffff;  // 0 = don't care
+
+missionary_cannibal_next_state dut (
+    .missionary_curr(missionary_curr),
+    .cannibal_curr(cannibal_curr),
+    .direction(direction),
+    .missionary_next(missionary_next),
+    .cannibal_next(cannibal_next)
+);
+
+integer vector;
+integer errors;
+
+initial begin
+    errors = 0;
+    for (vector = 0; vector < 32; vector = vector + 1) begin
+        {missionary_curr, cannibal_curr, direction} = vector;
+        #1;
+        if (CARE[vector]) begin
+            if (missionary_next[1] !== MISSIONARY_NEXT_1_ON[vector]) begin
+                $display("FAIL MISSIONARY_NEXT[1]: vector %0d got %b expected %b", vector, missionary_next[1], MISSIONARY_NEXT_1_ON[vector]);
+                errors = errors + 1;
+            end
+            if (missionary_next[0] !== MISSIONARY_NEXT_0_ON[vector]) begin
+                $display("FAIL MISSIONARY_NEXT[0]: vector %0d got %b expected %b", vector, missionary_next[0], MISSIONARY_NEXT_0_ON[vector]);
+                errors = errors + 1;
+            end
+            if (cannibal_next[1] !== CANNIBAL_NEXT_1_ON[vector]) begin
+                $display("FAIL CANNIBAL_NEXT[1]: vector %0d got %b expected %b", vector, cannibal_next[1], CANNIBAL_NEXT_1_ON[vector]);
+                errors = errors + 1;
+            end
+            if (cannibal_next[0] !== CANNIBAL_NEXT_0_ON[vector]) begin
+                $display("FAIL CANNIBAL_NEXT[0]: vector %0d got %b expected %b", vector, cannibal_next[0], CANNIBAL_NEXT_0_ON[vector]);
+                errors = errors + 1;
+            end
+        end
+    end
+    if (errors == 0)
+        $display("PASS: all 32 care vectors match the original functions");
+    else
+        $display("FAILED: %0d mismatches", errors);
+    $finish;
+end
+
+endmodule